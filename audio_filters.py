@@ -0,0 +1,137 @@
+"""
+Filter bank shared by the audio generator scripts.
+
+Every filter runs through scipy.signal.lfilter / sosfilt and keeps its state
+between process() calls, so a track can be filtered in blocks (see
+wav_stream.py) with the same result as filtering it in one go.
+
+    lp = one_pole_lowpass(6000, 22050)
+    for block in blocks:
+        out = lp.process(block)
+
+The one-shot helpers (lowpass, highpass, ...) build a fresh filter and run it
+over a whole array.
+"""
+
+import numpy as np
+from scipy.signal import butter, lfilter, sosfilt
+
+
+class Filter:
+    """Transfer function (b, a) applied block by block, with its state carried over."""
+
+    def __init__(self, b, a):
+        self.b = np.asarray(b, dtype=np.float64)
+        self.a = np.asarray(a, dtype=np.float64)
+        self.zi = np.zeros(max(len(self.a), len(self.b)) - 1)
+
+    def process(self, block):
+        """Filter the next block of samples."""
+        if len(block) == 0:
+            return np.zeros(0)  # scipy rejects empty input when given a state
+        out, self.zi = lfilter(self.b, self.a, block, zi=self.zi)
+        return out
+
+    def reset(self):
+        """Forget past input, as if the next block started the signal."""
+        self.zi[:] = 0.0
+
+
+class SosFilter:
+    """Cascade of biquad sections (scipy 'sos' layout) applied block by block."""
+
+    def __init__(self, sos):
+        self.sos = np.atleast_2d(np.asarray(sos, dtype=np.float64))
+        self.zi = np.zeros((len(self.sos), 2))
+
+    def process(self, block):
+        """Filter the next block of samples."""
+        if len(block) == 0:
+            return np.zeros(0)  # scipy rejects empty input when given a state
+        out, self.zi = sosfilt(self.sos, block, zi=self.zi)
+        return out
+
+    def reset(self):
+        """Forget past input, as if the next block started the signal."""
+        self.zi[:] = 0.0
+
+
+# ── One-pole (RC) filters ────────────────────────────────────────
+
+def _rc_alpha(cutoff_freq, sample_rate):
+    rc = 1.0 / (2.0 * np.pi * cutoff_freq)
+    dt = 1.0 / sample_rate
+    return rc, dt
+
+def one_pole_lowpass(cutoff_freq, sample_rate):
+    """RC low-pass: y += alpha * (x - y)."""
+    rc, dt = _rc_alpha(cutoff_freq, sample_rate)
+    alpha = dt / (rc + dt)
+    return Filter([alpha], [1.0, alpha - 1.0])
+
+def one_pole_highpass(cutoff_freq, sample_rate):
+    """RC high-pass: y = a * (y + x - x_prev)."""
+    rc, dt = _rc_alpha(cutoff_freq, sample_rate)
+    a = rc / (rc + dt)
+    return Filter([a, -a], [1.0, -a])
+
+def dc_blocker(pole=0.995):
+    """Remove DC offset: y = x - x_prev + pole * y_prev."""
+    return Filter([1.0, -1.0], [1.0, -pole])
+
+
+# ── Biquads (RBJ audio EQ cookbook) ──────────────────────────────
+
+def _biquad(b, a):
+    b = np.asarray(b, dtype=np.float64) / a[0]
+    a = np.asarray(a, dtype=np.float64) / a[0]
+    return SosFilter([np.concatenate([b, a])])
+
+def _biquad_terms(freq, sample_rate, q):
+    w0 = 2.0 * np.pi * freq / sample_rate
+    return np.cos(w0), np.sin(w0) / (2.0 * q)
+
+def biquad_lowpass(cutoff_freq, sample_rate, q=np.sqrt(0.5)):
+    """Second-order low-pass (Butterworth at the default q)."""
+    cos_w0, alpha = _biquad_terms(cutoff_freq, sample_rate, q)
+    return _biquad([(1 - cos_w0) / 2, 1 - cos_w0, (1 - cos_w0) / 2],
+                   [1 + alpha, -2 * cos_w0, 1 - alpha])
+
+def biquad_highpass(cutoff_freq, sample_rate, q=np.sqrt(0.5)):
+    """Second-order high-pass (Butterworth at the default q)."""
+    cos_w0, alpha = _biquad_terms(cutoff_freq, sample_rate, q)
+    return _biquad([(1 + cos_w0) / 2, -(1 + cos_w0), (1 + cos_w0) / 2],
+                   [1 + alpha, -2 * cos_w0, 1 - alpha])
+
+def biquad_bandpass(center_freq, sample_rate, q=1.0):
+    """Second-order band-pass with 0 dB peak gain at center_freq."""
+    cos_w0, alpha = _biquad_terms(center_freq, sample_rate, q)
+    return _biquad([alpha, 0.0, -alpha],
+                   [1 + alpha, -2 * cos_w0, 1 - alpha])
+
+def butterworth(kind, cutoff_freq, sample_rate, order=4):
+    """Steeper Butterworth filter as a biquad cascade; kind is 'lowpass', 'highpass' or 'bandpass'
+    (cutoff_freq is then a (low, high) pair)."""
+    return SosFilter(butter(order, cutoff_freq, btype=kind, fs=sample_rate, output='sos'))
+
+
+# ── Waveshaping ──────────────────────────────────────────────────
+
+def soft_clip(samples, drive=1.0):
+    """tanh saturation; drive > 1 pushes more of the signal into the knee."""
+    return np.tanh(np.asarray(samples) * drive)
+
+
+# ── One-shot helpers over whole arrays ───────────────────────────
+
+def lowpass(samples, cutoff_freq, sample_rate):
+    """One-pole low-pass over a whole array."""
+    return one_pole_lowpass(cutoff_freq, sample_rate).process(samples)
+
+def highpass(samples, cutoff_freq, sample_rate):
+    """One-pole high-pass over a whole array."""
+    return one_pole_highpass(cutoff_freq, sample_rate).process(samples)
+
+def bandpass(samples, center_freq, sample_rate, q=1.0):
+    """Biquad band-pass over a whole array."""
+    return biquad_bandpass(center_freq, sample_rate, q).process(samples)
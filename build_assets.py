@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Build the procedurally generated audio assets in parallel.
+
+Every generator script exposes an ASSET_TARGETS dict of
+name -> (output path relative to the repo root, generate function); this
+runner collects them as "<group>/<name>" targets and spreads them over a
+process pool.
+
+Builds are incremental: each output is fingerprinted from its generator's
+source (the script plus the local modules it uses), the target and the random
+seed, and recorded in assets/audio/.asset_manifest.json. An output whose
+fingerprint matches the manifest is skipped, and a regenerated file whose bytes
+did not change keeps its old modification time, so convert_audio_to_ogg.py
+does not re-encode it either.
+
+Usage:
+    python build_assets.py                      # build whatever is out of date
+    python build_assets.py --list               # show the available targets
+    python build_assets.py music/boss_theme     # one target
+    python build_assets.py 'sounds/*' 'sfx/*'   # globs (quote them for the shell)
+    python build_assets.py --force 'audio/ambient_*'
+
+Targets that write the same file (gen_sfx.py overrides some of
+generate_sounds.py's effects) run one after another in the same job, in the
+order below, so the last generator still wins as it did when the scripts were
+run by hand.
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import random
+import sys
+import time
+import traceback
+import types
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST_PATH = ROOT / "assets" / "audio" / ".asset_manifest.json"
+# Bump to invalidate every cached output (e.g. when this runner changes how it builds)
+CACHE_VERSION = 1
+
+# Target group -> generator script, in the order the scripts used to be run
+GENERATOR_SCRIPTS = {
+    "audio": "generate_audio_assets.py",
+    "kamikaze": "generate_kamikaze_sounds.py",
+    "sounds": "toolshed/generate_sounds.py",
+    "music": "toolshed/generate_music.py",
+    "sfx": "toolshed/gen_sfx.py",
+    "metal": "toolshed/generate_metal_sound.py",
+}
+
+_modules = {}
+
+
+def load_generator(group):
+    """Import one generator script by path (cached per process)"""
+    if group not in _modules:
+        # Headless: nothing here should need a real audio device
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        spec = importlib.util.spec_from_file_location(f"asset_generator_{group}", ROOT / GENERATOR_SCRIPTS[group])
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[group] = module
+    return _modules[group]
+
+
+def local_sources(module):
+    """Repo-relative paths of the module's script and the repo modules it uses"""
+    sources = {Path(module.__file__).resolve()}
+    for value in vars(module).values():
+        name = value.__name__ if isinstance(value, types.ModuleType) else getattr(value, "__module__", None)
+        path = getattr(sys.modules.get(name), "__file__", None) if isinstance(name, str) else None
+        if path and ROOT in Path(path).resolve().parents and "site-packages" not in path:
+            sources.add(Path(path).resolve())
+    return sorted(str(path.relative_to(ROOT)) for path in sources)
+
+
+def hash_sources(sources):
+    """Content hash of a list of repo-relative files (None if one is missing)"""
+    digest = hashlib.sha256()
+    for source in sources:
+        try:
+            digest.update(source.encode() + b"\0" + (ROOT / source).read_bytes() + b"\0")
+        except OSError:
+            return None
+    return digest.hexdigest()
+
+
+def load_manifest():
+    """Previous build's manifest, or an empty one"""
+    try:
+        with open(MANIFEST_PATH, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != CACHE_VERSION:
+        manifest = {"version": CACHE_VERSION}
+    manifest.setdefault("generators", {})
+    manifest.setdefault("outputs", {})
+    return manifest
+
+
+def save_manifest(manifest):
+    """Write the manifest atomically"""
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = MANIFEST_PATH.with_suffix(".tmp")
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, MANIFEST_PATH)
+
+
+def discover(manifest):
+    """All targets as {"group/name": output path}, in build order, plus {group: source hash}
+
+    A generator whose sources hash the same as last time is not imported; its
+    target list comes from the manifest, which keeps a no-op build fast.
+    """
+    targets = {}
+    source_hashes = {}
+    for group in GENERATOR_SCRIPTS:
+        entry = manifest["generators"].get(group)
+        source_hash = hash_sources(entry["sources"]) if entry else None
+        if source_hash is None or source_hash != entry["source_hash"]:
+            # Some generators print progress while they are imported
+            with contextlib.redirect_stdout(io.StringIO()):
+                module = load_generator(group)
+            sources = local_sources(module)
+            entry = {
+                "sources": sources,
+                "source_hash": hash_sources(sources),
+                "targets": {name: output for name, (output, _) in module.ASSET_TARGETS.items()},
+            }
+            manifest["generators"][group] = entry
+        source_hashes[group] = entry["source_hash"]
+        for name, output in entry["targets"].items():
+            targets[f"{group}/{name}"] = output
+    return targets, source_hashes
+
+
+def select(targets, patterns):
+    """Targets matching any of the names or glob patterns (all when none are given)"""
+    if not patterns:
+        return list(targets), []
+    selected = [target for target in targets if any(fnmatch.fnmatchcase(target, p) for p in patterns)]
+    unmatched = [p for p in patterns if not any(fnmatch.fnmatchcase(target, p) for target in targets)]
+    return selected, unmatched
+
+
+def target_seed(seed, target):
+    """Stable 32-bit seed for one target of a build"""
+    return (seed ^ zlib.crc32(target.encode("utf-8"))) & 0xFFFFFFFF
+
+
+def fingerprint(job, targets, source_hashes, seed):
+    """Hash of everything that decides a job's output file"""
+    digest = hashlib.sha256(f"v{CACHE_VERSION}\0{targets[job[0]]}\0{seed}".encode())
+    for target in job:
+        group = target.split("/", 1)[0]
+        digest.update(f"\0{target}\0{source_hashes[group]}".encode())
+    return digest.hexdigest()
+
+
+def file_state(path):
+    """(size, mtime_ns) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def file_digest(path):
+    """sha256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def is_fresh(manifest, output, job_fingerprint):
+    """Output exists untouched since the manifest recorded it with this fingerprint"""
+    entry = manifest["outputs"].get(output)
+    return (entry is not None and entry["fingerprint"] == job_fingerprint
+            and file_state(ROOT / output) == (entry["size"], entry["mtime_ns"]))
+
+
+def record_output(manifest, output, job_fingerprint, previous_state):
+    """Store a rebuilt output; identical bytes get their previous mtime back"""
+    path = ROOT / output
+    digest = file_digest(path)
+    entry = manifest["outputs"].get(output)
+    if entry and previous_state and entry.get("sha256") == digest and previous_state[0] == file_state(path)[0]:
+        os.utime(path, ns=(previous_state[1], previous_state[1]))
+    size, mtime_ns = file_state(path)
+    manifest["outputs"][output] = {"fingerprint": job_fingerprint, "sha256": digest,
+                                   "size": size, "mtime_ns": mtime_ns}
+
+
+def _init_worker():
+    """Generators write paths relative to the repo root"""
+    os.chdir(ROOT)
+
+
+def build_job(targets, seed):
+    """Run targets one after another; returns [(target, seconds, error or None, captured output)]"""
+    results = []
+    for target in targets:
+        group, name = target.split("/", 1)
+        output = io.StringIO()
+        error = None
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(output):
+                module = load_generator(group)
+                # Generators draw from the global random and NumPy streams, or own one behind reseed()
+                value = target_seed(seed, target)
+                random.seed(value)
+                if "numpy" in sys.modules:
+                    sys.modules["numpy"].random.seed(value)
+                if hasattr(module, "reseed"):
+                    module.reseed(value)
+                _, generate = module.ASSET_TARGETS[name]
+                generate()
+        except Exception:
+            error = traceback.format_exc()
+        results.append((target, time.perf_counter() - start, error, output.getvalue()))
+    return results
+
+
+def plan_jobs(selected, targets):
+    """Group the selected targets so that those sharing an output file share a job"""
+    jobs = {}
+    for target in selected:
+        jobs.setdefault(targets[target], []).append(target)
+    return list(jobs.values())
+
+
+def run_jobs(jobs, workers, seed):
+    """Build every job, in parallel when workers > 1; returns {job index: results}"""
+    results = {}
+    if workers <= 1:
+        _init_worker()
+        for i, job in enumerate(jobs):
+            results[i] = build_job(job, seed)
+        return results
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(build_job, job, seed): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+def print_report(results, targets, wall_time, verbose=False):
+    """Per-target timing table, slowest first"""
+    width = max(len(target) for target, *_ in results)
+    print(f"\n{'target':<{width}}  {'seconds':>8}  status  output")
+    for target, seconds, error, output in sorted(results, key=lambda r: r[1], reverse=True):
+        status = "FAIL" if error else "ok"
+        print(f"{target:<{width}}  {seconds:8.2f}  {status:<6}  {targets[target]}")
+    busy = sum(seconds for _, seconds, _, _ in results)
+    print(f"\n{len(results)} target(s) in {wall_time:.2f}s wall, {busy:.2f}s of generator time")
+
+    for target, _, error, output in results:
+        if error:
+            print(f"\n--- {target} failed ---\n{output}{error}", end="")
+        elif verbose and output:
+            print(f"\n--- {target} ---\n{output}", end="")
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Build the generated audio assets")
+    parser.add_argument("targets", nargs="*", metavar="TARGET",
+                        help="Target names or glob patterns such as 'music/*' (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: %(default)s, the CPU count)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Base random seed; each target derives its own (default: %(default)s)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the manifest says up to date")
+    parser.add_argument("--list", action="store_true", help="List the matching targets and exit")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show each generator's own output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Build the selected targets; returns the process exit code"""
+    args = parse_args(argv)
+    start = time.perf_counter()
+    manifest = load_manifest()
+    targets, source_hashes = discover(manifest)
+    selected, unmatched = select(targets, args.targets)
+    if unmatched:
+        print(f"No targets match: {', '.join(unmatched)} (see --list)")
+        return 2
+
+    if args.list:
+        for target in selected:
+            print(f"{target:<32} {targets[target]}")
+        return 0
+
+    jobs = []
+    fingerprints = []
+    for job in plan_jobs(selected, targets):
+        job_fingerprint = fingerprint(job, targets, source_hashes, args.seed)
+        if args.force or not is_fresh(manifest, targets[job[0]], job_fingerprint):
+            jobs.append(job)
+            fingerprints.append(job_fingerprint)
+    up_to_date = len(selected) - sum(len(job) for job in jobs)
+    if not jobs:
+        save_manifest(manifest)
+        print(f"All {len(selected)} target(s) up to date ({time.perf_counter() - start:.2f}s)")
+        return 0
+
+    for job in jobs:
+        if len(job) > 1:
+            print(f"Note: {', '.join(job)} all write {targets[job[0]]}; building them in order, {job[-1]} wins")
+    workers = max(1, min(args.jobs, len(jobs)))
+    print(f"Building {len(selected) - up_to_date} target(s) with {workers} worker(s), {up_to_date} up to date...")
+
+    previous_states = [file_state(ROOT / targets[job[0]]) for job in jobs]
+    job_results = run_jobs(jobs, workers, args.seed)
+    results = []
+    for i, job in enumerate(jobs):
+        results.extend(job_results[i])
+        if not any(error for _, _, error, _ in job_results[i]):
+            record_output(manifest, targets[job[0]], fingerprints[i], previous_states[i])
+    save_manifest(manifest)
+
+    print_report(results, targets, time.perf_counter() - start, args.verbose)
+    return 1 if any(error for _, _, error, _ in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
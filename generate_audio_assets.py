@@ -4,80 +4,97 @@ Generate audio assets for the game:
 2. Boss battle music (intense, faster tempo)
 3. Ambient environmental sounds (forest, cave, city loops)
 4. UI hover sound effect
+
+Every voice, chord and drum hit is rendered as a NumPy array over its time
+span and mixed into the track by slice addition. tests/test_audio_assets.py
+pins the rendered output to stored checksums.
+
+Usage:
+    python generate_audio_assets.py            # write every asset
 """
 
-import struct
-import math
-import random
+import argparse
 import os
-import wave
+import random
+
+import numpy as np
+
+import audio_filters
+from wav_stream import write_wav as stream_wav
 
 SAMPLE_RATE = 22050
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'assets', 'audio')
 
 def write_wav(filename, samples, sample_rate=SAMPLE_RATE):
-    """Write a list of float samples [-1,1] to a 16-bit WAV file."""
-    import array
+    """Write float samples [-1,1] (an array or an iterable of blocks) to a 16-bit WAV file."""
     path = os.path.join(OUTPUT_DIR, filename)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with wave.open(path, 'w') as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        int_samples = array.array('h', (int(max(-1.0, min(1.0, s)) * 32767) for s in samples))
-        wf.writeframes(int_samples.tobytes())
-    print(f"  Written: {path} ({len(samples)} samples, {len(samples)/sample_rate:.1f}s)")
+    frames = stream_wav(path, samples, sample_rate)
+    print(f"  Written: {path} ({frames} samples, {frames/sample_rate:.1f}s)")
 
 
+# Oscillators take a frequency and a time (scalar or array) in seconds
 def sine(freq, t):
-    return math.sin(2 * math.pi * freq * t)
+    return np.sin(2 * np.pi * freq * t)
 
 def square(freq, t):
-    return 1.0 if (t * freq) % 1.0 < 0.5 else -1.0
+    return np.where((t * freq) % 1.0 < 0.5, 1.0, -1.0)
 
 def saw(freq, t):
     return 2.0 * ((t * freq) % 1.0) - 1.0
 
 def triangle(freq, t):
     p = (t * freq) % 1.0
-    return 4.0 * abs(p - 0.5) - 1.0
+    return 4.0 * np.abs(p - 0.5) - 1.0
+
+# Renderers take the NumPy Generator their noise comes from; the generate_*
+# entry points pass this module stream, which reseed() restarts
+_noise_rng = np.random.default_rng()
+
+def reseed(seed):
+    """Restart the noise stream so a build is reproducible (build_assets.py calls this per target)."""
+    global _noise_rng
+    _noise_rng = np.random.default_rng(seed)
 
-def noise():
-    return random.uniform(-1, 1)
+def noise(rng, n):
+    """n samples of uniform white noise in [-1, 1] drawn from rng."""
+    return rng.uniform(-1, 1, n)
 
 def envelope_adsr(t, attack=0.01, decay=0.1, sustain=0.7, release=0.2, duration=1.0):
-    """Simple ADSR envelope."""
-    if t < attack:
-        return t / attack
-    elif t < attack + decay:
-        return 1.0 - (1.0 - sustain) * ((t - attack) / decay)
-    elif t < duration - release:
-        return sustain
-    elif t < duration:
-        return sustain * (1.0 - (t - (duration - release)) / release)
-    return 0.0
+    """Simple ADSR envelope over an array of times."""
+    return np.select(
+        [t < attack, t < attack + decay, t < duration - release, t < duration],
+        [t / attack,
+         1.0 - (1.0 - sustain) * ((t - attack) / decay),
+         sustain,
+         sustain * (1.0 - (t - (duration - release)) / release)],
+        0.0)
 
 def lowpass(samples, cutoff_freq, sample_rate=SAMPLE_RATE):
     """Simple 1-pole lowpass filter."""
-    rc = 1.0 / (2.0 * math.pi * cutoff_freq)
-    dt = 1.0 / sample_rate
-    alpha = dt / (rc + dt)
-    filtered = [0.0] * len(samples)
-    filtered[0] = samples[0] * alpha
-    for i in range(1, len(samples)):
-        filtered[i] = filtered[i-1] + alpha * (samples[i] - filtered[i-1])
-    return filtered
+    return audio_filters.lowpass(samples, cutoff_freq, sample_rate)
+
+def segment(start, length, num_samples):
+    """Sample range [start, end) of a voice, cut off at the end of the track."""
+    return start, min(start + length, num_samples)
+
+def local_time(start, end):
+    """Seconds since `start` for each sample of [start, end)."""
+    return np.arange(end - start) / SAMPLE_RATE
+
+def normalize(samples, level):
+    """Scale so the peak sits at `level`."""
+    peak = np.max(np.abs(samples)) or 1.0
+    return samples / peak * level
 
 
 # ──────────────────────────────────────────────────────────────────
 # 1. Menu Background Music — calm, ambient, mysterious
 # ──────────────────────────────────────────────────────────────────
-def generate_menu_music():
-    print("Generating menu music...")
+def render_menu_music(rng):
     duration = 32.0  # 32-second loop
     num_samples = int(duration * SAMPLE_RATE)
-    samples = [0.0] * num_samples
-    
+    samples = np.zeros(num_samples)
+
     # Slow pad chords (pulsing synth pads)
     # Dm - Am - Bb - F progression, each chord 8 seconds
     chords = [
@@ -86,33 +103,29 @@ def generate_menu_music():
         [146.83, 174.61, 233.08],  # D3, F3, Bb3 (Bb)
         [130.81, 164.81, 196.00],  # C3, E3, G3 (F)
     ]
-    
+
     chord_duration = 8.0
     for ci, chord in enumerate(chords):
-        start_sample = int(ci * chord_duration * SAMPLE_RATE)
-        end_sample = int((ci + 1) * chord_duration * SAMPLE_RATE)
-        for i in range(start_sample, min(end_sample, num_samples)):
-            t = i / SAMPLE_RATE
-            local_t = t - ci * chord_duration
-            # Slow LFO for tremolo
-            lfo = 0.5 + 0.5 * sine(0.3, t)
-            # Fade in/out for each chord
-            env = 1.0
-            if local_t < 1.0:
-                env = local_t
-            elif local_t > chord_duration - 1.5:
-                env = (chord_duration - local_t) / 1.5
-            env = max(0, min(1, env))
-            
-            val = 0.0
-            for freq in chord:
-                # Detuned sine pairs for width
-                val += sine(freq, t) * 0.12
-                val += sine(freq * 1.003, t) * 0.10
-                val += triangle(freq * 0.5, t) * 0.06
-            val *= env * lfo * 0.6
-            samples[i] += val
-    
+        start = int(ci * chord_duration * SAMPLE_RATE)
+        end = min(int((ci + 1) * chord_duration * SAMPLE_RATE), num_samples)
+        t = np.arange(start, end) / SAMPLE_RATE
+        local_t = t - ci * chord_duration
+        # Slow LFO for tremolo
+        lfo = 0.5 + 0.5 * sine(0.3, t)
+        # Fade in/out for each chord
+        env = np.where(local_t < 1.0, local_t,
+                       np.where(local_t > chord_duration - 1.5, (chord_duration - local_t) / 1.5, 1.0))
+        env = np.clip(env, 0, 1)
+
+        val = np.zeros(end - start)
+        for freq in chord:
+            # Detuned sine pairs for width
+            val += sine(freq, t) * 0.12
+            val += sine(freq * 1.003, t) * 0.10
+            val += triangle(freq * 0.5, t) * 0.06
+        val *= env * lfo * 0.6
+        samples[start:end] += val
+
     # Subtle high arpeggiated melody
     melody_notes = [
         440, 523.25, 587.33, 523.25,  # A4, C5, D5, C5
@@ -122,47 +135,43 @@ def generate_menu_music():
     ]
     note_dur = 2.0  # Each note 2 seconds
     for ni, freq in enumerate(melody_notes):
-        start_sample = int(ni * note_dur * SAMPLE_RATE)
-        end_sample = int((ni + 1) * note_dur * SAMPLE_RATE)
-        for i in range(start_sample, min(end_sample, num_samples)):
-            t = i / SAMPLE_RATE
-            local_t = t - ni * note_dur
-            env = envelope_adsr(local_t, attack=0.3, decay=0.5, sustain=0.3, release=0.8, duration=note_dur)
-            val = sine(freq, t) * 0.08 + sine(freq * 2, t) * 0.03
-            # Gentle vibrato
-            vib = sine(5.0, t) * 2.0
-            val = sine(freq + vib, t) * 0.08
-            samples[i] += val * env
-    
+        start = int(ni * note_dur * SAMPLE_RATE)
+        end = min(int((ni + 1) * note_dur * SAMPLE_RATE), num_samples)
+        t = np.arange(start, end) / SAMPLE_RATE
+        local_t = t - ni * note_dur
+        env = envelope_adsr(local_t, attack=0.3, decay=0.5, sustain=0.3, release=0.8, duration=note_dur)
+        # Gentle vibrato
+        vib = sine(5.0, t) * 2.0
+        val = sine(freq + vib, t) * 0.08
+        samples[start:end] += val * env
+
     # Sub bass drone
-    for i in range(num_samples):
-        t = i / SAMPLE_RATE
-        chord_idx = int(t / chord_duration) % 4
-        bass_freq = [73.42, 65.41, 73.42, 65.41][chord_idx]  # D2, C2
-        env = 0.5 + 0.5 * sine(0.15, t)
-        samples[i] += sine(bass_freq, t) * 0.12 * env
-    
+    t = np.arange(num_samples) / SAMPLE_RATE
+    chord_idx = (t / chord_duration).astype(int) % 4
+    bass_freq = np.array([73.42, 65.41, 73.42, 65.41])[chord_idx]  # D2, C2
+    env = 0.5 + 0.5 * sine(0.15, t)
+    samples += sine(bass_freq, t) * 0.12 * env
+
     # Apply lowpass for warmth
     samples = lowpass(samples, 3500)
-    
-    # Normalize
-    peak = max(abs(s) for s in samples) or 1.0
-    samples = [s / peak * 0.7 for s in samples]
-    
-    write_wav('music/menu_theme.wav', samples)
+
+    return normalize(samples, 0.7)
+
+def generate_menu_music():
+    print("Generating menu music...")
+    write_wav('music/menu_theme.wav', render_menu_music(_noise_rng))
 
 
 # ──────────────────────────────────────────────────────────────────
 # 2. Boss Battle Music — intense, driving, fast
 # ──────────────────────────────────────────────────────────────────
-def generate_boss_music():
-    print("Generating boss battle music...")
+def render_boss_music(rng):
     duration = 24.0  # 24-second loop
     num_samples = int(duration * SAMPLE_RATE)
-    samples = [0.0] * num_samples
+    samples = np.zeros(num_samples)
     bpm = 160
     beat_dur = 60.0 / bpm
-    
+
     # Driving bass line - E minor pentatonic aggression
     bass_pattern = [
         82.41, 82.41, 98.00, 82.41,  # E2, E2, G2, E2
@@ -170,58 +179,42 @@ def generate_boss_music():
         82.41, 82.41, 98.00, 110.0,  # E2, E2, G2, A2
         123.47, 110.0, 98.00, 82.41, # B2, A2, G2, E2
     ]
-    
+
     for bi in range(int(duration / beat_dur)):
         freq = bass_pattern[bi % len(bass_pattern)]
-        start = int(bi * beat_dur * SAMPLE_RATE)
-        note_len = int(beat_dur * 0.85 * SAMPLE_RATE)
-        for j in range(note_len):
-            if start + j >= num_samples:
-                break
-            t = j / SAMPLE_RATE
-            env = envelope_adsr(t, attack=0.005, decay=0.08, sustain=0.6, release=0.05, duration=beat_dur * 0.85)
-            # Distorted bass with harmonics
-            val = saw(freq, t + bi * beat_dur) * 0.4
-            val += square(freq, t + bi * beat_dur) * 0.2
-            val = max(-0.6, min(0.6, val * 1.8))  # Soft clip for grit
-            samples[start + j] += val * env * 0.35
-    
+        start, end = segment(int(bi * beat_dur * SAMPLE_RATE), int(beat_dur * 0.85 * SAMPLE_RATE), num_samples)
+        t = local_time(start, end)
+        env = envelope_adsr(t, attack=0.005, decay=0.08, sustain=0.6, release=0.05, duration=beat_dur * 0.85)
+        # Distorted bass with harmonics
+        val = saw(freq, t + bi * beat_dur) * 0.4
+        val += square(freq, t + bi * beat_dur) * 0.2
+        val = np.clip(val * 1.8, -0.6, 0.6)  # Soft clip for grit
+        samples[start:end] += val * env * 0.35
+
     # Kick drum on every beat
     for bi in range(int(duration / beat_dur)):
-        start = int(bi * beat_dur * SAMPLE_RATE)
-        kick_dur = int(0.15 * SAMPLE_RATE)
-        for j in range(kick_dur):
-            if start + j >= num_samples:
-                break
-            t = j / SAMPLE_RATE
-            # Pitch sweep from 150Hz down to 50Hz
-            freq = 150 - (100 * t / 0.15)
-            env = math.exp(-t * 25)
-            samples[start + j] += sine(max(40, freq), t) * env * 0.5
-    
+        start, end = segment(int(bi * beat_dur * SAMPLE_RATE), int(0.15 * SAMPLE_RATE), num_samples)
+        t = local_time(start, end)
+        # Pitch sweep from 150Hz down to 50Hz
+        freq = 150 - (100 * t / 0.15)
+        env = np.exp(-t * 25)
+        samples[start:end] += sine(np.maximum(40, freq), t) * env * 0.5
+
     # Snare / hi-hat on off-beats
     for bi in range(int(duration / (beat_dur * 0.5))):
         if bi % 2 == 1:  # Off-beat snare
-            start = int(bi * beat_dur * 0.5 * SAMPLE_RATE)
-            snare_dur = int(0.12 * SAMPLE_RATE)
-            for j in range(snare_dur):
-                if start + j >= num_samples:
-                    break
-                t = j / SAMPLE_RATE
-                env = math.exp(-t * 30)
-                # Noise burst + tone
-                val = noise() * 0.3 + sine(200, t) * 0.15
-                samples[start + j] += val * env * 0.4
+            start, end = segment(int(bi * beat_dur * 0.5 * SAMPLE_RATE), int(0.12 * SAMPLE_RATE), num_samples)
+            t = local_time(start, end)
+            env = np.exp(-t * 30)
+            # Noise burst + tone
+            val = noise(rng, end - start) * 0.3 + sine(200, t) * 0.15
+            samples[start:end] += val * env * 0.4
         # Hi-hat on every 8th note
-        start = int(bi * beat_dur * 0.5 * SAMPLE_RATE)
-        hh_dur = int(0.04 * SAMPLE_RATE)
-        for j in range(hh_dur):
-            if start + j >= num_samples:
-                break
-            t = j / SAMPLE_RATE
-            env = math.exp(-t * 80)
-            samples[start + j] += noise() * env * 0.12
-    
+        start, end = segment(int(bi * beat_dur * 0.5 * SAMPLE_RATE), int(0.04 * SAMPLE_RATE), num_samples)
+        t = local_time(start, end)
+        env = np.exp(-t * 80)
+        samples[start:end] += noise(rng, end - start) * env * 0.12
+
     # Power chord stabs (distorted guitar-like)
     # Every 4 beats, hit a power chord
     power_chords = [
@@ -232,49 +225,41 @@ def generate_boss_music():
     ]
     for ci in range(int(duration / (beat_dur * 4))):
         chord = power_chords[ci % len(power_chords)]
-        start = int(ci * beat_dur * 4 * SAMPLE_RATE)
-        chord_len = int(beat_dur * 3.5 * SAMPLE_RATE)
-        for j in range(chord_len):
-            if start + j >= num_samples:
-                break
-            t = j / SAMPLE_RATE
-            env = envelope_adsr(t, attack=0.01, decay=0.15, sustain=0.5, release=0.3, duration=beat_dur * 3.5)
-            val = 0.0
-            for freq in chord:
-                val += saw(freq, t + ci * beat_dur * 4) * 0.15
-                val += square(freq * 1.001, t + ci * beat_dur * 4) * 0.10
-                val += saw(freq * 2.0, t + ci * beat_dur * 4) * 0.08
-            # Distortion
-            val = max(-0.5, min(0.5, val * 2.5))
-            samples[start + j] += val * env * 0.3
-    
+        start, end = segment(int(ci * beat_dur * 4 * SAMPLE_RATE), int(beat_dur * 3.5 * SAMPLE_RATE), num_samples)
+        t = local_time(start, end)
+        env = envelope_adsr(t, attack=0.01, decay=0.15, sustain=0.5, release=0.3, duration=beat_dur * 3.5)
+        val = np.zeros(end - start)
+        for freq in chord:
+            val += saw(freq, t + ci * beat_dur * 4) * 0.15
+            val += square(freq * 1.001, t + ci * beat_dur * 4) * 0.10
+            val += saw(freq * 2.0, t + ci * beat_dur * 4) * 0.08
+        # Distortion
+        val = np.clip(val * 2.5, -0.5, 0.5)
+        samples[start:end] += val * env * 0.3
+
     # Apply slight lowpass to tame harshness
     samples = lowpass(samples, 6000)
-    
-    # Normalize
-    peak = max(abs(s) for s in samples) or 1.0
-    samples = [s / peak * 0.75 for s in samples]
-    
-    write_wav('music/boss_battle.wav', samples)
+
+    return normalize(samples, 0.75)
+
+def generate_boss_music():
+    print("Generating boss battle music...")
+    write_wav('music/boss_battle.wav', render_boss_music(_noise_rng))
 
 
 # ──────────────────────────────────────────────────────────────────
 # 3. Ambient Environmental Sounds
 # ──────────────────────────────────────────────────────────────────
 
-def generate_ambient_forest():
-    print("Generating forest ambient...")
+def render_ambient_forest(rng):
     duration = 16.0
     num_samples = int(duration * SAMPLE_RATE)
-    samples = [0.0] * num_samples
-    
+
     # Wind base layer - filtered noise with slow modulation
-    for i in range(num_samples):
-        t = i / SAMPLE_RATE
-        wind_mod = 0.3 + 0.7 * (0.5 + 0.5 * sine(0.08, t)) * (0.5 + 0.5 * sine(0.13, t + 3))
-        samples[i] += noise() * 0.08 * wind_mod
-    samples = lowpass(samples, 800)
-    
+    t = np.arange(num_samples) / SAMPLE_RATE
+    wind_mod = 0.3 + 0.7 * (0.5 + 0.5 * sine(0.08, t)) * (0.5 + 0.5 * sine(0.13, t + 3))
+    samples = lowpass(noise(rng, num_samples) * 0.08 * wind_mod, 800)
+
     # Bird chirps - random short sine sweeps
     random.seed(42)
     for _ in range(30):
@@ -283,161 +268,152 @@ def generate_ambient_forest():
         base_freq = random.uniform(2000, 4500)
         freq_sweep = random.uniform(-500, 800)
         vol = random.uniform(0.03, 0.08)
-        start_s = int(chirp_start * SAMPLE_RATE)
-        dur_s = int(chirp_dur * SAMPLE_RATE)
-        for j in range(dur_s):
-            if start_s + j >= num_samples:
-                break
-            t = j / SAMPLE_RATE
-            env = math.sin(math.pi * t / chirp_dur)
-            freq = base_freq + freq_sweep * (t / chirp_dur)
-            samples[start_s + j] += sine(freq, t) * env * vol
-    
+        start, end = segment(int(chirp_start * SAMPLE_RATE), int(chirp_dur * SAMPLE_RATE), num_samples)
+        t = local_time(start, end)
+        env = np.sin(np.pi * t / chirp_dur)
+        freq = base_freq + freq_sweep * (t / chirp_dur)
+        samples[start:end] += sine(freq, t) * env * vol
+
     # Subtle cricket-like background - high frequency clicks
     for _ in range(60):
         start_t = random.uniform(0, duration - 0.1)
-        start_s = int(start_t * SAMPLE_RATE)
         click_dur = int(random.uniform(0.005, 0.02) * SAMPLE_RATE)
         freq = random.uniform(5000, 8000)
         vol = random.uniform(0.01, 0.03)
-        for j in range(click_dur):
-            if start_s + j >= num_samples:
-                break
-            t = j / SAMPLE_RATE
-            env = math.exp(-t * 200)
-            samples[start_s + j] += sine(freq, t) * env * vol
-    
-    # Normalize
-    peak = max(abs(s) for s in samples) or 1.0
-    samples = [s / peak * 0.5 for s in samples]
-    
-    write_wav('music/ambient_forest.wav', samples)
+        start, end = segment(int(start_t * SAMPLE_RATE), click_dur, num_samples)
+        t = local_time(start, end)
+        env = np.exp(-t * 200)
+        samples[start:end] += sine(freq, t) * env * vol
 
+    return normalize(samples, 0.5)
 
-def generate_ambient_city():
-    print("Generating city ambient...")
+def generate_ambient_forest():
+    print("Generating forest ambient...")
+    write_wav('music/ambient_forest.wav', render_ambient_forest(_noise_rng))
+
+
+def render_ambient_city(rng):
     duration = 16.0
     num_samples = int(duration * SAMPLE_RATE)
-    samples = [0.0] * num_samples
-    
+
     # Traffic hum - low filtered noise
-    for i in range(num_samples):
-        t = i / SAMPLE_RATE
-        mod = 0.4 + 0.6 * (0.5 + 0.5 * sine(0.05, t))
-        samples[i] += noise() * 0.06 * mod
-    samples = lowpass(samples, 400)
-    
+    t = np.arange(num_samples) / SAMPLE_RATE
+    mod = 0.4 + 0.6 * (0.5 + 0.5 * sine(0.05, t))
+    samples = lowpass(noise(rng, num_samples) * 0.06 * mod, 400)
+
     # Occasional car horn-like tones
     random.seed(77)
     for _ in range(8):
         horn_start = random.uniform(0, duration - 1.0)
         horn_dur = random.uniform(0.3, 0.8)
         freq = random.choice([349.23, 392.00, 440.00, 466.16])
-        start_s = int(horn_start * SAMPLE_RATE)
-        dur_s = int(horn_dur * SAMPLE_RATE)
+        start, end = segment(int(horn_start * SAMPLE_RATE), int(horn_dur * SAMPLE_RATE), num_samples)
         vol = random.uniform(0.02, 0.05)
-        for j in range(dur_s):
-            if start_s + j >= num_samples:
-                break
-            t = j / SAMPLE_RATE
-            env = envelope_adsr(t, 0.02, 0.05, 0.7, 0.1, horn_dur)
-            val = square(freq, t + horn_start) * 0.5 + sine(freq, t + horn_start) * 0.5
-            samples[start_s + j] += val * env * vol
-    
+        t = local_time(start, end)
+        env = envelope_adsr(t, 0.02, 0.05, 0.7, 0.1, horn_dur)
+        val = square(freq, t + horn_start) * 0.5 + sine(freq, t + horn_start) * 0.5
+        samples[start:end] += val * env * vol
+
     # Distant siren (rising/falling pitch)
     siren_start = 5.0
     siren_dur = 4.0
-    start_s = int(siren_start * SAMPLE_RATE)
-    dur_s = int(siren_dur * SAMPLE_RATE)
-    for j in range(dur_s):
-        if start_s + j >= num_samples:
-            break
-        t = j / SAMPLE_RATE
-        # Siren oscillates between two pitches
-        freq = 600 + 200 * sine(1.5, t)
-        env = envelope_adsr(t, 0.5, 0.2, 0.3, 1.0, siren_dur)
-        samples[start_s + j] += sine(freq, t) * env * 0.03
-    
-    # Normalize
-    peak = max(abs(s) for s in samples) or 1.0
-    samples = [s / peak * 0.45 for s in samples]
-    
-    write_wav('music/ambient_city.wav', samples)
+    start, end = segment(int(siren_start * SAMPLE_RATE), int(siren_dur * SAMPLE_RATE), num_samples)
+    t = local_time(start, end)
+    # Siren oscillates between two pitches
+    freq = 600 + 200 * sine(1.5, t)
+    env = envelope_adsr(t, 0.5, 0.2, 0.3, 1.0, siren_dur)
+    samples[start:end] += sine(freq, t) * env * 0.03
 
+    return normalize(samples, 0.45)
 
-def generate_ambient_cave():
-    print("Generating cave ambient...")
+def generate_ambient_city():
+    print("Generating city ambient...")
+    write_wav('music/ambient_city.wav', render_ambient_city(_noise_rng))
+
+
+def render_ambient_cave(rng):
     duration = 16.0
     num_samples = int(duration * SAMPLE_RATE)
-    samples = [0.0] * num_samples
-    
+    samples = np.zeros(num_samples)
+    t = np.arange(num_samples) / SAMPLE_RATE
+
     # Deep reverberant drone
     drone_freqs = [55.0, 82.41, 110.0]  # A1, E2, A2
-    for i in range(num_samples):
-        t = i / SAMPLE_RATE
-        val = 0.0
-        for freq in drone_freqs:
-            mod = 0.5 + 0.5 * sine(0.07 + freq * 0.001, t)
-            val += sine(freq, t) * 0.06 * mod
-        samples[i] += val
-    
+    val = np.zeros(num_samples)
+    for freq in drone_freqs:
+        mod = 0.5 + 0.5 * sine(0.07 + freq * 0.001, t)
+        val += sine(freq, t) * 0.06 * mod
+    samples += val
+
     # Water drips
     random.seed(99)
     for _ in range(40):
         drip_start = random.uniform(0, duration - 0.2)
-        start_s = int(drip_start * SAMPLE_RATE)
         drip_dur = int(random.uniform(0.03, 0.08) * SAMPLE_RATE)
         freq = random.uniform(1500, 3500)
         vol = random.uniform(0.04, 0.10)
-        for j in range(drip_dur):
-            if start_s + j >= num_samples:
-                break
-            t = j / SAMPLE_RATE
-            env = math.exp(-t * 60)
-            samples[start_s + j] += sine(freq, t) * env * vol
-    
+        start, end = segment(int(drip_start * SAMPLE_RATE), drip_dur, num_samples)
+        drip_t = local_time(start, end)
+        env = np.exp(-drip_t * 60)
+        samples[start:end] += sine(freq, drip_t) * env * vol
+
     # Echoing rumble
-    for i in range(num_samples):
-        t = i / SAMPLE_RATE
-        rumble = sine(30, t) * 0.03 * (0.5 + 0.5 * sine(0.03, t))
-        samples[i] += rumble
-    
-    # Normalize
-    peak = max(abs(s) for s in samples) or 1.0
-    samples = [s / peak * 0.45 for s in samples]
-    
-    write_wav('music/ambient_cave_deep.wav', samples)
+    samples += sine(30, t) * 0.03 * (0.5 + 0.5 * sine(0.03, t))
+
+    return normalize(samples, 0.45)
+
+def generate_ambient_cave():
+    print("Generating cave ambient...")
+    write_wav('music/ambient_cave_deep.wav', render_ambient_cave(_noise_rng))
 
 
 # ──────────────────────────────────────────────────────────────────
 # 4. UI Hover Sound - short, subtle click/blip
 # ──────────────────────────────────────────────────────────────────
-def generate_ui_hover():
-    print("Generating UI hover sound...")
+def render_ui_hover(rng):
     duration = 0.08
     num_samples = int(duration * SAMPLE_RATE)
-    samples = [0.0] * num_samples
-    
-    for i in range(num_samples):
-        t = i / SAMPLE_RATE
-        # Quick pitch sweep up
-        freq = 800 + 600 * (t / duration)
-        env = math.exp(-t * 40) * 0.7
-        samples[i] = sine(freq, t) * env + sine(freq * 2, t) * env * 0.3
-    
-    # Normalize
-    peak = max(abs(s) for s in samples) or 1.0
-    samples = [s / peak * 0.5 for s in samples]
-    
-    write_wav('sfx/ui_hover.wav', samples)
+    t = np.arange(num_samples) / SAMPLE_RATE
+
+    # Quick pitch sweep up
+    freq = 800 + 600 * (t / duration)
+    env = np.exp(-t * 40) * 0.7
+    samples = sine(freq, t) * env + sine(freq * 2, t) * env * 0.3
+
+    return normalize(samples, 0.5)
+
+def generate_ui_hover():
+    print("Generating UI hover sound...")
+    write_wav('sfx/ui_hover.wav', render_ui_hover(_noise_rng))
+
+
+# Output file -> renderer(rng) returning the track's float samples; rng feeds
+# the noise layers and is unused by tracks without any
+TRACKS = {
+    'music/menu_theme.wav': render_menu_music,
+    'music/boss_battle.wav': render_boss_music,
+    'music/ambient_forest.wav': render_ambient_forest,
+    'music/ambient_city.wav': render_ambient_city,
+    'music/ambient_cave_deep.wav': render_ambient_cave,
+    'sfx/ui_hover.wav': render_ui_hover,
+}
+
+# Asset build targets for build_assets.py: name -> (output path from the repo root, generator)
+ASSET_TARGETS = {
+    'menu_theme': ('assets/audio/music/menu_theme.wav', generate_menu_music),
+    'boss_battle': ('assets/audio/music/boss_battle.wav', generate_boss_music),
+    'ambient_forest': ('assets/audio/music/ambient_forest.wav', generate_ambient_forest),
+    'ambient_city': ('assets/audio/music/ambient_city.wav', generate_ambient_city),
+    'ambient_cave_deep': ('assets/audio/music/ambient_cave_deep.wav', generate_ambient_cave),
+    'ui_hover': ('assets/audio/sfx/ui_hover.wav', generate_ui_hover),
+}
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate the game's procedural audio assets")
+    parser.parse_args()
+
     print("=== Generating Audio Assets ===")
-    generate_menu_music()
-    generate_boss_music()
-    generate_ambient_forest()
-    generate_ambient_city()
-    generate_ambient_cave()
-    generate_ui_hover()
+    for _, generate in ASSET_TARGETS.values():
+        generate()
     print("=== Done! ===")
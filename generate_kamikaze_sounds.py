@@ -7,24 +7,21 @@ Generate kamikaze-specific audio assets:
 import math
 import random
 import os
-import wave
-import array
+
+import numpy as np
+
+import audio_filters
+from wav_stream import write_wav as stream_wav
 
 SAMPLE_RATE = 22050
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'assets', 'audio', 'sfx')
 
 
 def write_wav(filename, samples, sample_rate=SAMPLE_RATE):
-    """Write a list of float samples [-1,1] to a 16-bit WAV file."""
+    """Write float samples [-1,1] (a list, an array or an iterable of blocks) to a 16-bit WAV file."""
     path = os.path.join(OUTPUT_DIR, filename)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with wave.open(path, 'w') as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        int_samples = array.array('h', (int(max(-1.0, min(1.0, s)) * 32767) for s in samples))
-        wf.writeframes(int_samples.tobytes())
-    print(f"  Written: {path} ({len(samples)} samples, {len(samples)/sample_rate:.1f}s)")
+    frames = stream_wav(path, samples, sample_rate)
+    print(f"  Written: {path} ({frames} samples, {frames/sample_rate:.1f}s)")
 
 
 def sine(freq, t):
@@ -37,15 +34,7 @@ def noise():
 
 def lowpass(samples, cutoff_freq, sample_rate=SAMPLE_RATE):
     """Simple one-pole low-pass filter."""
-    rc = 1.0 / (2 * math.pi * cutoff_freq)
-    dt = 1.0 / sample_rate
-    alpha = dt / (rc + dt)
-    out = []
-    prev = 0.0
-    for s in samples:
-        prev = prev + alpha * (s - prev)
-        out.append(prev)
-    return out
+    return audio_filters.lowpass(samples, cutoff_freq, sample_rate)
 
 
 def generate_kamikaze_explosion():
@@ -111,20 +100,18 @@ def generate_kamikaze_explosion():
             sizzle = (noise() * 0.5 + sine(2000 + 1000 * noise(), t) * 0.5) * sizzle_env
 
         # Combine
-        sample = crack + boom + sub + noise_val + crackle + echo + sizzle
+        samples[i] = crack + boom + sub + noise_val + crackle + echo + sizzle
 
-        # Soft clip for warmth
-        sample = math.tanh(sample * 1.3)
-
-        samples[i] = sample
+    # Soft clip for warmth
+    samples = audio_filters.soft_clip(samples, 1.3)
 
     # Low-pass filter to remove harshness
     samples = lowpass(samples, 6000)
 
     # Normalize
-    peak = max(abs(s) for s in samples)
+    peak = np.max(np.abs(samples))
     if peak > 0:
-        samples = [s / peak * 0.95 for s in samples]
+        samples = samples / peak * 0.95
 
     write_wav('kamikaze_explosion.wav', samples)
 
@@ -173,19 +160,27 @@ def generate_kamikaze_fuse():
             sample *= t / 0.02
         # No fade out — the game will cut this when entering dash
 
-        sample = math.tanh(sample * 1.2)
         samples[i] = sample
 
+    samples = audio_filters.soft_clip(samples, 1.2)
+
     # Normalize
-    peak = max(abs(s) for s in samples)
+    peak = np.max(np.abs(samples))
     if peak > 0:
-        samples = [s / peak * 0.9 for s in samples]
+        samples = samples / peak * 0.9
 
     write_wav('kamikaze_fuse.wav', samples)
 
 
+# Asset build targets for build_assets.py: name -> (output path from the repo root, generator)
+ASSET_TARGETS = {
+    'kamikaze_explosion': ('assets/audio/sfx/kamikaze_explosion.wav', generate_kamikaze_explosion),
+    'kamikaze_fuse': ('assets/audio/sfx/kamikaze_fuse.wav', generate_kamikaze_fuse),
+}
+
+
 if __name__ == '__main__':
     print("Generating kamikaze audio assets...")
-    generate_kamikaze_explosion()
-    generate_kamikaze_fuse()
+    for _, generate in ASSET_TARGETS.values():
+        generate()
     print("Done!")
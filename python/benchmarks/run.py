@@ -0,0 +1,260 @@
+"""
+Benchmark runner - times the benchmark scenarios and checks them against a baseline
+
+Usage (from the python/ directory):
+    python benchmarks/run.py                          # all scenarios, table to stdout
+    python benchmarks/run.py --output results.json    # also write machine-readable results
+    python benchmarks/run.py --baseline baseline.json # exit 1 if anything got slower
+                                                      # (2 if no scenario matches its settings)
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Game modules live one directory up and import each other by bare name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import *
+from headless import ScriptedInput
+from scenarios import SCENARIOS
+
+# Metrics compared against the baseline (lower is better)
+COMPARED_METRICS = ("update_ms", "render_ms")
+# Run settings a baseline must share for its timings to be comparable
+RUN_PARAMETERS = ("enemy_backend", "seed", "physics_hz")
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def build_game(scenario, frames, enemy_backend, seed):
+    """Fresh Game set up for the scenario, with its input script attached"""
+    from game import Game
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT, enemy_backend=enemy_backend, seed=seed)
+    if scenario.start:
+        game.start_game()
+    if scenario.setup:
+        scenario.setup(game)
+    script = ScriptedInput(scenario.script(frames) if scenario.script else [])
+    game.player.input_source = script
+    return game, script
+
+
+def step(game, script, scenario, frame):
+    """Deliver one step's input and restart the game if the scenario allows it"""
+    for event in script.events_for_frame(frame):
+        game.handle_event(event)
+    if scenario.restart and game.state == "GAME_OVER":
+        game.start_game()
+
+
+def time_scenario(scenario, frames, enemy_backend, seed):
+    """Update and render timings, GC activity and profiler phases for one run"""
+    game, script = build_game(scenario, frames, enemy_backend, seed)
+    render_every = max(1, PHYSICS_HZ // FPS)  # Render at the display rate, as main.py does
+    update_times = []
+    render_times = []
+    peak_enemies = 0
+    peak_damage_numbers = 0
+    gen0_before = gc.get_stats()[0]["collections"]
+
+    for frame in range(frames):
+        step(game, script, scenario, frame)
+        start = time.perf_counter()
+        game.update(PHYSICS_DT)
+        update_times.append(time.perf_counter() - start)
+        if scenario.each_step:
+            scenario.each_step(game)
+        if frame % render_every == 0:
+            start = time.perf_counter()
+            game.render()
+            render_times.append(time.perf_counter() - start)
+            game.profiler.end_frame()
+        peak_enemies = max(peak_enemies, len(game.enemy_manager.enemies))
+        peak_damage_numbers = max(peak_damage_numbers, len(game.damage_numbers))
+
+    gen0 = gc.get_stats()[0]["collections"] - gen0_before
+    return {
+        "frames": frames,
+        "update_ms": sum(update_times) / len(update_times) * 1000,
+        "update_p99_ms": percentile(update_times, 0.99) * 1000,
+        "render_ms": sum(render_times) / len(render_times) * 1000 if render_times else 0.0,
+        "render_p99_ms": percentile(render_times, 0.99) * 1000,
+        "gc_gen0_per_1000_frames": gen0 * 1000 / frames,
+        "peak_enemies": peak_enemies,
+        "peak_damage_numbers": peak_damage_numbers,
+        "checksum": game.state_checksum(),
+        # Profiler phases are per rendered frame, i.e. summed over its simulation steps
+        "phases_ms": {name: round(avg, 4) for name, (_, avg, _) in game.profiler.summary().items()},
+    }
+
+
+def measure_allocations(scenario, frames, enemy_backend, seed):
+    """Python heap growth and transient peak (KB) over a traced run
+
+    Tracing slows everything down, so this is a separate, untimed pass.
+    """
+    game, script = build_game(scenario, frames, enemy_backend, seed)
+    render_every = max(1, PHYSICS_HZ // FPS)
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    for frame in range(frames):
+        step(game, script, scenario, frame)
+        game.update(PHYSICS_DT)
+        if scenario.each_step:
+            scenario.each_step(game)
+        if frame % render_every == 0:
+            game.render()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "alloc_net_kb": (current - base) / 1024,
+        "alloc_peak_kb": (peak - base) / 1024,
+        "alloc_frames": frames,
+    }
+
+
+def run_scenarios(names, frames=None, enemy_backend=ENEMY_BACKEND, seed=0, alloc_frames=600):
+    """Run the named scenarios and return {name: metrics}"""
+    results = {}
+    for name in names:
+        scenario = SCENARIOS[name]
+        count = frames or scenario.frames
+        print(f"Running {name} ({count} frames)...", flush=True)
+        # Sprite loading and spawn messages would swamp the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = time_scenario(scenario, count, enemy_backend, seed)
+            if alloc_frames:
+                result.update(measure_allocations(scenario, min(count, alloc_frames), enemy_backend, seed))
+        results[name] = result
+    return results
+
+
+def mismatched_parameters(report, baseline):
+    """Run settings that differ between this report and the baseline, as (key, baseline value, ours)"""
+    return [(key, baseline.get(key), report[key]) for key in RUN_PARAMETERS if baseline.get(key) != report[key]]
+
+
+def compare(report, baseline, tolerance):
+    """Compare a report against a baseline report
+
+    Scenarios are only compared when both runs used the same run parameters
+    and frame count; anything else is skipped rather than reported as a
+    regression.
+
+    Returns:
+        (regressions, skipped): regressions are (name, metric, old, new) for
+        metrics more than `tolerance` (fraction) slower; skipped are
+        (name, reason) for scenarios that could not be compared
+    """
+    regressions = []
+    skipped = []
+    mismatches = mismatched_parameters(report, baseline)
+    run_reason = ", ".join(f"{key} {old!r} in baseline vs {new!r}" for key, old, new in mismatches)
+    for name, result in report["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if not reference:
+            skipped.append((name, "not in baseline"))
+            continue
+        if mismatches:
+            skipped.append((name, run_reason))
+            continue
+        if reference.get("frames") != result["frames"]:
+            skipped.append((name, f"frames {reference.get('frames')!r} in baseline vs {result['frames']!r}"))
+            continue
+        for metric in COMPARED_METRICS:
+            old = reference.get(metric)
+            new = result.get(metric)
+            if old and new is not None and new > old * (1 + tolerance):
+                regressions.append((name, metric, old, new))
+    return regressions, skipped
+
+
+def print_report(results):
+    """Human-readable summary table"""
+    print(f"{'scenario':<16}{'update ms':>11}{'p99':>9}{'render ms':>11}{'p99':>9}{'gc0/1k':>9}{'alloc KB':>10}")
+    for name, r in results.items():
+        print(f"{name:<16}{r['update_ms']:11.3f}{r['update_p99_ms']:9.3f}{r['render_ms']:11.3f}"
+              f"{r['render_p99_ms']:9.3f}{r['gc_gen0_per_1000_frames']:9.1f}{r.get('alloc_peak_kb', 0):10.1f}")
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Skunked benchmark scenarios")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="Override every scenario's frame count (e.g. for a quick smoke run)")
+    parser.add_argument("--enemy-backend", choices=("objects", "numpy"), default=ENEMY_BACKEND,
+                        help="Enemy simulation backend (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="Session seed (default: %(default)s)")
+    parser.add_argument("--alloc-frames", type=int, default=600,
+                        help="Frames traced for allocation stats, 0 to skip (default: %(default)s)")
+    parser.add_argument("--output", default=None, metavar="PATH", help="Write results as JSON")
+    parser.add_argument("--baseline", default=None, metavar="PATH",
+                        help="Compare against a previous --output file and exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed slowdown vs the baseline as a fraction (default: %(default)s)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    """Run the benchmarks; returns the process exit code"""
+    args = parse_args(argv)
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+
+    names = args.scenarios or list(SCENARIOS)
+    results = run_scenarios(names, args.frames, args.enemy_backend, args.seed, args.alloc_frames)
+    pygame.quit()
+
+    print_report(results)
+    report = {
+        "enemy_backend": args.enemy_backend,
+        "seed": args.seed,
+        "physics_hz": PHYSICS_HZ,
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "scenarios": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions, skipped = compare(report, baseline, args.tolerance)
+        for name, reason in skipped:
+            print(f"NOT COMPARED {name}: {reason}")
+        for name, metric, old, new in regressions:
+            print(f"REGRESSION {name} {metric}: {old:.3f} -> {new:.3f} ms (+{(new / old - 1) * 100:.0f}%)")
+        if regressions:
+            return 1
+        if len(skipped) == len(results):
+            print(f"Nothing comparable in {args.baseline}; rerun the baseline with the same settings")
+            return 2
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
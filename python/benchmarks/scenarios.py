@@ -0,0 +1,85 @@
+"""
+Benchmark scenarios - fixed, seeded game situations for run.py to time
+"""
+from config import *
+from headless import default_script
+
+
+class Scenario:
+    """One repeatable benchmark situation
+
+    Args:
+        frames: Default number of simulation steps to time
+        setup: Optional setup(game) called after the game is built (and started)
+        script: script(frames) -> ScriptedInput event list; no input when None
+        each_step: Optional each_step(game) called after every simulation step
+        start: Start gameplay before timing (False stays on the menu)
+        restart: Start a new game whenever the player runs out of lives
+    """
+
+    def __init__(self, frames, setup=None, script=None, each_step=None, start=True, restart=False):
+        self.frames = frames
+        self.setup = setup
+        self.script = script
+        self.each_step = each_step
+        self.start = start
+        self.restart = restart
+
+
+def keep_player_alive(game):
+    """Top the player up so a crowd can't end the scenario early"""
+    game.player.health = game.player.max_health
+
+
+def crowd(count):
+    """Setup filling the level with `count` enemies spread along its width"""
+    types = ("BASIC", "FAST_BASIC", "FLYING")
+
+    def setup(game):
+        manager = game.enemy_manager
+        manager.despawn_distance = None  # Keep the whole crowd, however far away
+        spacing = game.level.width / count
+        for i in range(len(manager.enemies), count):
+            enemy_type = types[i % len(types)]
+            y = 250 + (i * 37) % 150 if enemy_type == "FLYING" else 500
+            manager.spawn_enemy(int(i * spacing) % game.level.width, y, enemy_type)
+    return setup
+
+
+COMBO_ENEMIES = 30
+
+
+def combo_script(frames, hz=PHYSICS_HZ):
+    """Stand still and chain attacks as fast as the combo allows, with regular Shadow Strikes"""
+    attack_every = max(2, hz // 10)
+    special_every = int(2.5 * hz)
+    events = []
+    for frame in range(frames):
+        if frame % attack_every == 0:
+            events.append([frame, "down", "x"])
+            events.append([frame + 1, "up", "x"])
+        if frame % special_every == special_every // 2:
+            events.append([frame, "down", "z"])
+            events.append([frame + 1, "up", "z"])
+    return events
+
+
+def combo_refill(game):
+    """Keep the player alive and surrounded, replacing every enemy it defeats"""
+    keep_player_alive(game)
+    manager = game.enemy_manager
+    player = game.player
+    for i in range(len(manager.enemies), COMBO_ENEMIES):
+        offset = 40 + (i * 23) % 120
+        manager.spawn_enemy(player.x + (offset if i % 2 else -offset), 500, "BASIC")
+
+
+SCENARIOS = {
+    "enemies_5": Scenario(1200, setup=crowd(5), each_step=keep_player_alive),
+    "enemies_50": Scenario(1200, setup=crowd(50), each_step=keep_player_alive),
+    "enemies_500": Scenario(600, setup=crowd(500), each_step=keep_player_alive),
+    "enemies_5000": Scenario(240, setup=crowd(5000), each_step=keep_player_alive),
+    "long_session": Scenario(10 * 60 * PHYSICS_HZ, script=default_script, restart=True),
+    "combo_fight": Scenario(2400, setup=combo_refill, script=combo_script, each_step=combo_refill),
+    "menu_idle": Scenario(1200, start=False),
+}
@@ -7,10 +7,29 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# Simulation runs at a fixed rate independent of the render rate
+PHYSICS_HZ = 120
+PHYSICS_DT = 1.0 / PHYSICS_HZ
+MAX_PHYSICS_STEPS = 6  # Cap per rendered frame so a long stall can't spiral
+IDLE_WAIT_MS = 500  # Longest sleep between input checks while a static screen is shown
+
 # Game physics
 GRAVITY = 1500  # pixels per second squared
 MAX_FALL_SPEED = 800
 
+# Level collision index (width in pixels of each spatial hash column)
+LEVEL_GRID_CELL_SIZE = 256
+
+# Hit-spark particle pool size (bursts beyond it are dropped)
+PARTICLE_CAPACITY = 4096
+
+# Frame profiler - frames of phase timings kept, and overlay rebuild interval in frames
+PROFILER_HISTORY = 300
+PROFILER_OVERLAY_REFRESH = 30
+
+# Render culling - pixels beyond each screen edge still treated as visible
+VIEWPORT_MARGIN = 64
+
 # Player settings (Ninja Skunk)
 PLAYER_SPEED = 400
 PLAYER_JUMP_FORCE = 700
@@ -22,6 +41,22 @@ ENEMY_SPEED = 150
 ENEMY_HEALTH = 50
 ENEMY_ATTACK_DAMAGE = 10
 ENEMY_POINTS = 100
+ENEMY_BACKEND = "objects"  # "objects" (one Enemy per instance) or "numpy" (structure-of-arrays)
+
+# Enemy population budget - timed spawns wait in a queue while it is full
+ENEMY_MAX_ALIVE = 24
+ENEMY_TYPE_BUDGET = {"BASIC": 12, "FAST_BASIC": 8, "FLYING": 8}
+ENEMY_SPAWN_QUEUE_MAX = 8  # Oldest queued spawns are dropped beyond this
+ENEMY_DESPAWN_DISTANCE = 1600  # Enemies this far behind the camera's left edge are removed (never ahead of it)
+
+# Enemy simulation level of detail, by distance from the camera's view. The
+# "objects" backend only: EnemyManager warns that "numpy" ignores it. None
+# turns a tier off (both None = every enemy at full rate, like "numpy")
+ENEMY_FULL_RADIUS = 300  # Full AI, physics and animation on screen and this far past either edge
+ENEMY_WAKE_RADIUS = 800  # Coarse patrol steps up to this past the edges, asleep beyond it (well inside ENEMY_DESPAWN_DISTANCE)
+ENEMY_COARSE_HZ = 5  # Coarse step rate; 5 Hz or more so hover easing can't overshoot
+ENEMY_COARSE_DT = 1.0 / ENEMY_COARSE_HZ
+ENEMY_MAX_CATCHUP = 2.0  # Seconds of missed patrol replayed on waking (patrols are periodic)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -5,12 +5,80 @@ import pygame
 from config import *
 from sprite_loader import sprite_loader, Animation
 
+def enemy_size(enemy_type):
+    """Collision box (width, height) for an enemy type"""
+    if enemy_type == "BASIC" or enemy_type == "FAST_BASIC":
+        return 48, 48
+    elif enemy_type == "FLYING":
+        return 64, 64
+    elif enemy_type == "BOSS":
+        return 128, 128
+    return 50, 70
+
+
+def enemy_stats(enemy_type):
+    """Combat stats (health, speed, attack_damage, points) for an enemy type"""
+    if enemy_type == "FAST_BASIC":
+        # 80% health, 50% faster, 20% more points
+        return int(ENEMY_HEALTH * 0.8), ENEMY_SPEED * 1.5, ENEMY_ATTACK_DAMAGE, int(ENEMY_POINTS * 1.2)
+    return ENEMY_HEALTH, ENEMY_SPEED, ENEMY_ATTACK_DAMAGE, ENEMY_POINTS
+
+
+def load_enemy_animations(enemy_type):
+    """Load the animation set for an enemy type (raises if sprites are missing)
+    
+    Enemy art faces left, so animations are built with faces_right=False.
+    """
+    prefix = "basic" if (enemy_type == "BASIC" or enemy_type == "FAST_BASIC") else "fly" if enemy_type == "FLYING" else "boss"
+    
+    if enemy_type == "BASIC" or enemy_type == "FAST_BASIC":
+        # Load sprite sheets for basic enemy (48x48 per frame in 192x48 sheets)
+        idle_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_idle.png", 48, 48, 4, (48, 48))
+        walk_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_walk.png", 48, 48, 4, (48, 48))
+        attack_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_attack.png", 48, 48, 4, (48, 48))
+        hurt_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_hurt.png", 48, 48, 4, (48, 48))
+        
+        return {
+            "idle": Animation(idle_frames, 0.2, True, faces_right=False),
+            "walk": Animation(walk_frames, 0.15, True, faces_right=False),
+            "attack": Animation(attack_frames, 0.1, False, faces_right=False),
+            "hurt": Animation(hurt_frames, 0.1, False, faces_right=False)
+        }
+    elif enemy_type == "FLYING":
+        # Load sprite sheets for flying enemy (40x40 per frame in 120x40 sheets = 3 frames each)
+        frame_size = 40
+        idle_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_idle.png", frame_size, frame_size, 3, (64, 64))
+        move_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_move.png", frame_size, frame_size, 3, (64, 64))
+        attack_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_attack.png", frame_size, frame_size, 3, (64, 64))
+        
+        return {
+            "idle": Animation(idle_frames, 0.2, True, faces_right=False),
+            "move": Animation(move_frames, 0.12, True, faces_right=False),
+            "attack": Animation(attack_frames, 0.1, False, faces_right=False)
+        }
+    elif enemy_type == "BOSS":
+        # Load sprite sheets for boss enemy
+        frame_size = 128
+        idle_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_idle.png", frame_size, frame_size, 4, (128, 128))
+        walk_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_walk.png", frame_size, frame_size, 6, (128, 128))
+        attack1_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_attack1.png", frame_size, frame_size, 6, (128, 128))
+        attack2_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_attack2.png", frame_size, frame_size, 6, (128, 128))
+        special_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_special.png", frame_size, frame_size, 8, (128, 128))
+        
+        return {
+            "idle": Animation(idle_frames, 0.2, True, faces_right=False),
+            "walk": Animation(walk_frames, 0.15, True, faces_right=False),
+            "attack1": Animation(attack1_frames, 0.1, False, faces_right=False),
+            "attack2": Animation(attack2_frames, 0.1, False, faces_right=False),
+            "special": Animation(special_frames, 0.08, False, faces_right=False)
+        }
+    raise ValueError(f"Unknown enemy type: {enemy_type}")
+
+
 class Enemy:
     """Base enemy class"""
     
     def __init__(self, x, y, enemy_type="BASIC", audio_manager=None):
-        self.x = x
-        self.y = y
         self.enemy_type = enemy_type
         self.audio_manager = audio_manager
         
@@ -18,65 +86,70 @@ class Enemy:
         self.load_sprites()
         
         # Set size based on type
-        if enemy_type == "BASIC" or enemy_type == "FAST_BASIC":
-            self.width = 48
-            self.height = 48
-            self.sprite_width = 48
-            self.sprite_height = 48
-        elif enemy_type == "FLYING":
-            self.width = 64
-            self.height = 64
-            self.sprite_width = 64
-            self.sprite_height = 64
-        elif enemy_type == "BOSS":
-            self.width = 128
-            self.height = 128
-            self.sprite_width = 128
-            self.sprite_height = 128
-        else:
-            self.width = 50
-            self.height = 70
+        self.width, self.height = enemy_size(enemy_type)
+        if enemy_type in ("BASIC", "FAST_BASIC", "FLYING", "BOSS"):
+            self.sprite_width = self.width
+            self.sprite_height = self.height
             
         self.rect = pygame.Rect(x, y, self.width, self.height)
         
         # Stats
-        if enemy_type == "FAST_BASIC":
-            self.health = int(ENEMY_HEALTH * 0.8)  # 80% health
-            self.max_health = self.health
-            self.speed = ENEMY_SPEED * 1.5  # 50% faster
-            self.attack_damage = ENEMY_ATTACK_DAMAGE
-            self.points = int(ENEMY_POINTS * 1.2)  # 20% more points
-        else:
-            self.health = ENEMY_HEALTH
-            self.max_health = ENEMY_HEALTH
-            self.speed = ENEMY_SPEED
-            self.attack_damage = ENEMY_ATTACK_DAMAGE
-            self.points = ENEMY_POINTS
+        self.health, self.speed, self.attack_damage, self.points = enemy_stats(enemy_type)
+        self.max_health = self.health
+        
+        # Movement
+        self.patrol_range = 200
+        
+        # Flying enemy specific
+        if enemy_type == "FLYING":
+            self.hover_amplitude = 30  # How far up/down to bob
+            self.hover_speed = 2.0  # Speed of bobbing
+        
+        # Combat
+        self.attack_duration = 0.5
+        self.attack_cooldown = 2.0
+        self.attack_range = 80
+        self.attack_hitbox = pygame.Rect(0, 0, 60, 40)
+        
+        # AI
+        self.detection_range = 300
+        
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Put the enemy back in its freshly spawned state at (x, y)
+        
+        Sprites and type-dependent stats are kept, so pooled enemies can be
+        respawned without reloading anything.
+        """
+        self.x = x
+        self.y = y
+        self.rect.topleft = (x, y)
+        
+        # Position at the previous simulation step (for render interpolation)
+        self.prev_x = x
+        self.prev_y = y
+        
+        self.health = self.max_health
         
         # Movement
         self.velocity_x = -self.speed
         self.velocity_y = 0
         self.facing_right = False
-        self.patrol_range = 200
         self.start_x = x
         self.start_y = y
         
         # Flying enemy specific
-        if enemy_type == "FLYING":
+        if self.enemy_type == "FLYING":
             self.hover_time = 0
-            self.hover_amplitude = 30  # How far up/down to bob
-            self.hover_speed = 2.0  # Speed of bobbing
             self.dive_cooldown = 0
             self.is_diving = False
         
         # Combat
         self.is_attacking = False
         self.attack_timer = 0
-        self.attack_duration = 0.5
-        self.attack_cooldown = 2.0
         self.attack_cooldown_timer = 0
-        self.attack_range = 80
-        self.attack_hitbox = pygame.Rect(0, 0, 60, 40)
+        self.attack_hitbox.topleft = (0, 0)
         
         # Hit feedback
         self.hit_stun_timer = 0
@@ -84,59 +157,22 @@ class Enemy:
         
         # AI state
         self.state = "PATROL"  # PATROL, CHASE, ATTACK
-        self.detection_range = 300
         
-        # Animation
+        # Simulated time not yet applied while coarse or asleep (see EnemyManager)
+        self.lod_debt = 0.0
+        
+        # Animation: start on a rewound idle clip, as a freshly loaded enemy does
         self.current_animation = "idle"
         self.current_anim = None
+        if self.animations:
+            self.current_anim = self.animations["idle"]
+            self.current_anim.reset()
         self.last_anim_state = "idle"
     
     def load_sprites(self):
         """Load sprites based on enemy type"""
-        prefix = "basic" if (self.enemy_type == "BASIC" or self.enemy_type == "FAST_BASIC") else "fly" if self.enemy_type == "FLYING" else "boss"
-        
         try:
-            if self.enemy_type == "BASIC" or self.enemy_type == "FAST_BASIC":
-                # Load sprite sheets for basic enemy (48x48 per frame in 192x48 sheets)
-                idle_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_idle.png", 48, 48, 4, (48, 48))
-                walk_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_walk.png", 48, 48, 4, (48, 48))
-                attack_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_attack.png", 48, 48, 4, (48, 48))
-                hurt_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_hurt.png", 48, 48, 4, (48, 48))
-                
-                self.animations = {
-                    "idle": Animation(idle_frames, 0.2, True),
-                    "walk": Animation(walk_frames, 0.15, True),
-                    "attack": Animation(attack_frames, 0.1, False),
-                    "hurt": Animation(hurt_frames, 0.1, False)
-                }
-            elif self.enemy_type == "FLYING":
-                # Load sprite sheets for flying enemy (40x40 per frame in 120x40 sheets = 3 frames each)
-                frame_size = 40
-                idle_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_idle.png", frame_size, frame_size, 3, (64, 64))
-                move_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_move.png", frame_size, frame_size, 3, (64, 64))
-                attack_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_attack.png", frame_size, frame_size, 3, (64, 64))
-                
-                self.animations = {
-                    "idle": Animation(idle_frames, 0.2, True),
-                    "move": Animation(move_frames, 0.12, True),
-                    "attack": Animation(attack_frames, 0.1, False)
-                }
-            elif self.enemy_type == "BOSS":
-                # Load sprite sheets for boss enemy
-                frame_size = 128
-                idle_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_idle.png", frame_size, frame_size, 4, (128, 128))
-                walk_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_walk.png", frame_size, frame_size, 6, (128, 128))
-                attack1_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_attack1.png", frame_size, frame_size, 6, (128, 128))
-                attack2_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_attack2.png", frame_size, frame_size, 6, (128, 128))
-                special_frames = sprite_loader.load_spritesheet(f"enemies/{prefix}_special.png", frame_size, frame_size, 8, (128, 128))
-                
-                self.animations = {
-                    "idle": Animation(idle_frames, 0.2, True),
-                    "walk": Animation(walk_frames, 0.15, True),
-                    "attack1": Animation(attack1_frames, 0.1, False),
-                    "attack2": Animation(attack2_frames, 0.1, False),
-                    "special": Animation(special_frames, 0.08, False)
-                }
+            self.animations = load_enemy_animations(self.enemy_type)
             
             # Set current animation and keep backward compatibility
             self.sprites = {key: anim.frames[0] for key, anim in self.animations.items()}
@@ -151,6 +187,11 @@ class Enemy:
             self.sprites = None
             self.animations = None
     
+    def store_previous_position(self):
+        """Remember the current position before the next simulation step"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
     def update(self, dt, level, player):
         """Update enemy behavior"""
         # Check player distance
@@ -169,8 +210,8 @@ class Enemy:
             self.hit_stun_timer -= dt
             # Apply knockback
             if self.knockback_velocity_x != 0:
-                # Decay knockback
-                self.knockback_velocity_x *= 0.9
+                # Decay knockback (0.9 per 60 Hz frame, independent of step rate)
+                self.knockback_velocity_x *= 0.9 ** (dt * 60)
                 if abs(self.knockback_velocity_x) < 10:
                     self.knockback_velocity_x = 0
         
@@ -197,23 +238,17 @@ class Enemy:
         self.x += total_velocity_x * dt
         self.rect.x = int(self.x)
         
+        # Only platforms/boundaries near us can collide; pad by our width since
+        # push-outs below can move us up to one body-width sideways
+        search_rect = self.rect.inflate(self.width * 2, 0)
+        nearby_platforms = level.platforms_near(search_rect)
+        
         # Check horizontal collisions with platforms (not for flying enemies)
         if self.enemy_type != "FLYING":
-            for platform in level.platforms:
-                if self.rect.colliderect(platform):
-                    # Push out of platform and turn around
-                    if self.velocity_x > 0:  # Moving right
-                        self.x = platform.left - self.width
-                        self.velocity_x = -self.speed
-                        self.facing_right = False
-                    elif self.velocity_x < 0:  # Moving left
-                        self.x = platform.right
-                        self.velocity_x = self.speed
-                        self.facing_right = True
-                    self.rect.x = int(self.x)
+            self.bounce_off_platforms(nearby_platforms)
         
         # Check boundaries (level edges)
-        for boundary in level.boundaries:
+        for boundary in level.boundaries_near(search_rect):
             if self.rect.colliderect(boundary):
                 # Left wall
                 if boundary.x < 0:
@@ -237,7 +272,7 @@ class Enemy:
         # Check vertical collisions with platforms (not for flying enemies)
         if self.enemy_type != "FLYING":
             on_ground = False
-            for platform in level.platforms:
+            for platform in nearby_platforms:
                 if self.rect.colliderect(platform):
                     if self.velocity_y > 0:  # Falling down
                         # Land on platform
@@ -274,6 +309,93 @@ class Enemy:
         if self.animations and self.current_anim:
             self.current_anim.update(dt)
     
+    def bounce_off_platforms(self, platforms):
+        """Push out of any platform we walked into and turn around"""
+        for platform in platforms:
+            if self.rect.colliderect(platform):
+                if self.velocity_x > 0:  # Moving right
+                    self.x = platform.left - self.width
+                    self.velocity_x = -self.speed
+                    self.facing_right = False
+                elif self.velocity_x < 0:  # Moving left
+                    self.x = platform.right
+                    self.velocity_x = self.speed
+                    self.facing_right = True
+                self.rect.x = int(self.x)
+    
+    def ground_platform(self, level):
+        """Platform we are standing on, or None"""
+        feet = pygame.Rect(self.rect.left, self.rect.bottom, self.width, 1)
+        for platform in level.platforms_near(feet):
+            if platform.top == self.rect.bottom and feet.colliderect(platform):
+                return platform
+        return None
+    
+    def can_coarse_update(self, level):
+        """True if a coarse step is a fair stand-in for update(): settled and out of combat"""
+        return (self.hit_stun_timer <= 0 and not self.is_attacking and self.knockback_velocity_x == 0
+                and (self.enemy_type == "FLYING" or self.ground_platform(level) is not None))
+    
+    def coarse_update(self, dt, level):
+        """Low-rate stand-in for update() used far from the player
+        
+        Patrols without gravity, player tracking or animation. Ground enemies
+        turn at walls and at the ends of the platform they stand on, so they
+        are still standing where full updates left them when those resume.
+        Enemies that can't coarse update just run their timers down.
+        """
+        if self.attack_cooldown_timer > 0:
+            self.attack_cooldown_timer -= dt
+        if not self.can_coarse_update(level):
+            if self.hit_stun_timer > 0:
+                self.hit_stun_timer -= dt
+            if self.is_attacking:
+                self.attack_timer -= dt
+                if self.attack_timer <= 0:
+                    self.is_attacking = False
+            return
+        
+        self.state = "PATROL"
+        self.patrol(dt)
+        left, right = 0, level.width - self.width
+        if self.enemy_type != "FLYING":
+            # No gravity here, so walking off a ledge would leave us hovering
+            ground = self.ground_platform(level)
+            if ground is not None:
+                left = max(left, ground.left)
+                right = min(right, ground.right - self.width)
+        self.x += self.velocity_x * dt
+        if self.x < left:
+            self.x = left
+            self.velocity_x = self.speed
+            self.facing_right = True
+        elif self.x > right:
+            self.x = right
+            self.velocity_x = -self.speed
+            self.facing_right = False
+        if self.enemy_type == "FLYING":
+            # patrol() eases toward the hover height; at <= 0.2 s steps this lands on it
+            self.y += self.velocity_y * dt
+        self.rect.topleft = (int(self.x), int(self.y))
+        if self.enemy_type != "FLYING":
+            self.bounce_off_platforms(level.platforms_near(self.rect.inflate(self.width * 2, 0)))
+    
+    def catch_up(self, level, flush=False):
+        """Spend lod_debt in whole coarse steps, so catch-up is independent of frame timing
+        
+        Args:
+            flush: Also spend the remainder below one coarse step (before
+                returning to full updates)
+        """
+        if self.lod_debt > ENEMY_MAX_CATCHUP:
+            self.lod_debt = ENEMY_MAX_CATCHUP
+        while self.lod_debt >= ENEMY_COARSE_DT:
+            self.coarse_update(ENEMY_COARSE_DT, level)
+            self.lod_debt -= ENEMY_COARSE_DT
+        if flush and self.lod_debt > 0:
+            self.coarse_update(self.lod_debt, level)
+            self.lod_debt = 0.0
+    
     def update_animation_state(self, dt):
         """Update which animation to show"""
         anim_state = "idle"
@@ -390,26 +512,18 @@ class Enemy:
             else:
                 self.audio_manager.play_sound('enemy_hit')
     
-    def render(self, screen, camera_x):
-        """Render the enemy"""
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y)
+    def render(self, screen, camera_x, alpha=1.0):
+        """Render the enemy, interpolated between the last two simulation steps"""
+        render_x = self.prev_x + (self.x - self.prev_x) * alpha
+        render_y = self.prev_y + (self.y - self.prev_y) * alpha
+        screen_x = int(render_x - camera_x)
+        screen_y = int(render_y)
         
         # Try to render animated sprite
         if self.animations and self.current_anim:
-            sprite = self.current_anim.get_current_frame()
-            
-            # Flip sprite based on facing direction
-            # Enemy sprites face left by default, so flip when facing_right
-            if self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
-            
-            # Hit flash effect
-            if self.hit_stun_timer > 0:
-                # Create white flash overlay
-                flash_sprite = sprite.copy()
-                flash_sprite.fill((255, 255, 255, 180), special_flags=pygame.BLEND_RGB_ADD)
-                sprite = flash_sprite
+            # Pre-flipped frame for our facing (enemy art faces left by default),
+            # using the cached white-flash variant during hit stun
+            sprite = self.current_anim.get_current_frame(self.facing_right, flash=self.hit_stun_timer > 0)
             
             # Center sprite on collision box
             sprite_rect = sprite.get_rect()
@@ -0,0 +1,562 @@
+"""
+Structure-of-arrays enemy simulation - advances every enemy with a handful of NumPy ops
+"""
+import numpy as np
+import pygame
+from config import *
+from enemy import enemy_size, enemy_stats, load_enemy_animations
+from sprite_loader import sprite_loader
+
+# AI state codes (index into STATE_NAMES)
+PATROL, CHASE, ATTACK = 0, 1, 2
+STATE_NAMES = ("PATROL", "CHASE", "ATTACK")
+
+# Enemy type codes
+TYPE_NAMES = ("BASIC", "FAST_BASIC", "FLYING", "BOSS")
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+FLYING = TYPE_CODES["FLYING"]
+
+# Animation codes; MOVE is "walk" for ground enemies and "move" for flyers
+ANIM_IDLE, ANIM_MOVE, ANIM_ATTACK = 0, 1, 2
+ANIM_KEYS = (("idle",), ("walk", "move"), ("attack", "attack1"))
+
+# Behaviour tuning - mirrors the per-instance defaults in Enemy.__init__
+PATROL_RANGE = 200
+DETECTION_RANGE = 300
+ATTACK_RANGE = 80
+ATTACK_DURATION = 0.5
+ATTACK_COOLDOWN = 2.0
+ATTACK_HITBOX_WIDTH = 60
+ATTACK_HITBOX_HEIGHT = 40
+HOVER_AMPLITUDE = 30
+HOVER_SPEED = 2.0
+HIT_STUN = 0.15
+KNOCKBACK_SPEED = 200
+
+# Per-enemy columns: name -> dtype
+FIELDS = (
+    ("x", np.float64), ("y", np.float64),
+    ("prev_x", np.float64), ("prev_y", np.float64),
+    ("vx", np.float64), ("vy", np.float64),
+    ("knockback", np.float64), ("hit_stun", np.float64),
+    ("attack_timer", np.float64), ("attack_cooldown", np.float64),
+    ("attacking", np.bool_), ("facing_right", np.bool_),
+    ("start_x", np.float64), ("start_y", np.float64), ("hover_time", np.float64),
+    ("speed", np.float64), ("width", np.int64), ("height", np.int64),
+    ("health", np.int64), ("max_health", np.int64),
+    ("attack_damage", np.int64), ("points", np.int64),
+    ("type", np.int8), ("state", np.int8),
+    ("anim", np.int8), ("anim_frame", np.int64), ("anim_timer", np.float64), ("anim_done", np.bool_),
+    ("hitbox_x", np.int64), ("hitbox_y", np.int64),
+)
+
+
+class EnemyView:
+    """Thin handle onto one enemy slot, used by collision, scoring and AI code"""
+
+    __slots__ = ("arrays", "index", "enemy_type", "cached_rect", "rect_step")
+
+    def __init__(self, arrays, index, enemy_type):
+        self.arrays = arrays
+        self.index = index
+        self.enemy_type = enemy_type
+        self.cached_rect = None
+        self.rect_step = -1  # EnemyArrays.step cached_rect was built for
+
+    @property
+    def x(self):
+        return float(self.arrays.x[self.index])
+
+    @property
+    def y(self):
+        return float(self.arrays.y[self.index])
+
+    @property
+    def width(self):
+        return int(self.arrays.width[self.index])
+
+    @property
+    def height(self):
+        return int(self.arrays.height[self.index])
+
+    @property
+    def velocity_x(self):
+        return float(self.arrays.vx[self.index])
+
+    @property
+    def velocity_y(self):
+        return float(self.arrays.vy[self.index])
+
+    @property
+    def health(self):
+        return int(self.arrays.health[self.index])
+
+    @property
+    def max_health(self):
+        return int(self.arrays.max_health[self.index])
+
+    @property
+    def attack_damage(self):
+        return int(self.arrays.attack_damage[self.index])
+
+    @property
+    def points(self):
+        return int(self.arrays.points[self.index])
+
+    @property
+    def is_attacking(self):
+        return bool(self.arrays.attacking[self.index])
+
+    @property
+    def facing_right(self):
+        return bool(self.arrays.facing_right[self.index])
+
+    @property
+    def hit_stun_timer(self):
+        return float(self.arrays.hit_stun[self.index])
+
+    @property
+    def state(self):
+        return STATE_NAMES[self.arrays.state[self.index]]
+
+    @property
+    def rect(self):
+        # Built once per simulation step; positions only change in EnemyArrays.update
+        a = self.arrays
+        if self.rect_step != a.step:
+            i = self.index
+            self.cached_rect = pygame.Rect(int(a.x[i]), int(a.y[i]), int(a.width[i]), int(a.height[i]))
+            self.rect_step = a.step
+        return self.cached_rect
+
+    @property
+    def attack_hitbox(self):
+        a, i = self.arrays, self.index
+        return pygame.Rect(int(a.hitbox_x[i]), int(a.hitbox_y[i]), ATTACK_HITBOX_WIDTH, ATTACK_HITBOX_HEIGHT)
+
+    def take_damage(self, damage, knockback_direction=1):
+        """Take damage with knockback"""
+        self.arrays.take_damage(self.index, damage, knockback_direction)
+
+
+class EnemyArrays:
+    """Enemy simulation backend storing every enemy as a row across NumPy columns
+
+    Slots [0, count) are live; removal swaps the last slot into the hole so the
+    columns stay dense. views[i] is always the EnemyView for slot i.
+    """
+
+    def __init__(self, audio_manager=None, capacity=64):
+        self.audio_manager = audio_manager
+        self.count = 0
+        self.capacity = 0
+        self.views = []
+        self.step = 0  # Bumped whenever update() moves enemies, invalidating view rects
+        self.allocate(capacity)
+
+        # Per-type animation clips, loaded on first spawn of each type
+        self.clip_frames = [None] * len(TYPE_NAMES)  # type -> [frames per anim code] or None
+        self.clip_flipped = [None] * len(TYPE_NAMES)  # same, mirrored to face right
+        self.clip_lengths = np.ones((len(TYPE_NAMES), len(ANIM_KEYS)), dtype=np.int64)
+        self.clip_durations = np.full((len(TYPE_NAMES), len(ANIM_KEYS)), 0.1)
+        self.clip_loops = np.ones((len(TYPE_NAMES), len(ANIM_KEYS)), dtype=np.bool_)
+        self.clips_loaded = set()
+
+    def allocate(self, capacity):
+        """Grow every column to at least the given capacity, keeping live rows"""
+        if capacity <= self.capacity:
+            return
+        for name, dtype in FIELDS:
+            column = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                column[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def load_clips(self, type_code):
+        """Cache the animation frames for an enemy type"""
+        self.clips_loaded.add(type_code)
+        enemy_type = TYPE_NAMES[type_code]
+        try:
+            animations = load_enemy_animations(enemy_type)
+        except Exception as e:
+            print(f"Error loading enemy sprites: {e}")
+            return
+
+        frames = []
+        flipped = []
+        for code, keys in enumerate(ANIM_KEYS):
+            anim = next((animations[k] for k in keys if k in animations), animations["idle"])
+            frames.append(anim.frames)
+            flipped.append(anim.flipped_frames)
+            self.clip_lengths[type_code, code] = len(anim.frames)
+            self.clip_durations[type_code, code] = anim.frame_duration
+            self.clip_loops[type_code, code] = anim.loop
+        self.clip_frames[type_code] = frames
+        self.clip_flipped[type_code] = flipped
+        print(f"✓ Loaded {enemy_type} enemy sprites with animations (array backend)")
+
+    def spawn(self, x, y, enemy_type="BASIC"):
+        """Add an enemy and return its view"""
+        type_code = TYPE_CODES.get(enemy_type, TYPE_CODES["BASIC"])
+        if type_code not in self.clips_loaded:
+            self.load_clips(type_code)
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        i = self.count
+        width, height = enemy_size(enemy_type)
+        health, speed, attack_damage, points = enemy_stats(enemy_type)
+        for name, _ in FIELDS:
+            getattr(self, name)[i] = 0
+        self.x[i] = self.prev_x[i] = self.start_x[i] = x
+        self.y[i] = self.prev_y[i] = self.start_y[i] = y
+        self.vx[i] = -speed
+        self.speed[i] = speed
+        self.width[i] = width
+        self.height[i] = height
+        self.health[i] = self.max_health[i] = health
+        self.attack_damage[i] = attack_damage
+        self.points[i] = points
+        self.type[i] = type_code
+        self.state[i] = PATROL
+        self.anim[i] = ANIM_IDLE
+        self.hitbox_x[i] = int(x)
+        self.hitbox_y[i] = int(y)
+
+        view = EnemyView(self, i, enemy_type)
+        self.views.append(view)
+        self.count += 1
+        return view
+
+    def remove(self, view):
+        """Remove an enemy by swapping the last slot into its place"""
+        i = view.index
+        if i < 0 or i >= self.count or self.views[i] is not view:
+            return
+        last = self.count - 1
+        if i != last:
+            for name, _ in FIELDS:
+                column = getattr(self, name)
+                column[i] = column[last]
+            moved = self.views[last]
+            moved.index = i
+            self.views[i] = moved
+        self.views.pop()
+        self.count -= 1
+        view.index = -1
+
+    def remove_dead(self, in_play=None):
+        """Compact out every enemy with no health left, preserving order
+
+        Args:
+            in_play: Optional bool mask over live slots; enemies outside it are
+                despawned along with the dead ones
+
+        Returns:
+            Number of enemies despawned while still alive
+        """
+        n = self.count
+        alive = self.health[:n] > 0
+        despawned = 0
+        if in_play is not None:
+            despawned = int(np.count_nonzero(alive & ~in_play))
+            alive &= in_play
+        if alive.all():
+            return despawned
+        keep = np.flatnonzero(alive)
+        for name, _ in FIELDS:
+            column = getattr(self, name)
+            column[:len(keep)] = column[keep]
+        for view in self.views:
+            view.index = -1
+        self.views[:] = [self.views[i] for i in keep]
+        for i, view in enumerate(self.views):
+            view.index = i
+        self.count = len(keep)
+        return despawned
+
+    def in_play(self, level, view_left, despawn_distance=None):
+        """Mask of live slots inside the level and no more than despawn_distance behind the view's left edge"""
+        n = self.count
+        x = self.x[:n]
+        right = x + self.width[:n]
+        mask = (right >= 0) & (x <= level.width) & (self.y[:n] <= level.height)
+        if despawn_distance is not None:
+            mask &= right >= view_left - despawn_distance
+        return mask
+
+    def clear(self):
+        """Remove every enemy"""
+        for view in self.views:
+            view.index = -1
+        self.views.clear()
+        self.count = 0
+
+    def take_damage(self, i, damage, knockback_direction=1):
+        """Apply damage, hit stun and knockback to slot i"""
+        self.health[i] -= damage
+        self.hit_stun[i] = HIT_STUN
+        self.knockback[i] = knockback_direction * KNOCKBACK_SPEED
+
+        if self.audio_manager:
+            if self.health[i] <= 0:
+                self.audio_manager.play_sound('enemy_death')
+            else:
+                self.audio_manager.play_sound('enemy_hit')
+
+    def store_previous_positions(self):
+        """Snapshot positions for render interpolation"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def sorted_by_left(self):
+        """Views with their rect.left and rect.right values, ordered by rect.left"""
+        n = self.count
+        lefts = self.x[:n].astype(np.int64)
+        order = np.argsort(lefts, kind="stable")
+        lefts = lefts[order]
+        views = self.views
+        return [views[i] for i in order.tolist()], lefts.tolist(), (lefts + self.width[:n][order]).tolist()
+
+    def update(self, dt, level, player):
+        """Advance AI, physics, collisions and animation for every enemy at once
+
+        Follows Enemy.update step for step; each masked assignment below is the
+        vectorized form of one branch there.
+        """
+        n = self.count
+        if n == 0:
+            return
+        self.step += 1
+
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        speed, facing = self.speed[:n], self.facing_right[:n]
+        width, height = self.width[:n], self.height[:n]
+        knockback, hit_stun = self.knockback[:n], self.hit_stun[:n]
+        attacking = self.attacking[:n]
+        attack_timer, attack_cooldown = self.attack_timer[:n], self.attack_cooldown[:n]
+        state = self.state[:n]
+        flying = self.type[:n] == FLYING
+        ground = ~flying
+        px, py = player.x, player.y
+
+        # AI state machine
+        distance = np.abs(x - px)
+        state[:] = np.where((distance < ATTACK_RANGE) & (np.abs(y - py) < 50), ATTACK,
+                            np.where(distance < DETECTION_RANGE, CHASE, PATROL))
+
+        # Hit stun with decaying knockback
+        stunned = hit_stun > 0
+        hit_stun[stunned] -= dt
+        decaying = stunned & (knockback != 0)
+        knockback[decaying] *= 0.9 ** (dt * 60)
+        knockback[decaying & (np.abs(knockback) < 10)] = 0
+        active = hit_stun <= 0
+
+        # Patrol - turn around at the ends of the patrol range
+        patrol = active & (state == PATROL)
+        start_x = self.start_x[:n]
+        turn_right = patrol & (x <= start_x - PATROL_RANGE)
+        turn_left = patrol & ~turn_right & (x >= start_x + PATROL_RANGE)
+        vx[turn_right] = speed[turn_right]
+        facing[turn_right] = True
+        vx[turn_left] = -speed[turn_left]
+        facing[turn_left] = False
+
+        # Flyers bob on a sine wave while patrolling
+        hover = patrol & flying
+        if hover.any():
+            hover_time = self.hover_time[:n]
+            hover_time[hover] += dt
+            offset = HOVER_AMPLITUDE * (1 + np.cos(np.radians(hover_time[hover] * HOVER_SPEED * 60)))
+            target_y = self.start_y[:n][hover] + offset - HOVER_AMPLITUDE
+            vy[hover] = (target_y - y[hover]) * 5
+
+        # Chase
+        chase = active & (state == CHASE)
+        horizontal = np.abs(px - x)
+        player_right = px > x
+
+        air_chase = chase & flying
+        vy[air_chase] = np.clip((py - 50 - y[air_chase]) * 3, -300, 300)
+        air_hold = air_chase & ((py - y) > 60) & (horizontal < 40)
+        air_pursue = air_chase & ~air_hold
+        vx[air_hold] = 0
+        vx[air_pursue] = np.where(player_right[air_pursue], 1.2, -1.2) * speed[air_pursue]
+        facing[air_pursue] = player_right[air_pursue]
+
+        ground_chase = chase & ground
+        ground_hold = ground_chase & ((y - py) > 30) & (horizontal < 40)
+        ground_pursue = ground_chase & ~ground_hold
+        vx[ground_hold] = 0
+        vx[ground_pursue] = np.where(player_right[ground_pursue], 1.0, -1.0) * speed[ground_pursue]
+        facing[ground_pursue] = player_right[ground_pursue]
+
+        # Attack
+        attack = active & (state == ATTACK)
+        vx[attack] = 0
+        start_attack = attack & (attack_cooldown <= 0)
+        attacking[start_attack] = True
+        attack_timer[start_attack] = ATTACK_DURATION
+        attack_cooldown[start_attack] = ATTACK_COOLDOWN
+
+        # No steering during hit stun
+        vx[~active] = 0
+
+        # Gravity (not for flying enemies)
+        vy[ground] = np.minimum(vy[ground] + GRAVITY * dt, MAX_FALL_SPEED)
+
+        # Horizontal movement including knockback
+        x += (vx + knockback) * dt
+        rect_x = x.astype(np.int64)
+        rect_y = y.astype(np.int64)
+
+        # Only platforms within the horde's x-span can be touched; pad by the
+        # widest enemy since push-outs below can move one a body-width sideways
+        pad = int(width.max())
+        left = int(rect_x.min()) - pad
+        span = pygame.Rect(left, 0, int((rect_x + width).max()) + pad - left + 1, 1)
+        platforms = level.platforms_near(span)
+
+        # Horizontal platform collisions (not for flying enemies)
+        if ground.any():
+            for platform in platforms:
+                hit = ground & (rect_x < platform.right) & (rect_x + width > platform.left) \
+                    & (rect_y < platform.bottom) & (rect_y + height > platform.top)
+                if not hit.any():
+                    continue
+                moving_right = hit & (vx > 0)
+                moving_left = hit & (vx < 0)
+                x[moving_right] = platform.left - width[moving_right]
+                vx[moving_right] = -speed[moving_right]
+                facing[moving_right] = False
+                x[moving_left] = platform.right
+                vx[moving_left] = speed[moving_left]
+                facing[moving_left] = True
+                rect_x[hit] = x[hit].astype(np.int64)
+
+        # Boundaries (level edges and death zone)
+        for boundary in level.boundaries:
+            hit = (rect_x < boundary.right) & (rect_x + width > boundary.left) \
+                & (rect_y < boundary.bottom) & (rect_y + height > boundary.top)
+            if not hit.any():
+                continue
+            if boundary.x < 0:
+                x[hit] = 0
+                vx[hit] = speed[hit]
+                facing[hit] = True
+            elif boundary.x >= level.width:
+                x[hit] = level.width - width[hit]
+                vx[hit] = -speed[hit]
+                facing[hit] = False
+            elif boundary.y > 600:
+                self.health[:n][hit] = 0
+            rect_x[hit] = x[hit].astype(np.int64)
+
+        # Vertical movement and platform collisions (not for flying enemies)
+        y += vy * dt
+        rect_y = y.astype(np.int64)
+        if ground.any():
+            for platform in platforms:
+                hit = ground & (rect_x < platform.right) & (rect_x + width > platform.left) \
+                    & (rect_y < platform.bottom) & (rect_y + height > platform.top)
+                if not hit.any():
+                    continue
+                landing = hit & (vy > 0)
+                bumping = hit & (vy < 0)
+                y[landing] = platform.top - height[landing]
+                y[bumping] = platform.bottom
+                vy[landing | bumping] = 0
+                rect_y[hit] = y[hit].astype(np.int64)
+
+        # Attack timers
+        attack_timer[attacking] -= dt
+        attacking[attacking & (attack_timer <= 0)] = False
+        cooling = attack_cooldown > 0
+        attack_cooldown[cooling] -= dt
+
+        # Attack hitbox sits in front of the enemy
+        self.hitbox_x[:n] = np.where(facing, rect_x + width, rect_x - ATTACK_HITBOX_WIDTH)
+        self.hitbox_y[:n] = rect_y + 20
+
+        self.update_animations(dt)
+
+    def update_animations(self, dt):
+        """Pick each enemy's clip and advance its frame timer"""
+        n = self.count
+        anim, frame = self.anim[:n], self.anim_frame[:n]
+        timer, done = self.anim_timer[:n], self.anim_done[:n]
+        types = self.type[:n]
+
+        wanted = np.where(self.attacking[:n], ANIM_ATTACK,
+                          np.where(np.abs(self.vx[:n]) > 0, ANIM_MOVE, ANIM_IDLE))
+        changed = wanted != anim
+        anim[changed] = wanted[changed]
+        frame[changed] = 0
+        timer[changed] = 0
+        done[changed] = False
+
+        lengths = self.clip_lengths[types, anim]
+        loops = self.clip_loops[types, anim]
+        running = ~(done & ~loops)
+        timer[running] += dt
+        advance = running & (timer >= self.clip_durations[types, anim])
+        timer[advance] = 0
+        frame[advance] += 1
+        wrapped = advance & (frame >= lengths)
+        frame[wrapped & loops] = 0
+        ended = wrapped & ~loops
+        frame[ended] = lengths[ended] - 1
+        done[ended] = True
+
+    def render(self, screen, camera_x, alpha=1.0, viewport=None):
+        """Render enemies, interpolated between the last two simulation steps
+        
+        With a viewport only enemies overlapping it are converted and drawn.
+        """
+        n = self.count
+        if n == 0:
+            return
+        render_x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        render_y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        if viewport is None:
+            index = slice(0, n)
+        else:
+            index = np.flatnonzero((render_x + self.width[:n] > viewport.left) & (render_x < viewport.right))
+            viewport.record("enemies", len(index), n)
+            if len(index) == 0:
+                return
+        columns = zip(
+            (render_x[index] - camera_x).astype(np.int64).tolist(), render_y[index].astype(np.int64).tolist(),
+            self.width[index].tolist(), self.height[index].tolist(),
+            self.type[index].tolist(), self.anim[index].tolist(), self.anim_frame[index].tolist(),
+            self.facing_right[index].tolist(), (self.hit_stun[index] > 0).tolist(), self.state[index].tolist(),
+            self.health[index].tolist(), self.max_health[index].tolist(),
+        )
+
+        for screen_x, screen_y, width, height, type_code, anim, frame, facing, stunned, state, health, max_health in columns:
+            # Enemy art faces left; right-facing enemies use the pre-flipped frames
+            clips = self.clip_flipped[type_code] if facing else self.clip_frames[type_code]
+            if clips:
+                # Hit flash uses the cached white variant of the same frame
+                frames = sprite_loader.flashed_frames(clips[anim]) if stunned else clips[anim]
+                sprite = frames[frame]
+
+                sprite_rect = sprite.get_rect()
+                sprite_rect.center = (screen_x + width // 2, screen_y + height // 2)
+                screen.blit(sprite, sprite_rect)
+            else:
+                if stunned:
+                    color = WHITE
+                else:
+                    color = RED if state == ATTACK else YELLOW if state == CHASE else GRAY
+                pygame.draw.rect(screen, color, (screen_x, screen_y, width, height))
+
+            # Health bar
+            bar_width = max(width, 50)
+            bar_x = screen_x + (width - bar_width) // 2
+            pygame.draw.rect(screen, RED, (bar_x, screen_y - 10, bar_width, 5))
+            pygame.draw.rect(screen, GREEN, (bar_x, screen_y - 10, int(bar_width * health / max_health), 5))
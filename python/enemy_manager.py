@@ -1,19 +1,71 @@
 """
 Enemy manager - Handles spawning and managing enemies
 """
+import bisect
+import random
+from collections import deque
 import pygame
-from enemy import Enemy
+from config import *
+from enemy import Enemy, enemy_size
+from pool import ObjectPool, release_dead
+
+def camera_view(level, player, width=SCREEN_WIDTH):
+    """(left, right) world x-range of a camera centred on the player and clamped to the level"""
+    left = max(0, min(player.x - width // 2, level.width - width))
+    return left, left + width
 
 class EnemyManager:
     """Manages all enemies in the level"""
     
-    def __init__(self, audio_manager=None):
-        self.enemies = []
+    def __init__(self, audio_manager=None, backend=ENEMY_BACKEND, rng=None):
+        # "numpy" keeps enemies in a structure-of-arrays EnemyArrays and exposes
+        # thin EnemyView handles in self.enemies; "objects" uses one Enemy each
+        self.arrays = None
+        if backend == "numpy":
+            from enemy_arrays import EnemyArrays
+            self.arrays = EnemyArrays(audio_manager=audio_manager)
+            self.enemies = self.arrays.views
+        else:
+            self.enemies = []
+        self.enemy_pools = {}  # enemy_type -> ObjectPool of Enemy ("objects" backend)
         self.spawn_timer = 0
         self.spawn_interval = 5.0  # Seconds between spawns
         self.flying_spawn_timer = 0
         self.flying_spawn_interval = 8.0  # Spawn flying enemies less frequently
         self.audio_manager = audio_manager
+        self.rng = rng if rng is not None else random.Random()  # Spawn choices
+        
+        # Population budget: timed spawns queue as (offset from player, y, type)
+        # and only enter play while the global and per-type budgets have room
+        self.max_alive = ENEMY_MAX_ALIVE
+        self.type_budget = dict(ENEMY_TYPE_BUDGET)
+        self.spawn_queue = deque(maxlen=ENEMY_SPAWN_QUEUE_MAX)
+        self.despawn_distance = ENEMY_DESPAWN_DISTANCE  # None keeps far enemies
+        self.spawn_wait_steps = 0  # Steps a request spent waiting, summed over requests
+        self.spawns_dropped = 0
+        self.despawned = 0
+        
+        # Simulation level of detail ("objects" backend): full updates on and
+        # near the screen, coarse patrol steps further out, asleep beyond that.
+        # None radii turn it off; the numpy backend always runs at full rate
+        self.full_radius = ENEMY_FULL_RADIUS
+        self.wake_radius = ENEMY_WAKE_RADIUS
+        if self.arrays is not None and (self.full_radius is not None or self.wake_radius is not None):
+            print("Warning: the numpy enemy backend has no level of detail - ENEMY_FULL_RADIUS and "
+                  "ENEMY_WAKE_RADIUS are ignored and every enemy gets full updates")
+        self.lod_steps = {"full": 0, "coarse": 0, "asleep": 0}  # Cumulative enemy-steps
+        
+        # Sort-and-sweep broad phase: enemies kept ordered by rect.left
+        self.sorted_enemies = []
+        self.sorted_lefts = []
+        self.sorted_rights = []
+        self.max_enemy_width = 0
+        self.max_attack_reach = 0
+        
+        # Broad-phase profiling counters (cumulative, see collision_stats)
+        self.pairs_naive = 0
+        self.pairs_tested = 0
+        self.pairs_hit = 0
         
         # Spawn initial enemies
         self.spawn_enemy(400, 500, "BASIC")
@@ -26,44 +78,237 @@ class EnemyManager:
     
     def spawn_enemy(self, x, y, enemy_type="BASIC"):
         """Spawn a new enemy at position"""
-        enemy = Enemy(x, y, enemy_type=enemy_type, audio_manager=self.audio_manager)
-        self.enemies.append(enemy)
+        if self.arrays is not None:
+            enemy = self.arrays.spawn(x, y, enemy_type)
+        else:
+            enemy = self.enemy_pool(enemy_type).acquire(x, y)
+            self.enemies.append(enemy)
+        self.insert_sorted(enemy)
+    
+    def enemy_pool(self, enemy_type):
+        """Pool of recycled Enemy instances of one type"""
+        pool = self.enemy_pools.get(enemy_type)
+        if pool is None:
+            audio_manager = self.audio_manager
+            pool = ObjectPool(lambda x, y: Enemy(x, y, enemy_type=enemy_type, audio_manager=audio_manager))
+            self.enemy_pools[enemy_type] = pool
+        return pool
     
-    def update(self, dt, level, player):
-        """Update all enemies"""
+    def release_enemy(self, enemy):
+        """Hand a removed Enemy back to its pool"""
+        self.enemy_pools[enemy.enemy_type].release(enemy)
+    
+    def update(self, dt, level, player, view=None):
+        """Update all enemies
+        
+        Args:
+            view: (left, right) world x-range the camera shows; defaults to
+                the screen-wide range a camera centred on the player would show
+        """
+        if view is None:
+            view = camera_view(level, player)
         # Update spawn timer for ground enemies
         self.spawn_timer += dt
         if self.spawn_timer >= self.spawn_interval:
             self.spawn_timer = 0
             # Spawn enemy off-screen to the right
-            import random
-            enemy_type = "BASIC" if random.random() < 0.7 else "FAST_BASIC"
-            self.spawn_enemy(player.x + 800, 500, enemy_type)
+            enemy_type = "BASIC" if self.rng.random() < 0.7 else "FAST_BASIC"
+            self.queue_spawn(800, 500, enemy_type)
         
         # Update spawn timer for flying enemies
         self.flying_spawn_timer += dt
         if self.flying_spawn_timer >= self.flying_spawn_interval:
             self.flying_spawn_timer = 0
             # Spawn flying enemy off-screen at random height
-            import random
-            spawn_y = random.randint(200, 400)
-            self.spawn_enemy(player.x + 900, spawn_y, "FLYING")
+            spawn_y = self.rng.randint(200, 400)
+            self.queue_spawn(900, spawn_y, "FLYING")
+        
+        self.drain_spawn_queue(level, player)
+        
+        if self.arrays is not None:
+            # Every enemy in a handful of vectorized passes
+            self.arrays.update(dt, level, player)
+            in_play = self.arrays.in_play(level, view[0], self.despawn_distance)
+            self.despawned += self.arrays.remove_dead(in_play)
+        else:
+            self.update_objects(dt, level, player, view)
+            
+            # Remove dead and out-of-play enemies in place and recycle them; the
+            # player must forget them too, as the same objects will come back
+            # as new spawns
+            def keep(enemy):
+                return enemy.health > 0 and self.in_play(enemy, level, view)
+            
+            def release(enemy):
+                if enemy.health > 0:
+                    self.despawned += 1
+                player.hit_enemies.discard(enemy)
+                self.release_enemy(enemy)
+            release_dead(self.enemies, keep, release)
+        
+        # Re-sort the broad phase for the new positions
+        self.update_broadphase()
+    
+    def update_objects(self, dt, level, player, view=None):
+        """Update each Enemy at the level of detail its distance from the view calls for
+        
+        Distance is measured to the camera's (left, right) view range, so
+        everything on screen gets full updates even where the camera is
+        clamped at a level edge and the player is off-centre.
+        
+        Coarse and sleeping enemies bank their skipped time in lod_debt and
+        spend it in fixed coarse steps, so the result only depends on the
+        step sequence, never on frame timing.
+        """
+        view_left, view_right = view if view is not None else camera_view(level, player)
+        full_radius = self.full_radius if self.full_radius is not None else float("inf")
+        wake_radius = self.wake_radius if self.wake_radius is not None else float("inf")
+        lod_steps = self.lod_steps
+        for enemy in self.enemies:
+            distance = max(view_left - (enemy.x + enemy.width), enemy.x - view_right, 0)
+            if distance > wake_radius:
+                enemy.lod_debt += dt
+                lod_steps["asleep"] += 1
+            elif distance <= full_radius or not enemy.can_coarse_update(level):
+                if enemy.lod_debt:
+                    enemy.catch_up(level, flush=True)
+                enemy.update(dt, level, player)
+                lod_steps["full"] += 1
+            else:
+                enemy.lod_debt += dt
+                enemy.catch_up(level)
+                lod_steps["coarse"] += 1
+    
+    def queue_spawn(self, offset_x, y, enemy_type):
+        """Request a spawn `offset_x` pixels ahead of the player, subject to the budget"""
+        if len(self.spawn_queue) == self.spawn_queue.maxlen:
+            self.spawns_dropped += 1  # deque drops the oldest request
+        self.spawn_queue.append((offset_x, y, enemy_type))
+    
+    def drain_spawn_queue(self, level, player):
+        """Spawn queued enemies, oldest first, while the budget has room
         
-        # Update each enemy
+        Requests that don't fit stay queued in order. A request is placed
+        relative to the player when it is finally spawned, mirrored behind the
+        player if ahead would be outside the level.
+        """
+        if not self.spawn_queue:
+            return
+        counts = {}
         for enemy in self.enemies:
-            enemy.update(dt, level, player)
+            counts[enemy.enemy_type] = counts.get(enemy.enemy_type, 0) + 1
+        alive = len(self.enemies)
+        waiting = []
+        while self.spawn_queue:
+            request = self.spawn_queue.popleft()
+            offset_x, y, enemy_type = request
+            x = player.x + offset_x
+            if x + enemy_size(enemy_type)[0] > level.width:
+                x = player.x - offset_x
+            budget = self.type_budget.get(enemy_type, self.max_alive)
+            if alive >= self.max_alive or counts.get(enemy_type, 0) >= budget or x < 0:
+                self.spawn_wait_steps += 1
+                waiting.append(request)
+                continue
+            self.spawn_enemy(x, y, enemy_type)
+            counts[enemy_type] = counts.get(enemy_type, 0) + 1
+            alive += 1
+        self.spawn_queue.extend(waiting)
+    
+    def in_play(self, enemy, level, view):
+        """False once an enemy is outside the level or far behind the camera
+        
+        Only the trailing (left) edge of the view despawns: enemies ahead of
+        the camera are still waiting for the player to reach them.
+        """
+        rect = enemy.rect
+        if rect.right < 0 or rect.left > level.width or rect.top > level.height:
+            return False
+        return self.despawn_distance is None or rect.right >= view[0] - self.despawn_distance
+    
+    def insert_sorted(self, enemy):
+        """Insert an enemy into the x-sorted broad-phase list"""
+        index = bisect.bisect_right(self.sorted_lefts, enemy.rect.left)
+        self.sorted_lefts.insert(index, enemy.rect.left)
+        self.sorted_rights.insert(index, enemy.rect.right)
+        self.sorted_enemies.insert(index, enemy)
+        self.max_enemy_width = max(self.max_enemy_width, enemy.rect.width)
+        self.max_attack_reach = max(self.max_attack_reach, enemy.attack_hitbox.width)
+    
+    def update_broadphase(self):
+        """Drop removed enemies and restore x-order after movement
+        
+        Enemies only move a few pixels per step, so the list is nearly sorted
+        and Timsort finishes in close to a single linear pass.
+        """
+        if self.arrays is not None:
+            self.sorted_enemies, self.sorted_lefts, self.sorted_rights = self.arrays.sorted_by_left()
+            return
+        live = set(self.enemies)
+        self.sorted_enemies = [e for e in self.sorted_enemies if e in live]
+        self.sorted_enemies.sort(key=lambda e: e.rect.left)
+        self.sorted_lefts = [e.rect.left for e in self.sorted_enemies]
+        self.sorted_rights = [e.rect.right for e in self.sorted_enemies]
+    
+    def enemies_in_x_range(self, left, right):
+        """Enemies whose x-interval overlaps [left, right)
         
-        # Remove dead enemies
-        self.enemies = [e for e in self.enemies if e.health > 0]
+        Only valid until enemies move again, i.e. between update() calls.
+        """
+        # Nothing starting at or before left - max_width can reach past left
+        start = bisect.bisect_right(self.sorted_lefts, left - self.max_enemy_width)
+        end = bisect.bisect_left(self.sorted_lefts, right)
+        rights = self.sorted_rights
+        return [self.sorted_enemies[i] for i in range(start, end) if rights[i] > left]
+    
+    def collision_stats(self):
+        """Broad-phase counters: naive pairs, pairs actually tested and pairs that hit"""
+        return {
+            "pairs_naive": self.pairs_naive,
+            "pairs_tested": self.pairs_tested,
+            "pairs_hit": self.pairs_hit,
+        }
+    
+    def reset_collision_stats(self):
+        """Zero the broad-phase counters"""
+        self.pairs_naive = 0
+        self.pairs_tested = 0
+        self.pairs_hit = 0
+    
+    def store_previous_positions(self):
+        """Snapshot enemy positions for render interpolation"""
+        if self.arrays is not None:
+            self.arrays.store_previous_positions()
+            return
+        for enemy in self.enemies:
+            enemy.store_previous_position()
     
     def remove_enemy(self, enemy):
-        """Remove an enemy"""
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
+        """Remove an enemy (recycled, so drop any other references to it)"""
+        if self.arrays is not None:
+            self.arrays.remove(enemy)
+        elif enemy in self.enemies:
+            index = self.enemies.index(enemy)
+            self.enemies[index] = self.enemies[-1]
+            self.enemies.pop()
+            self.release_enemy(enemy)
+        if enemy in self.sorted_enemies:
+            index = self.sorted_enemies.index(enemy)
+            del self.sorted_enemies[index]
+            del self.sorted_lefts[index]
+            del self.sorted_rights[index]
     
     def reset(self):
         """Reset all enemies"""
-        self.enemies.clear()
+        if self.arrays is not None:
+            self.arrays.clear()
+        else:
+            for enemy in self.enemies:
+                self.release_enemy(enemy)
+            self.enemies.clear()
+        self.sorted_enemies.clear()
+        self.sorted_lefts.clear()
+        self.sorted_rights.clear()
         self.spawn_enemy(400, 500, "BASIC")
         self.spawn_enemy(700, 500, "BASIC")
         self.spawn_enemy(1000, 500, "BASIC")
@@ -71,8 +316,34 @@ class EnemyManager:
         self.spawn_enemy(1200, 250, "FLYING")
         self.spawn_timer = 0
         self.flying_spawn_timer = 0
+        self.spawn_queue.clear()
     
-    def render(self, screen, camera_x):
-        """Render all enemies"""
-        for enemy in self.enemies:
-            enemy.render(screen, camera_x)
+    def population_stats(self):
+        """Spawn budget counters (cumulative)"""
+        return {
+            "spawn_wait_steps": self.spawn_wait_steps,
+            "spawns_dropped": self.spawns_dropped,
+            "despawned": self.despawned,
+            "spawn_queue": len(self.spawn_queue),
+            "lod_full_steps": self.lod_steps["full"],
+            "lod_coarse_steps": self.lod_steps["coarse"],
+            "lod_asleep_steps": self.lod_steps["asleep"],
+        }
+    
+    def pool_stats(self):
+        """Enemy pool counters per type ("objects" backend)"""
+        return {f"enemy_{enemy_type.lower()}": pool.stats() for enemy_type, pool in self.enemy_pools.items()}
+    
+    def render(self, screen, camera_x, alpha=1.0, viewport=None):
+        """Render enemies, only those overlapping the viewport when one is given"""
+        if self.arrays is not None:
+            self.arrays.render(screen, camera_x, alpha, viewport)
+            return
+        if viewport is None:
+            visible = self.enemies
+        else:
+            # The broad-phase order is still valid since the last update()
+            visible = self.enemies_in_x_range(viewport.left, viewport.right)
+            viewport.record("enemies", len(visible), len(self.enemies))
+        for enemy in visible:
+            enemy.render(screen, camera_x, alpha)
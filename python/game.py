@@ -1,22 +1,34 @@
 """
 Game class - Main game controller
 """
+import zlib
 import pygame
+from config import *
 from player import Player
 from level import Level
 from enemy_manager import EnemyManager
 from ui import UI
-from visual_effects import DamageNumber, HitSpark
+from visual_effects import DamageNumber, ParticleSystem
 from audio_manager import AudioManager
+from text_cache import text_cache
+from viewport import Viewport
+from pool import ObjectPool, release_dead
+from profiler import FrameProfiler
+from rng import new_seed, subsystem_seed, subsystem_rng
 
 class Game:
     """Main game controller"""
     
-    def __init__(self, screen, width, height):
+    def __init__(self, screen, width, height, enemy_backend=ENEMY_BACKEND, profile_csv=None, seed=None):
         self.screen = screen
         self.width = width
         self.height = height
         
+        # Every random draw comes from a per-subsystem stream of this seed,
+        # so a session replays exactly from its seed and inputs
+        self.seed = new_seed() if seed is None else seed
+        self.camera_rng = subsystem_rng(self.seed, "camera")
+        
         # Initialize audio
         self.audio_manager = AudioManager()
         
@@ -30,24 +42,37 @@ class Game:
         self.screen_shake_intensity = 0
         self.hit_pause_timer = 0
         self.damage_numbers = []
-        self.hit_sparks = []
+        self.damage_number_pool = ObjectPool(DamageNumber)
+        self.particles = ParticleSystem(seed=subsystem_seed(self.seed, "particles"))
         
         # Font for damage numbers
-        self.damage_font = pygame.font.Font(None, 24)
+        self.damage_font = text_cache.font(24)
         
         # Initialize game components
         self.player = Player(198, 468, audio_manager=self.audio_manager)  # Spawn on left platform to avoid ground hazards
         self.level = Level(width, height)
-        self.enemy_manager = EnemyManager(audio_manager=self.audio_manager)
+        self.enemy_manager = EnemyManager(audio_manager=self.audio_manager, backend=enemy_backend,
+                                          rng=subsystem_rng(self.seed, "enemy_spawns"))
         self.ui = UI(width, height)
         
         # Camera
         self.camera_x = 0
+        self.prev_camera_x = 0
+        self.viewport = Viewport(width, height)
+        
+        # Per-phase frame timings (F3 toggles the overlay)
+        self.profiler = FrameProfiler(csv_path=profile_csv)
+        
+        # Static screen currently presented (None = next render must redraw)
+        self.presented_key = None
         
     def handle_event(self, event):
         """Handle input events"""
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
+            if event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+                self.invalidate()
+            elif event.key == pygame.K_ESCAPE:
                 if self.state == "PLAYING":
                     self.state = "PAUSED"
                     self.audio_manager.play_sound('pause')
@@ -87,6 +112,11 @@ class Game:
         if self.state != "PLAYING":
             return
         
+        # Snapshot positions so render can interpolate between simulation steps
+        self.player.store_previous_position()
+        self.enemy_manager.store_previous_positions()
+        self.prev_camera_x = self.camera_x
+        
         # Update visual effect timers
         if self.screen_shake_timer > 0:
             self.screen_shake_timer -= dt
@@ -94,39 +124,51 @@ class Game:
             self.hit_pause_timer -= dt
             return  # Pause game during hit pause
         
+        profiler = self.profiler
+        
         # Update damage numbers and effects
-        self.damage_numbers = [dn for dn in self.damage_numbers if dn.is_alive()]
-        for dn in self.damage_numbers:
-            dn.update(dt)
-            
-        self.hit_sparks = [hs for hs in self.hit_sparks if hs.is_alive()]
-        for hs in self.hit_sparks:
-            hs.update(dt)
+        with profiler.phase("update.effects"):
+            release_dead(self.damage_numbers, DamageNumber.is_alive, self.damage_number_pool.release)
+            for dn in self.damage_numbers:
+                dn.update(dt)
+                
+            self.particles.update(dt)
         
         # Pass enemy list to player for upward strike detection
         self.player._current_enemies = self.enemy_manager.enemies
         
         # Update player
-        self.player.update(dt, self.level)
+        with profiler.phase("update.player"):
+            self.player.update(dt, self.level)
         
         # Update enemies
-        self.enemy_manager.update(dt, self.level, self.player)
+        with profiler.phase("update.enemies"):
+            self.enemy_manager.update(dt, self.level, self.player, (self.camera_x, self.camera_x + self.width))
         
         # Check collisions
-        self.check_collisions()
+        with profiler.phase("update.collisions"):
+            self.check_collisions()
         
         # Update camera to follow player
-        self.update_camera()
+        with profiler.phase("update.camera"):
+            self.update_camera()
         
     def check_collisions(self):
         """Check for collisions between game objects"""
+        enemy_manager = self.enemy_manager
+        
         # Player attacks hitting enemies
         if self.player.is_attacking:
             to_remove = []
-            for enemy in list(self.enemy_manager.enemies):
+            hitbox = self.player.attack_hitbox
+            enemy_manager.pairs_naive += len(enemy_manager.enemies)
+            # Broad phase: only enemies whose x-interval overlaps the hitbox
+            for enemy in enemy_manager.enemies_in_x_range(hitbox.left, hitbox.right):
                 # Only hit each enemy once per attack
                 if enemy not in self.player.hit_enemies:
-                    if self.player.attack_hitbox.colliderect(enemy.rect):
+                    enemy_manager.pairs_tested += 1
+                    if hitbox.colliderect(enemy.rect):
+                        enemy_manager.pairs_hit += 1
                         # Mark enemy as hit
                         self.player.hit_enemies.add(enemy)
                         
@@ -141,7 +183,7 @@ class Game:
                         
                         # Create visual effects
                         is_critical = self.player.combo_count >= 3
-                        damage_num = DamageNumber(
+                        damage_num = self.damage_number_pool.acquire(
                             enemy.x + enemy.width // 2,
                             enemy.y,
                             damage,
@@ -149,11 +191,10 @@ class Game:
                         )
                         self.damage_numbers.append(damage_num)
                         
-                        hit_spark = HitSpark(
+                        self.particles.emit_burst(
                             enemy.x + enemy.width // 2,
                             enemy.y + enemy.height // 2
                         )
-                        self.hit_sparks.append(hit_spark)
                         
                         # Visual feedback
                         self.screen_shake_timer = 0.1
@@ -169,11 +210,20 @@ class Game:
         
             # Remove defeated enemies after processing to avoid mutation during iteration
             for enemy in to_remove:
-                self.enemy_manager.remove_enemy(enemy)
+                enemy_manager.remove_enemy(enemy)
+                self.player.hit_enemies.discard(enemy)
         
-        # Enemy attacks hitting player
-        for enemy in self.enemy_manager.enemies:
-            if enemy.is_attacking and enemy.attack_hitbox.colliderect(self.player.rect):
+        # Enemy attacks hitting player - an enemy's hitbox extends at most
+        # max_attack_reach beyond its body, so widen the sweep by that much
+        player_rect = self.player.rect
+        reach = enemy_manager.max_attack_reach
+        enemy_manager.pairs_naive += len(enemy_manager.enemies)
+        for enemy in enemy_manager.enemies_in_x_range(player_rect.left - reach, player_rect.right + reach):
+            if not enemy.is_attacking:
+                continue
+            enemy_manager.pairs_tested += 1
+            if enemy.attack_hitbox.colliderect(player_rect):
+                enemy_manager.pairs_hit += 1
                 self.player.take_damage(enemy.attack_damage)
                 
                 # Screen shake on player hit
@@ -197,48 +247,115 @@ class Game:
         
         # Apply screen shake
         if self.screen_shake_timer > 0:
-            import random
-            shake_x = random.randint(-int(self.screen_shake_intensity), int(self.screen_shake_intensity))
+            shake_x = self.camera_rng.randint(-int(self.screen_shake_intensity), int(self.screen_shake_intensity))
             self.camera_x += shake_x
     
-    def render(self):
-        """Render the game"""
+    def interpolated_camera_x(self, alpha):
+        """Camera position blended between the last two simulation steps"""
+        return self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha
+    
+    def state_checksum(self):
+        """CRC of the simulation state, for checking that a replay matched its recording"""
+        player = self.player
+        state = [self.state, self.score, self.lives, self.camera_x,
+                 player.x, player.y, player.velocity_x, player.velocity_y, player.health]
+        for enemy in self.enemy_manager.enemies:
+            state.append((enemy.enemy_type, enemy.x, enemy.y, enemy.health))
+        return f"{zlib.crc32(repr(state).encode('utf-8')):08x}"
+    
+    def pool_stats(self):
+        """Object pool counters by pool name"""
+        stats = {"damage_numbers": self.damage_number_pool.stats()}
+        stats.update(self.enemy_manager.pool_stats())
+        return stats
+    
+    def static_screen_key(self):
+        """Identity of the current screen if it can only change through input, else None"""
+        if self.state == "MENU":
+            return ("MENU",)
+        elif self.state == "PAUSED":
+            return ("PAUSED", self.score, self.lives)
+        elif self.state == "GAME_OVER":
+            return ("GAME_OVER", self.score)
+        return None
+    
+    def is_idle(self):
+        """True while a static screen is already presented and nothing will change it"""
+        key = self.static_screen_key()
+        return key is not None and key == self.presented_key
+    
+    def invalidate(self):
+        """Force the next render to redraw (e.g. the window was exposed)"""
+        self.presented_key = None
+    
+    def render(self, alpha=1.0):
+        """Render the game
+        
+        Args:
+            alpha: Fraction of a simulation step elapsed since the last update,
+                used to interpolate entity positions (1.0 = latest state)
+        
+        Returns:
+            True if a new frame was drawn and should be presented; False when
+            a static screen (menu, pause, game over) is already up to date.
+            Frames are all-or-nothing: the camera scrolls every gameplay
+            frame, so there are no partial dirty rects worth tracking.
+        """
+        key = self.static_screen_key()
+        if key is not None and key == self.presented_key:
+            return False
+        self.presented_key = key
+        
         self.screen.fill((50, 150, 200))  # Sky blue background
         
         if self.state == "MENU":
             self.render_menu()
         elif self.state == "PLAYING":
-            self.render_game()
+            self.render_game(alpha)
         elif self.state == "PAUSED":
-            self.render_game()
+            self.render_game(alpha)
             self.render_pause()
         elif self.state == "GAME_OVER":
             self.render_game_over()
+        return True
     
     def render_menu(self):
         """Render main menu"""
         self.ui.render_menu(self.screen)
     
-    def render_game(self):
+    def render_game(self, alpha=1.0):
         """Render gameplay"""
+        camera_x = self.interpolated_camera_x(alpha)
+        profiler = self.profiler
+        
+        self.viewport.begin_frame(camera_x)
+        
         # Render level (with camera offset)
-        self.level.render(self.screen, self.camera_x)
+        with profiler.phase("render.level"):
+            self.level.render(self.screen, camera_x, self.viewport)
         
         # Render enemies
-        self.enemy_manager.render(self.screen, self.camera_x)
+        with profiler.phase("render.enemies"):
+            self.enemy_manager.render(self.screen, camera_x, alpha, self.viewport)
         
         # Render player
-        self.player.render(self.screen, self.camera_x)
+        with profiler.phase("render.player"):
+            self.player.render(self.screen, camera_x, alpha)
         
-        # Render visual effects
-        for spark in self.hit_sparks:
-            spark.render(self.screen, self.camera_x)
-            
-        for damage_num in self.damage_numbers:
-            damage_num.render(self.screen, self.camera_x, self.damage_font)
+        # Render visual effects - damage numbers are narrow, so their
+        # origin plus the viewport margin is enough to cull on
+        with profiler.phase("render.effects"):
+            self.particles.render(self.screen, camera_x, self.viewport)
+                
+            for damage_num in self.viewport.cull("damage_numbers", self.damage_numbers, lambda d: (d.x, d.x)):
+                damage_num.render(self.screen, camera_x, self.damage_font)
         
         # Render UI
-        self.ui.render_hud(self.screen, self.player.health, self.lives, self.score, self.player)
+        with profiler.phase("render.hud"):
+            self.ui.render_hud(self.screen, self.player.health, self.lives, self.score, self.player)
+        
+        # Timing overlay last, outside the phases it reports on
+        profiler.render_overlay(self.screen)
     
     def render_pause(self):
         """Render pause overlay"""
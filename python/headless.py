@@ -0,0 +1,304 @@
+"""
+Headless simulation runner - steps the game without a window or frame limiter
+"""
+import os
+import json
+import time
+import pygame
+from config import *
+from sprite_loader import sprite_loader
+from text_cache import text_cache
+
+# Keys the game actually reads, by script name
+KEY_NAMES = {
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "a": pygame.K_a,
+    "d": pygame.K_d,
+    "space": pygame.K_SPACE,
+    "x": pygame.K_x,
+    "z": pygame.K_z,
+    "return": pygame.K_RETURN,
+    "escape": pygame.K_ESCAPE,
+}
+KEY_CODES = {code: name for name, code in KEY_NAMES.items()}
+
+
+class KeyState:
+    """Indexable key state, mirrors the object returned by pygame.key.get_pressed()"""
+
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedInput:
+    """Feeds a scripted or recorded key event stream to the game
+
+    The stream is a list of [frame, action, key] entries where action is
+    "down", "up" or "click". Keys stay held from their "down" until their
+    "up", and every "down" is also delivered to Game.handle_event as a
+    KEYDOWN; a "click" is a left MOUSEBUTTONDOWN (its key is ignored).
+
+    Streams saved by InputRecorder also carry the session seed, its length in
+    frames, the final state checksum and the settings that checksum depends
+    on (enemy backend and physics rate), so a replay can verify itself.
+    """
+
+    def __init__(self, events, seed=None, frames=None, checksum=None, enemy_backend=None, physics_hz=None):
+        self.events_by_frame = {}
+        for frame, action, key in events:
+            code = None if action == "click" else KEY_NAMES[key]
+            self.events_by_frame.setdefault(int(frame), []).append((action, code))
+        self.held = set()
+        self.keys = KeyState(self.held)
+        self.seed = seed
+        self.frames = frames
+        self.checksum = checksum
+        self.enemy_backend = enemy_backend
+        self.physics_hz = physics_hz
+
+    @classmethod
+    def load(cls, path):
+        """Load an input stream from a JSON file"""
+        with open(path, "r") as f:
+            data = json.load(f)
+        return cls(data["events"], seed=data.get("seed"), frames=data.get("frames"),
+                   checksum=data.get("checksum"), enemy_backend=data.get("enemy_backend"),
+                   physics_hz=data.get("physics_hz"))
+
+    def settings_mismatch(self, enemy_backend=None):
+        """Why this recording can't reproduce its checksum with these settings, or None"""
+        if self.physics_hz is not None and self.physics_hz != PHYSICS_HZ:
+            return f"recorded at {self.physics_hz} Hz physics, this build steps at {PHYSICS_HZ} Hz"
+        if enemy_backend is not None and self.enemy_backend is not None and enemy_backend != self.enemy_backend:
+            return f"recorded with the {self.enemy_backend} enemy backend, not {enemy_backend}"
+        return None
+
+    def get_pressed(self):
+        """Current held keys, in the same shape as pygame.key.get_pressed()"""
+        return self.keys
+
+    def events_for_frame(self, frame):
+        """Apply this frame's key changes and return the matching pygame events"""
+        events = []
+        for action, key in self.events_by_frame.get(frame, ()):
+            if action == "down":
+                self.held.add(key)
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+            elif action == "click":
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0)))
+            else:
+                self.held.discard(key)
+                events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+        return events
+
+
+class InputRecorder:
+    """Records a live session as a ScriptedInput stream
+
+    Used as the player's input source while recording, so the game sees
+    exactly the held-key state that is written out rather than a separate
+    pygame.key.get_pressed() sample. Events are stamped with the index of the
+    next simulation step, i.e. the step they are delivered before.
+    """
+
+    def __init__(self, seed, enemy_backend=ENEMY_BACKEND):
+        self.seed = seed
+        self.enemy_backend = enemy_backend
+        self.events = []
+        self.held = set()
+        self.keys = KeyState(self.held)
+
+    def get_pressed(self):
+        """Held keys as recorded, in the same shape as pygame.key.get_pressed()"""
+        return self.keys
+
+    def record_event(self, frame, event):
+        """Record an event delivered before simulation step `frame`, if the game reads it"""
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key in KEY_CODES:
+            if event.type == pygame.KEYDOWN:
+                self.held.add(event.key)
+                self.events.append([frame, "down", KEY_CODES[event.key]])
+            else:
+                self.held.discard(event.key)
+                self.events.append([frame, "up", KEY_CODES[event.key]])
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.events.append([frame, "click", None])
+
+    def save(self, path, frames, checksum):
+        """Write the stream with the seed, length, final state checksum and the settings it depends on"""
+        data = {"seed": self.seed, "frames": frames, "checksum": checksum,
+                "enemy_backend": self.enemy_backend, "physics_hz": PHYSICS_HZ, "events": self.events}
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def default_script(frames, hz=PHYSICS_HZ):
+    """Built-in soak script: start, run right, attack, jump and Shadow Strike on a rhythm"""
+    def steps(seconds):
+        return max(1, int(round(seconds * hz)))
+
+    attack_every = steps(1 / 3)
+    jump_every = steps(1.5)
+    special_every = steps(2.5)
+    turn_every = steps(10)
+    events = [[0, "down", "return"], [1, "up", "return"], [1, "down", "right"]]
+    for frame in range(2, frames):
+        if frame % attack_every == 0:
+            events.append([frame, "down", "x"])
+            events.append([frame + 1, "up", "x"])
+        if frame % jump_every == jump_every // 2:
+            events.append([frame, "down", "space"])
+            events.append([frame + steps(0.1), "up", "space"])
+        if frame % special_every == special_every // 2:
+            events.append([frame, "down", "z"])
+            events.append([frame + 1, "up", "z"])
+        # Turn around every 10 seconds so we don't just pin against the right wall
+        if frame % (2 * turn_every) == 0:
+            events.append([frame, "up", "right"])
+            events.append([frame, "down", "left"])
+        elif frame % (2 * turn_every) == turn_every:
+            events.append([frame, "up", "left"])
+            events.append([frame, "down", "right"])
+    return events
+
+
+def run_headless(frames, script_path=None, render=False, restart=True, enemy_backend=None,
+                 profile_csv=None, seed=None):
+    """Step Game.update for a fixed number of frames as fast as possible
+
+    Each frame is one fixed simulation step of PHYSICS_DT seconds.
+
+    Args:
+        frames: Number of simulation steps to run
+        script_path: Optional JSON input stream; the built-in soak script is used otherwise
+        render: Also call Game.render each frame (still never presents)
+        restart: Start a new game whenever the player runs out of lives
+        enemy_backend: "objects" or "numpy" EnemyManager backend; defaults to the
+            script's recorded backend, else ENEMY_BACKEND
+        profile_csv: Optional path to write per-frame phase timings to
+        seed: Session seed; defaults to the script's recorded seed, else a fixed 0
+
+    Returns:
+        Dict of run statistics
+    """
+    # Must be set before pygame initializes its video/audio subsystems; forced,
+    # since a desktop session's own driver settings would open a real window
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    script = ScriptedInput.load(script_path) if script_path else ScriptedInput(default_script(frames))
+    if seed is None:
+        seed = script.seed if script.seed is not None else 0
+    if enemy_backend is None:
+        enemy_backend = script.enemy_backend or ENEMY_BACKEND
+
+    from game import Game
+    game = Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT, enemy_backend=enemy_backend, profile_csv=profile_csv,
+                seed=seed)
+    game.player.input_source = script
+
+    dt = PHYSICS_DT
+    stats = {
+        "frames": frames,
+        "seed": seed,
+        "enemy_backend": enemy_backend,
+        "restarts": 0,
+        "peak_enemies": 0,
+        "peak_damage_numbers": 0,
+        "peak_particles": 0,
+    }
+    drawn = {}
+    culled = {}
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        for event in script.events_for_frame(frame):
+            game.handle_event(event)
+
+        if restart and game.state == "GAME_OVER":
+            game.start_game()
+            stats["restarts"] += 1
+
+        game.update(dt)
+        if render:
+            game.render()
+            if game.state == "PLAYING":
+                for category, (count, skipped) in game.viewport.stats().items():
+                    drawn[category] = drawn.get(category, 0) + count
+                    culled[category] = culled.get(category, 0) + skipped
+        game.profiler.end_frame()
+
+        stats["peak_enemies"] = max(stats["peak_enemies"], len(game.enemy_manager.enemies))
+        stats["peak_damage_numbers"] = max(stats["peak_damage_numbers"], len(game.damage_numbers))
+        stats["peak_particles"] = max(stats["peak_particles"], len(game.particles))
+    elapsed = time.perf_counter() - start
+
+    stats["wall_seconds"] = elapsed
+    stats["simulated_seconds"] = frames * dt
+    stats["frames_per_second"] = frames / elapsed if elapsed > 0 else float("inf")
+    stats["final_score"] = game.score
+    stats["checksum"] = game.state_checksum()
+    replayed = script.checksum is not None and script.frames == frames
+    if replayed:
+        stats["replay_matched"] = stats["checksum"] == script.checksum
+    stats.update(game.enemy_manager.collision_stats())
+    stats.update(game.enemy_manager.population_stats())
+    sprite_cache = sprite_loader.cache_stats()
+    stats["sprite_cache_hits"] = sprite_cache["hits"]
+    stats["sprite_cache_misses"] = sprite_cache["misses"]
+    text = text_cache.stats()
+    stats["text_cache_hits"] = text["hits"]
+    stats["text_cache_misses"] = text["misses"]
+    stats["ui_widget_redraws"] = game.ui.widget_redraws()
+    pools = game.pool_stats()
+    for name, pool in pools.items():
+        stats[f"pool_{name}_high_water"] = pool["high_water"]
+        stats[f"pool_{name}_created"] = pool["created"]
+    phases = game.profiler.summary()
+    for name, (_, avg, p99) in phases.items():
+        stats[f"phase_{name}_avg_ms"] = avg
+        stats[f"phase_{name}_p99_ms"] = p99
+    for category in drawn:
+        stats[f"drawn_{category}"] = drawn[category]
+        stats[f"culled_{category}"] = culled[category]
+
+    print("Headless run complete")
+    print(f"  Frames:              {frames} ({stats['simulated_seconds']:.1f}s simulated in {elapsed:.2f}s wall)")
+    print(f"  Simulated FPS:       {stats['frames_per_second']:.1f}")
+    print(f"  Peak enemies:        {stats['peak_enemies']}")
+    print(f"  Peak damage numbers: {stats['peak_damage_numbers']}")
+    print(f"  Peak particles:      {stats['peak_particles']} ({game.particles.dropped} dropped)")
+    print(f"  Despawned enemies:   {stats['despawned']} ({stats['spawns_dropped']} queued spawns dropped)")
+    print(f"  Enemy LOD steps:     {stats['lod_full_steps']} full / {stats['lod_coarse_steps']} coarse / "
+          f"{stats['lod_asleep_steps']} asleep")
+    print(f"  Restarts:            {stats['restarts']}")
+    print(f"  Final score:         {stats['final_score']}")
+    print(f"  Seed / checksum:     {seed} / {stats['checksum']} ({enemy_backend} enemies)")
+    if replayed:
+        print(f"  Replay:              {'matched recording' if stats['replay_matched'] else 'DIVERGED from recording'}")
+    print(f"  Collision pairs:     {stats['pairs_tested']} tested / {stats['pairs_hit']} hit "
+          f"(naive: {stats['pairs_naive']})")
+    print(f"  Sprite cache:        {stats['sprite_cache_hits']} hits / {stats['sprite_cache_misses']} misses")
+    print(f"  Text cache:          {stats['text_cache_hits']} hits / {stats['text_cache_misses']} misses")
+    print(f"  UI widget redraws:   {stats['ui_widget_redraws']}")
+    for name, pool in pools.items():
+        label = f"Pool {name.replace('_', ' ')}:"
+        print(f"  {label:<20} high-water {pool['high_water']}, {pool['created']} created")
+    for category in drawn:
+        label = f"Culled {category.replace('_', ' ')}:"
+        print(f"  {label:<20} {culled[category]} of {drawn[category] + culled[category]} draws")
+    for name, (_, avg, p99) in phases.items():
+        if name != "frame" and avg > 0:
+            label = f"Phase {name}:"
+            print(f"  {label:<20} avg {avg:.3f} ms, p99 {p99:.3f} ms (last {len(game.profiler.frame_times)} frames)")
+
+    game.profiler.close_csv()
+
+    pygame.quit()
+    return stats
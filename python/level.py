@@ -1,9 +1,49 @@
 """
 Level class - Handles platforms and level layout
 """
+import math
 import pygame
 from config import *
 
+LAYER_COLORKEY = (1, 0, 1)  # Transparent key for baked layers, unused by the level art
+
+class SpatialHash:
+    """Static spatial hash that buckets rects by x-column for fast neighbour queries"""
+    
+    def __init__(self, rects, cell_size=LEVEL_GRID_CELL_SIZE):
+        self.rects = rects
+        self.cell_size = cell_size
+        self.cells = {}  # column -> tuple of rects overlapping it, in original order
+        self.cell_indices = {}  # column -> indices of those rects
+        
+        for index, rect in enumerate(rects):
+            first, last = self.column_range(rect)
+            for column in range(first, last + 1):
+                self.cells.setdefault(column, []).append(rect)
+                self.cell_indices.setdefault(column, []).append(index)
+        
+        # Single-column queries hand these out directly, so make them immutable
+        self.cells = {column: tuple(cell) for column, cell in self.cells.items()}
+    
+    def column_range(self, rect):
+        """First and last column a rect overlaps"""
+        first = rect.left // self.cell_size
+        last = max(first, (rect.right - 1) // self.cell_size)
+        return first, last
+    
+    def query(self, rect):
+        """Tuple of the rects in every column the given rect overlaps, in original order"""
+        first, last = self.column_range(rect)
+        if first == last:
+            return self.cells.get(first, ())
+        
+        # Spanning several columns - merge without duplicates, keeping order
+        indices = set()
+        for column in range(first, last + 1):
+            indices.update(self.cell_indices.get(column, ()))
+        return tuple(self.rects[i] for i in sorted(indices))
+
+
 class Level:
     """Game level with platforms and decorations"""
     
@@ -20,6 +60,13 @@ class Level:
         # Create platforms
         self.create_platforms()
         self.create_boundaries()
+        
+        # Collision index - static, so built once
+        self.build_spatial_index()
+        
+        # Pre-rendered art, rebuilt only when the level changes
+        self.screen_width = screen_width
+        self.bake_layers()
     
     def create_platforms(self):
         """Create a simplified platform layout (evenly spaced static platforms)"""
@@ -83,71 +130,126 @@ class Level:
         # Death zone below level
         self.boundaries.append(pygame.Rect(0, 650, self.width, 50))
     
+    def build_spatial_index(self):
+        """(Re)build the spatial hashes over platforms and boundaries"""
+        self.platform_grid = SpatialHash(self.platforms)
+        self.boundary_grid = SpatialHash(self.boundaries)
+    
+    def platforms_near(self, rect):
+        """Platforms that share a grid column with rect (superset of those it can touch)"""
+        return self.platform_grid.query(rect)
+    
+    def boundaries_near(self, rect):
+        """Boundaries that share a grid column with rect"""
+        return self.boundary_grid.query(rect)
+    
     def check_collision(self, rect, velocity_y):
         """Check if rect collides with platforms"""
-        for platform in self.platforms:
+        for platform in self.platforms_near(rect):
             if rect.colliderect(platform):
                 if velocity_y > 0:  # Falling
                     return True, platform.top
         return False, 0
     
-    def render(self, screen, camera_x):
-        """Render the level"""
-        # Cyberpunk sky gradient - dark purple to magenta
+    def bake_layers(self):
+        """Pre-render the static level art into one cached surface per parallax factor
+        
+        Called at construction and again by render() after mark_dirty(), so the
+        sky gradient, mountains, clouds, platforms and walls are drawn once per
+        level change instead of once per frame.
+        """
+        self.sky_layer = pygame.Surface((self.screen_width, 400))
+        self.draw_sky(self.sky_layer)
+        if pygame.display.get_surface() is not None:
+            self.sky_layer = self.sky_layer.convert()
+        
+        # Each layer covers only the bounding box of what is drawn on it
+        mountain_bounds = pygame.Rect(0, 0, 0, 0).unionall(
+            [pygame.Rect(m['x'], m['y'] - m['height'], m['width'] + 1, m['height'] + 1)
+             for m in self.mountains])
+        self.layers = [(0.2, self.bake_surface(mountain_bounds, self.draw_mountains), mountain_bounds)]
+        for layer, parallax in ((1, 0.3), (2, 0.5)):
+            clouds = [c for c in self.clouds if c['layer'] == layer]
+            bounds = pygame.Rect(0, 0, 0, 0).unionall(
+                [pygame.Rect(c['x'], c['y'] - c['height'] * 0.2 - 1,
+                             c['width'] * 1.1 + 2, c['height'] * 1.2 + 2) for c in clouds])
+            draw = lambda surface, ox, oy, clouds=clouds: self.draw_clouds(surface, ox, oy, clouds)
+            self.layers.append((parallax, self.bake_surface(bounds, draw), bounds))
+        platform_bounds = self.platforms[0].unionall(self.platforms[1:])
+        self.layers.append((1.0, self.bake_surface(platform_bounds, self.draw_platforms), platform_bounds))
+        
+        # Both edge walls look the same, so one wall sprite is blitted per wall
+        self.wall_layer = self.bake_surface(pygame.Rect(0, 0, 50, self.height),
+                                            lambda surface, ox, oy: self.draw_wall(surface, ox))
+        self.layers_dirty = False
+    
+    def mark_dirty(self):
+        """Flag the baked layers for rebuilding after platforms or decorations change"""
+        self.layers_dirty = True
+    
+    def bake_surface(self, bounds, draw):
+        """Run draw(surface, offset_x, offset_y) once onto a colorkeyed surface the size of bounds"""
+        surface = pygame.Surface(bounds.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(LAYER_COLORKEY)
+        draw(surface, -bounds.x, -bounds.y)
+        surface.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+        return surface
+    
+    def draw_sky(self, surface):
+        """Cyberpunk sky gradient - dark purple to magenta"""
         for y in range(0, 400, 20):
             ratio = y / 400
             # Deep purple at top to hot magenta at horizon
             r = int(25 + (138 - 25) * ratio)
             g = int(0 + (43 - 0) * ratio)
             b = int(51 + (226 - 51) * ratio)
-            pygame.draw.rect(screen, (r, g, b), (0, y, SCREEN_WIDTH, 20))
-        
-        # Draw distant mountains (parallax layer 0.2x)
+            pygame.draw.rect(surface, (r, g, b), (0, y, surface.get_width(), 20))
+    
+    def draw_mountains(self, surface, offset_x, offset_y):
+        """Distant mountain silhouettes in level coordinates shifted by the offset"""
         for mountain in self.mountains:
-            screen_x = mountain['x'] - (camera_x * 0.2)
-            if -mountain['width'] < screen_x < SCREEN_WIDTH:
-                # Mountain peak as triangle
-                peak_x = screen_x + mountain['width'] // 2
-                peak_y = mountain['y'] - mountain['height']
-                base_left = screen_x
-                base_right = screen_x + mountain['width']
-                base_y = mountain['y']
-                
-                # Mountain silhouette (dark cyan-purple)
-                points = [(peak_x, peak_y), (base_left, base_y), (base_right, base_y)]
-                pygame.draw.polygon(screen, (20, 30, 60), points)
-                
-                # Neon cyan peak glow (top 20% of mountain)
-                snow_height = mountain['height'] * 0.2
-                snow_left_x = peak_x - snow_height * 0.5
-                snow_right_x = peak_x + snow_height * 0.5
-                snow_y = peak_y + snow_height
-                snow_points = [(peak_x, peak_y), (snow_left_x, snow_y), (snow_right_x, snow_y)]
-                pygame.draw.polygon(screen, (0, 255, 255), snow_points)
-        
-        # Draw clouds with parallax
-        for cloud in self.clouds:
-            # Different parallax speeds for different layers
-            parallax = 0.3 if cloud['layer'] == 1 else 0.5
-            screen_x = cloud['x'] - (camera_x * parallax)
+            # Mountain peak as triangle
+            base_left = mountain['x'] + offset_x
+            peak_x = base_left + mountain['width'] // 2
+            peak_y = mountain['y'] - mountain['height'] + offset_y
+            base_right = base_left + mountain['width']
+            base_y = mountain['y'] + offset_y
             
-            if -cloud['width'] < screen_x < SCREEN_WIDTH:
-                # Draw clouds as neon pink/purple vapor
-                color = (255, 0, 200) if cloud['layer'] == 1 else (200, 0, 255)
-                # Main cloud body
-                pygame.draw.ellipse(screen, color, 
-                                  (screen_x, cloud['y'], cloud['width'], cloud['height']))
-                # Additional puffs for depth
-                pygame.draw.ellipse(screen, color, 
-                                  (screen_x + cloud['width'] * 0.2, cloud['y'] - cloud['height'] * 0.2, 
-                                   cloud['width'] * 0.5, cloud['height'] * 0.8))
-                pygame.draw.ellipse(screen, color, 
-                                  (screen_x + cloud['width'] * 0.5, cloud['y'] - cloud['height'] * 0.15, 
-                                   cloud['width'] * 0.6, cloud['height'] * 0.9))
-        
-        # Draw platforms
+            # Mountain silhouette (dark cyan-purple)
+            points = [(peak_x, peak_y), (base_left, base_y), (base_right, base_y)]
+            pygame.draw.polygon(surface, (20, 30, 60), points)
+            
+            # Neon cyan peak glow (top 20% of mountain)
+            snow_height = mountain['height'] * 0.2
+            snow_left_x = peak_x - snow_height * 0.5
+            snow_right_x = peak_x + snow_height * 0.5
+            snow_y = peak_y + snow_height
+            snow_points = [(peak_x, peak_y), (snow_left_x, snow_y), (snow_right_x, snow_y)]
+            pygame.draw.polygon(surface, (0, 255, 255), snow_points)
+    
+    def draw_clouds(self, surface, offset_x, offset_y, clouds):
+        """Neon vapor clouds in level coordinates shifted by the offset"""
+        for cloud in clouds:
+            x = cloud['x'] + offset_x
+            y = cloud['y'] + offset_y
+            color = (255, 0, 200) if cloud['layer'] == 1 else (200, 0, 255)
+            # Main cloud body
+            pygame.draw.ellipse(surface, color, (x, y, cloud['width'], cloud['height']))
+            # Additional puffs for depth
+            pygame.draw.ellipse(surface, color, 
+                              (x + cloud['width'] * 0.2, y - cloud['height'] * 0.2, 
+                               cloud['width'] * 0.5, cloud['height'] * 0.8))
+            pygame.draw.ellipse(surface, color, 
+                              (x + cloud['width'] * 0.5, y - cloud['height'] * 0.15, 
+                               cloud['width'] * 0.6, cloud['height'] * 0.9))
+    
+    def draw_platforms(self, surface, offset_x, offset_y):
+        """Ground and floating platforms in level coordinates shifted by the offset"""
         for platform in self.platforms:
-            screen_x = platform.x - camera_x
+            x = platform.x + offset_x
+            y = platform.y + offset_y
             
             # Different colors for ground vs floating platforms
             if platform.y >= 580:
@@ -156,27 +258,27 @@ class Level:
                 neon_cyan = (0, 255, 255)  # Bright cyan
                 
                 # Draw dark base
-                pygame.draw.rect(screen, base_dark,
-                               (screen_x, platform.y + 8, platform.width, platform.height - 8))
+                pygame.draw.rect(surface, base_dark,
+                               (x, y + 8, platform.width, platform.height - 8))
                 
                 # Draw cyan energy layer
-                pygame.draw.rect(screen, (0, 100, 120),
-                               (screen_x, platform.y, platform.width, 8))
+                pygame.draw.rect(surface, (0, 100, 120),
+                               (x, y, platform.width, 8))
                 
                 # Add neon grid lines
                 for i in range(0, platform.width, 8):
                     # Draw vertical neon lines
-                    blade_x = screen_x + i
-                    pygame.draw.line(screen, neon_cyan, 
-                                   (blade_x + 2, platform.y + 7), 
-                                   (blade_x + 2, platform.y + 2), 2)
-                    pygame.draw.line(screen, neon_cyan,
-                                   (blade_x + 5, platform.y + 7),
-                                   (blade_x + 5, platform.y + 3), 2)
+                    blade_x = x + i
+                    pygame.draw.line(surface, neon_cyan, 
+                                   (blade_x + 2, y + 7), 
+                                   (blade_x + 2, y + 2), 2)
+                    pygame.draw.line(surface, neon_cyan,
+                                   (blade_x + 5, y + 7),
+                                   (blade_x + 5, y + 3), 2)
                 
                 # Bright cyan top edge
-                pygame.draw.rect(screen, neon_cyan,
-                               (screen_x, platform.y, platform.width, 2))
+                pygame.draw.rect(surface, neon_cyan,
+                               (x, y, platform.width, 2))
             else:
                 # Floating platforms - holographic purple/magenta
                 base_purple = (60, 20, 80)
@@ -184,51 +286,80 @@ class Level:
                 neon_magenta = (255, 0, 255)
                 
                 # Main platform body
-                pygame.draw.rect(screen, base_purple,
-                               (screen_x, platform.y, platform.width, platform.height))
+                pygame.draw.rect(surface, base_purple,
+                               (x, y, platform.width, platform.height))
                 
                 # Neon magenta edge on top
-                pygame.draw.rect(screen, neon_magenta,
-                               (screen_x, platform.y, platform.width, 3))
+                pygame.draw.rect(surface, neon_magenta,
+                               (x, y, platform.width, 3))
                 
                 # Dark shadow/depth
                 if platform.height > 10:
-                    pygame.draw.rect(screen, dark_purple,
-                                   (screen_x, platform.y + 3, platform.width, platform.height - 3))
+                    pygame.draw.rect(surface, dark_purple,
+                                   (x, y + 3, platform.width, platform.height - 3))
                 
                 # Bright magenta highlight
                 highlight_color = (200, 50, 255)
-                pygame.draw.rect(screen, highlight_color,
-                               (screen_x, platform.y, platform.width, 2))
+                pygame.draw.rect(surface, highlight_color,
+                               (x, y, platform.width, 2))
             
             # Platform outline - neon cyan glow
-            pygame.draw.rect(screen, (0, 255, 255),
-                           (screen_x, platform.y, platform.width, platform.height), 2)
+            pygame.draw.rect(surface, (0, 255, 255),
+                           (x, y, platform.width, platform.height), 2)
+    
+    def draw_wall(self, surface, x):
+        """Neon magenta barrier with warning stripes"""
+        for i in range(0, self.height, 40):
+            color = (255, 0, 150) if (i // 40) % 2 == 0 else (150, 0, 100)
+            pygame.draw.rect(surface, color, (x, i, 50, 40))
+        # Outline
+        pygame.draw.rect(surface, (255, 0, 255), (x, 0, 50, self.height), 3)
+    
+    def render(self, screen, camera_x, viewport=None):
+        """Render the level by blitting the visible slice of each baked layer
+        
+        Args:
+            viewport: Optional Viewport that receives drawn/culled counts
+        """
+        if self.layers_dirty:
+            self.bake_layers()
+        view_width = screen.get_width()
+        
+        screen.blit(self.sky_layer, (0, 0))
         
-        # Draw boundaries (visual indicators)
+        # Mountains (0.2x), far clouds (0.3x), near clouds (0.5x), platforms (1.0x)
+        layers_drawn = 0
+        for parallax, surface, bounds in self.layers:
+            src_x = math.ceil(camera_x * parallax) - bounds.x
+            if src_x >= bounds.width or src_x + view_width <= 0:
+                continue
+            # ceil matches the truncation of x - camera_x * parallax the art
+            # used to be drawn at; a slice starting left of the layer (shake
+            # at the left edge) is started at 0 and moved right instead
+            dest_x = max(0, -src_x)
+            screen.blit(surface, (dest_x, bounds.y), (src_x + dest_x, 0, view_width - dest_x, bounds.height))
+            layers_drawn += 1
+        
+        # Draw boundaries (visual indicators) - the death zone stays invisible
+        walls_drawn = walls = 0
         for boundary in self.boundaries:
-            screen_x = int(boundary.x - camera_x)
-            
-            # Only draw if visible on screen
-            if -100 < screen_x < screen.get_width() + 100:
-                # Left wall (neon magenta barrier)
-                if boundary.x < 0:
-                    # Draw warning stripes
-                    for i in range(0, self.height, 40):
-                        color = (255, 0, 150) if (i // 40) % 2 == 0 else (150, 0, 100)
-                        pygame.draw.rect(screen, color,
-                                       (screen_x, i, 50, 40))
-                    # Outline
-                    pygame.draw.rect(screen, (255, 0, 255),
-                                   (screen_x, 0, 50, self.height), 3)
-                
-                # Right wall (neon magenta barrier)
-                elif boundary.x >= self.width:
-                    # Draw warning stripes
-                    for i in range(0, self.height, 40):
-                        color = (255, 0, 150) if (i // 40) % 2 == 0 else (150, 0, 100)
-                        pygame.draw.rect(screen, color,
-                                       (screen_x, i, 50, 40))
-                    # Outline
-                    pygame.draw.rect(screen, (255, 0, 255),
-                                   (screen_x, 0, 50, self.height), 3)
+            if boundary.x < 0 or boundary.x >= self.width:
+                walls += 1
+                screen_x = int(boundary.x - camera_x)
+                if -100 < screen_x < view_width + 100:
+                    if screen_x < 0 or screen_x + 50 > view_width:
+                        # pygame outlines the clipped rect, so a wall straddling
+                        # the screen edge (shake) is drawn live to keep that edge
+                        self.draw_wall(screen, screen_x)
+                    else:
+                        screen.blit(self.wall_layer, (screen_x, 0))
+                    walls_drawn += 1
+        
+        if viewport is not None:
+            viewport.record("layers", layers_drawn, len(self.layers))
+            viewport.record("walls", walls_drawn, walls)
+            # Platforms are part of the 1.0x layer, so only the visible slice
+            # of them is ever blitted; count them through the collision grid
+            view = pygame.Rect(int(camera_x), 0, view_width, self.height)
+            visible = sum(1 for p in self.platforms_near(view) if view.colliderect(p))
+            viewport.record("platforms", visible, len(self.platforms))
@@ -2,12 +2,53 @@
 Skunked: Way of the Spray - 2D Beat 'em Up Platformer
 Main game entry point
 """
+import argparse
 import pygame
 import sys
 from game import Game
+from config import PHYSICS_DT, MAX_PHYSICS_STEPS, IDLE_WAIT_MS, ENEMY_BACKEND
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Skunked: Way of the Spray")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run the simulation without a window or frame limiter and report throughput")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="Number of fixed simulation steps to run in headless mode (default: 3600)")
+    parser.add_argument("--script", default=None,
+                        help="JSON input stream to feed in headless mode (default: built-in soak script)")
+    parser.add_argument("--render", action="store_true",
+                        help="Also run Game.render each headless frame (never presented)")
+    parser.add_argument("--enemy-backend", choices=("objects", "numpy"), default=None,
+                        help=f"Enemy simulation backend (default: recorded backend when replaying, else {ENEMY_BACKEND})")
+    parser.add_argument("--profile-csv", default=None, metavar="PATH",
+                        help="Write per-frame phase timings (ms) to a CSV file")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Session random seed (default: recorded seed when replaying, else random; 0 headless)")
+    parser.add_argument("--record", default=None, metavar="PATH",
+                        help="Record this session's seed and inputs to a JSON file for --replay")
+    parser.add_argument("--replay", default=None, metavar="PATH",
+                        help="Replay a --record file headlessly and check it reproduces the same final state")
+    return parser.parse_args(argv)
 
 def main():
     """Initialize and run the game"""
+    args = parse_args()
+    if args.replay:
+        from headless import ScriptedInput, run_headless
+        recording = ScriptedInput.load(args.replay)
+        mismatch = recording.settings_mismatch(args.enemy_backend)
+        if mismatch:
+            sys.exit(f"Cannot replay {args.replay}: {mismatch}")
+        run_headless(recording.frames, script_path=args.replay, render=args.render, restart=False,
+                     enemy_backend=args.enemy_backend, profile_csv=args.profile_csv, seed=args.seed)
+        sys.exit()
+    if args.headless:
+        from headless import run_headless
+        run_headless(args.frames, script_path=args.script, render=args.render,
+                     enemy_backend=args.enemy_backend, profile_csv=args.profile_csv, seed=args.seed)
+        sys.exit()
+
     pygame.init()
     
     # Game configuration
@@ -20,27 +61,65 @@ def main():
     pygame.display.set_caption("Skunked: Way of the Spray - Ninja Skunk")
     
     # Initialize game
-    game = Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
+    enemy_backend = args.enemy_backend or ENEMY_BACKEND
+    game = Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT, enemy_backend=enemy_backend,
+                profile_csv=args.profile_csv, seed=args.seed)
     clock = pygame.time.Clock()
     
-    # Game loop
+    recorder = None
+    if args.record:
+        from headless import InputRecorder
+        recorder = InputRecorder(game.seed, enemy_backend)
+        game.player.input_source = recorder
+    step = 0  # Simulation steps taken, the recording's time base
+
+    # Game loop - fixed-step simulation, variable-rate rendering
     running = True
+    accumulator = 0.0
     while running:
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
+        if game.is_idle():
+            # Static screen already presented - sleep until input arrives
+            events = [pygame.event.wait(IDLE_WAIT_MS)] + pygame.event.get()
+            clock.tick()  # Idle time is not simulation backlog
+            frame_time = 0.0
+            accumulator = 0.0
+        else:
+            frame_time = clock.tick(FPS) / 1000.0  # Wall time since last frame in seconds
+            events = pygame.event.get()
         
         # Handle events
-        for event in pygame.event.get():
+        for event in events:
+            if event.type == pygame.NOEVENT:
+                continue
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                game.invalidate()  # Window contents were lost, repaint
+            if recorder:
+                recorder.record_event(step, event)
             game.handle_event(event)
         
-        # Update game state
-        game.update(dt)
+        # Step the simulation in fixed increments
+        accumulator += frame_time
+        steps = 0
+        while accumulator >= PHYSICS_DT and steps < MAX_PHYSICS_STEPS:
+            game.update(PHYSICS_DT)
+            accumulator -= PHYSICS_DT
+            steps += 1
+            step += 1
+        if steps == MAX_PHYSICS_STEPS:
+            # Too far behind (stall, GC pause) - drop the backlog instead of spiralling
+            accumulator = min(accumulator, PHYSICS_DT)
         
-        # Render
-        game.render()
-        pygame.display.flip()
+        # Render, interpolating between the last two simulation states, and
+        # present the whole frame - or skip presenting an unchanged static screen
+        if game.render(accumulator / PHYSICS_DT):
+            pygame.display.flip()
+            game.profiler.end_frame()
     
+    game.profiler.close_csv()
+    if recorder:
+        recorder.save(args.record, step, game.state_checksum())
     pygame.quit()
     sys.exit()
 
@@ -17,6 +17,10 @@ class Player:
         self.height = 64
         self.rect = pygame.Rect(x, y, self.width, self.height)
         
+        # Position at the previous simulation step (for render interpolation)
+        self.prev_x = x
+        self.prev_y = y
+        
         # Character stats (Ninja Skunk)
         self.name = CHARACTER["name"]
         self.max_health = CHARACTER["health"]
@@ -81,7 +85,8 @@ class Player:
         self.animation_frame = 0
         self.animation_timer = 0
         
-        # Input
+        # Input (None reads the live keyboard; headless runs plug in a scripted source)
+        self.input_source = None
         self.keys = pygame.key.get_pressed()
     
     def load_sprites(self):
@@ -146,9 +151,17 @@ class Player:
             elif event.key == pygame.K_z:
                 self.special_attack()
     
+    def store_previous_position(self):
+        """Remember the current position before the next simulation step"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
     def update(self, dt, level):
         """Update player state"""
-        self.keys = pygame.key.get_pressed()
+        if self.input_source:
+            self.keys = self.input_source.get_pressed()
+        else:
+            self.keys = pygame.key.get_pressed()
         
         # Update timers
         if self.coyote_timer > 0:
@@ -211,8 +224,13 @@ class Player:
             self.x += self.velocity_x * dt
             self.rect.x = int(self.x)
         
+        # Only platforms/boundaries near us can collide; pad by our width since
+        # push-outs below can move us up to one body-width sideways
+        search_rect = self.rect.inflate(self.width * 2, 0)
+        nearby_platforms = level.platforms_near(search_rect)
+        
         # Check horizontal collisions with platforms
-        for platform in level.platforms:
+        for platform in nearby_platforms:
             if self.rect.colliderect(platform):
                 # Push out of platform
                 if self.velocity_x > 0:  # Moving right
@@ -222,7 +240,7 @@ class Player:
                 self.rect.x = int(self.x)
         
         # Check boundaries (level edges)
-        for boundary in level.boundaries:
+        for boundary in level.boundaries_near(search_rect):
             if self.rect.colliderect(boundary):
                 # Left wall
                 if boundary.x < 0:
@@ -245,7 +263,7 @@ class Player:
         self.on_ground = False
         just_landed = False
         
-        for platform in level.platforms:
+        for platform in nearby_platforms:
             # Check with slight tolerance to prevent flickering
             feet_rect = pygame.Rect(self.rect.x, self.rect.bottom - 2, self.rect.width, 4)
             if feet_rect.colliderect(platform) and self.velocity_y >= 0:
@@ -450,16 +468,20 @@ class Player:
         """Reset player to starting state"""
         self.x = 100
         self.y = 500
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.health = self.max_health
         self.velocity_x = 0
         self.velocity_y = 0
         self.is_attacking = False
     
-    def render(self, screen, camera_x):
-        """Render the player"""
+    def render(self, screen, camera_x, alpha=1.0):
+        """Render the player, interpolated between the last two simulation steps"""
         # Calculate screen position with smooth rounding
-        screen_x = round(self.x - camera_x)
-        screen_y = round(self.y)
+        render_x = self.prev_x + (self.x - self.prev_x) * alpha
+        render_y = self.prev_y + (self.y - self.prev_y) * alpha
+        screen_x = round(render_x - camera_x)
+        screen_y = round(render_y)
         
         # Flicker during invulnerability
         if self.invulnerable_timer > 0:
@@ -473,10 +495,8 @@ class Player:
             # Use pre-cached sprite to avoid any transformations per frame
             sprite = self.idle_sprite_flipped if not self.facing_right else self.idle_sprite
         elif self.animations and self.current_anim:
-            sprite = self.current_anim.get_current_frame()
-            # Flip sprite if facing left
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
+            # Pre-flipped frame when facing left, no per-frame transform
+            sprite = self.current_anim.get_current_frame(self.facing_right)
         else:
             sprite = None
         
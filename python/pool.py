@@ -0,0 +1,61 @@
+"""
+Object pools - reuse transient game objects instead of reallocating them
+"""
+
+class ObjectPool:
+    """Free-list pool; recycled objects are re-initialized through their reset() method
+    
+    acquire(*args) calls factory(*args) only when the free list is empty, so
+    the pooled type's reset() must take the same arguments as its constructor.
+    """
+    
+    def __init__(self, factory):
+        self.factory = factory
+        self.free = []
+        self.created = 0
+        self.in_use = 0
+        self.high_water = 0  # Most objects live at once
+    
+    def acquire(self, *args):
+        """Get a recycled (reset) or new object"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+        else:
+            obj = self.factory(*args)
+            self.created += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+    
+    def release(self, obj):
+        """Return an object to the free list"""
+        self.in_use -= 1
+        self.free.append(obj)
+    
+    def stats(self):
+        """Pool counters for profiling"""
+        return {
+            "created": self.created,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+        }
+
+
+def release_dead(items, is_alive, release):
+    """Swap-remove every item failing is_alive from the list in place
+    
+    Order is not preserved; each removed item is passed to release().
+    """
+    i = 0
+    while i < len(items):
+        item = items[i]
+        if is_alive(item):
+            i += 1
+            continue
+        last = items.pop()
+        if i < len(items):
+            items[i] = last
+        release(item)
@@ -0,0 +1,148 @@
+"""
+Frame profiler - per-phase timings, on-screen overlay and CSV export
+"""
+import csv
+import time
+from collections import deque
+import pygame
+from config import *
+from text_cache import text_cache
+
+# Phases in overlay and CSV column order
+UPDATE_PHASES = ("update.effects", "update.player", "update.enemies", "update.collisions", "update.camera")
+RENDER_PHASES = ("render.level", "render.enemies", "render.player", "render.effects", "render.hud")
+PHASES = UPDATE_PHASES + RENDER_PHASES
+
+
+class _PhaseTimer:
+    """Context manager adding the wall time of its block to one phase"""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.current[self.name] += time.perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    """Accumulates phase timings per frame and keeps the last `history` frames
+
+    Game code wraps each phase in `with profiler.phase(name):`; a phase can run
+    several times per frame (one update per fixed simulation step), so its
+    times are summed until end_frame() closes the frame. Each closed frame is
+    pushed into a per-phase ring buffer and, when a CSV path is set, written
+    out as one row of milliseconds.
+    """
+
+    def __init__(self, phases=PHASES, history=PROFILER_HISTORY, csv_path=None):
+        self.phases = phases
+        self.history = {name: deque(maxlen=history) for name in phases}
+        self.frame_times = deque(maxlen=history)
+        self.current = dict.fromkeys(phases, 0.0)
+        self.timers = {name: _PhaseTimer(self, name) for name in phases}
+        self.frame_count = 0
+        self.last_frame_end = time.perf_counter()
+        self.overlay_visible = False
+        self.overlay_surface = None
+        self.overlay_frame = None  # frame_count the overlay surface was built at
+
+        self.csv_file = None
+        self.csv_writer = None
+        if csv_path:
+            self.open_csv(csv_path)
+
+    def phase(self, name):
+        """Timer for `with profiler.phase(name):` blocks (reused, not allocated)"""
+        return self.timers[name]
+
+    def end_frame(self):
+        """Close the current frame, recording its phase totals and wall time"""
+        now = time.perf_counter()
+        frame_time = now - self.last_frame_end
+        self.last_frame_end = now
+        self.frame_times.append(frame_time)
+
+        current = self.current
+        for name in self.phases:
+            self.history[name].append(current[name])
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(
+                [self.frame_count, f"{frame_time * 1000:.4f}"]
+                + [f"{current[name] * 1000:.4f}" for name in self.phases]
+            )
+        for name in self.phases:
+            current[name] = 0.0
+        self.frame_count += 1
+
+    def summary(self):
+        """(min, avg, p99) in milliseconds per phase over the buffered frames, plus "frame" """
+        series = dict(self.history)
+        series["frame"] = self.frame_times
+        result = {}
+        for name, samples in series.items():
+            if not samples:
+                result[name] = (0.0, 0.0, 0.0)
+                continue
+            ordered = sorted(samples)
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+            result[name] = (ordered[0] * 1000, sum(ordered) / len(ordered) * 1000, p99 * 1000)
+        return result
+
+    def open_csv(self, path):
+        """Start streaming one row per frame to a CSV file"""
+        self.close_csv()
+        self.csv_file = open(path, "w", newline="")
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(["frame", "frame_ms"] + [f"{name}_ms" for name in self.phases])
+
+    def close_csv(self):
+        """Flush and close the CSV file, if one is open"""
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen timing table"""
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_frame = None
+
+    def render_overlay(self, screen):
+        """Draw the timing table, rebuilt every PROFILER_OVERLAY_REFRESH frames"""
+        if not self.overlay_visible:
+            return
+        if self.overlay_frame is None or self.frame_count - self.overlay_frame >= PROFILER_OVERLAY_REFRESH:
+            self.overlay_surface = self.build_overlay()
+            self.overlay_frame = self.frame_count
+        screen.blit(self.overlay_surface, (10, 10))
+
+    def build_overlay(self):
+        """Render the min/avg/p99 table onto a translucent panel"""
+        size = 20
+        font = text_cache.font(size)
+        summary = self.summary()
+        rows = [("phase (ms)", "min", "avg", "p99")]
+        for name in ("frame",) + self.phases:
+            rows.append((name,) + tuple(f"{value:.2f}" for value in summary[name]))
+
+        # The default font is proportional, so lay the table out in columns;
+        # own surfaces rather than text_cache ones as the numbers change every rebuild
+        name_width = 150
+        column_width = 60
+        panel = pygame.Surface((name_width + 3 * column_width + 16, len(rows) * size + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, (name, *values) in enumerate(rows):
+            y = 6 + i * size
+            panel.blit(font.render(name, True, WHITE), (8, y))
+            for j, value in enumerate(values):
+                surface = font.render(value, True, WHITE)
+                right = 8 + name_width + (j + 1) * column_width
+                panel.blit(surface, (right - surface.get_width(), y))
+        return panel
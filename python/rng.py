@@ -0,0 +1,24 @@
+"""
+Seeded random streams - one per subsystem so whole sessions can be replayed exactly
+"""
+import random
+import zlib
+
+
+def new_seed():
+    """Fresh session seed for runs that were not given one"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def subsystem_seed(seed, name):
+    """Stable 32-bit seed for one named subsystem of a session
+
+    Each subsystem draws from its own stream, so adding a random call in one
+    place does not shift the numbers every other subsystem sees.
+    """
+    return (seed ^ zlib.crc32(name.encode("utf-8"))) & 0xFFFFFFFF
+
+
+def subsystem_rng(seed, name):
+    """random.Random for one named subsystem of a session"""
+    return random.Random(subsystem_seed(seed, name))
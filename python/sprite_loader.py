@@ -5,12 +5,38 @@ import pygame
 import os
 
 class SpriteLoader:
-    """Utility class for loading and managing sprites"""
+    """Utility class for loading and managing sprites
+    
+    Sprite sheets are decoded once per process: frames are cached in
+    self.sprites keyed by (path, frame_width, frame_height, num_frames, scale),
+    so every later request for the same sheet is a dict lookup. Use the
+    module-level sprite_loader instance so the cache is shared.
+    """
     
     def __init__(self):
-        self.sprites = {}
+        self.sprites = {}  # Frame cache, see load_spritesheet
+        self.flipped = {}  # id(frames) -> (frames, mirrored frames)
+        self.flashed = {}  # id(frames) -> (frames, hit-flash frames)
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.base_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sprites")
     
+    def cache_stats(self):
+        """Frame cache counters for profiling"""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "sheets": len(self.sprites),
+        }
+    
+    def clear_cache(self):
+        """Drop every cached sheet (e.g. after the display is recreated)"""
+        self.sprites.clear()
+        self.flipped.clear()
+        self.flashed.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
     def load_sprite(self, path, scale=None):
         """Load a single sprite image"""
         try:
@@ -26,6 +52,36 @@ class SpriteLoader:
             surf.fill((255, 0, 255))  # Magenta to indicate missing sprite
             return surf
     
+    def flipped_frames(self, frames):
+        """Horizontally mirrored copies of a frame list, built once per list
+        
+        Keyed on the list's identity, so every Animation made from the same
+        cached sheet shares one set of mirrored surfaces.
+        """
+        entry = self.flipped.get(id(frames))
+        if entry is None or entry[0] is not frames:
+            # Hold a reference to frames so its id can't be reused while cached
+            entry = (frames, [pygame.transform.flip(frame, True, False) for frame in frames])
+            self.flipped[id(frames)] = entry
+        return entry[1]
+    
+    def flashed_frames(self, frames):
+        """White hit-flash copies of a frame list, built the first time it's needed
+        
+        Cached like flipped_frames, so a stunned enemy is a plain blit instead
+        of a copy and additive fill every frame.
+        """
+        entry = self.flashed.get(id(frames))
+        if entry is None or entry[0] is not frames:
+            flashed = []
+            for frame in frames:
+                flash = frame.copy()
+                flash.fill((255, 255, 255, 180), special_flags=pygame.BLEND_RGB_ADD)
+                flashed.append(flash)
+            entry = (frames, flashed)
+            self.flashed[id(frames)] = entry
+        return entry[1]
+    
     def load_spritesheet(self, path, frame_width, frame_height, num_frames, scale=None):
         """Load a sprite sheet and split it into frames
         
@@ -40,7 +96,24 @@ class SpriteLoader:
             frame_height: Height of each frame in pixels
             num_frames: Number of frames in the sheet (horizontal)
             scale: Optional tuple (width, height) to scale each frame
+        
+        Returns:
+            List of frame surfaces, shared with every other caller asking for
+            the same sheet/frame size/scale - treat it as read-only.
         """
+        key = (path, frame_width, frame_height, num_frames, tuple(scale) if scale else None)
+        frames = self.sprites.get(key)
+        if frames is not None:
+            self.cache_hits += 1
+            return frames
+        
+        self.cache_misses += 1
+        frames = self._decode_spritesheet(path, frame_width, frame_height, num_frames, scale)
+        self.sprites[key] = frames
+        return frames
+    
+    def _decode_spritesheet(self, path, frame_width, frame_height, num_frames, scale=None):
+        """Read a sheet from disk and cut it into frames (uncached)"""
         try:
             full_path = os.path.join(self.base_path, path)
             sheet = pygame.image.load(full_path).convert_alpha()
@@ -103,10 +176,17 @@ class SpriteLoader:
 
 
 class Animation:
-    """Handles sprite animation"""
+    """Handles sprite animation
     
-    def __init__(self, frames, frame_duration=0.1, loop=True):
+    Both orientations are prepared at load time: faces_right says which way
+    the source art looks, and get_current_frame(facing_right) returns the
+    matching pre-flipped frame so nothing is flipped while rendering.
+    """
+    
+    def __init__(self, frames, frame_duration=0.1, loop=True, faces_right=True):
         self.frames = frames
+        self.flipped_frames = sprite_loader.flipped_frames(frames)
+        self.faces_right = faces_right
         self.frame_duration = frame_duration
         self.loop = loop
         self.current_frame = 0
@@ -130,9 +210,21 @@ class Animation:
                     self.current_frame = len(self.frames) - 1
                     self.finished = True
     
-    def get_current_frame(self):
-        """Get the current frame image"""
-        return self.frames[self.current_frame]
+    def get_current_frame(self, facing_right=None, flash=False):
+        """Get the current frame image
+        
+        Args:
+            facing_right: Desired facing; the mirrored frame is returned when it
+                disagrees with the art (None = as drawn)
+            flash: Return the cached white hit-flash variant
+        """
+        if facing_right is None or facing_right == self.faces_right:
+            frames = self.frames
+        else:
+            frames = self.flipped_frames
+        if flash:
+            frames = sprite_loader.flashed_frames(frames)
+        return frames[self.current_frame]
     
     def reset(self):
         """Reset animation to start"""
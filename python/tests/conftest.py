@@ -0,0 +1,9 @@
+"""
+Shared pytest setup - puts the game modules on sys.path and keeps pygame headless
+"""
+import os
+import sys
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,82 @@
+"""
+Sort-and-sweep broad phase (EnemyManager.enemies_in_x_range) against the naive all-pairs scan
+"""
+import random
+
+import pygame
+import pytest
+
+from config import *
+from enemy_manager import EnemyManager
+from level import Level
+from player import Player
+
+ENEMY_TYPES = ("BASIC", "FAST_BASIC", "FLYING")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    # Sprite loading converts surfaces, which needs a display mode
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    yield
+    pygame.quit()
+
+
+def random_layout(backend, seed):
+    rng = random.Random(seed)
+    manager = EnemyManager(backend=backend, rng=random.Random(seed))
+    manager.despawn_distance = None
+    for _ in range(120):
+        manager.spawn_enemy(rng.randint(0, 2900), rng.randint(200, 520), rng.choice(ENEMY_TYPES))
+    return rng, manager
+
+
+def player_hits(manager, hitbox):
+    """Enemies the player's attack hitbox touches: swept, then naive"""
+    swept = [e for e in manager.enemies_in_x_range(hitbox.left, hitbox.right) if hitbox.colliderect(e.rect)]
+    naive = [e for e in manager.enemies if hitbox.colliderect(e.rect)]
+    return set(swept), set(naive)
+
+
+def enemy_hits(manager, player_rect):
+    """Attacking enemies whose hitbox touches the player: swept (widened by reach), then naive"""
+    reach = manager.max_attack_reach
+    candidates = manager.enemies_in_x_range(player_rect.left - reach, player_rect.right + reach)
+    swept = [e for e in candidates if e.is_attacking and e.attack_hitbox.colliderect(player_rect)]
+    naive = [e for e in manager.enemies if e.is_attacking and e.attack_hitbox.colliderect(player_rect)]
+    return set(swept), set(naive)
+
+
+@pytest.mark.parametrize("backend", ["objects", "numpy"])
+def test_sweep_matches_naive_for_random_hitboxes(backend):
+    rng, manager = random_layout(backend, seed=11)
+    manager.update_broadphase()
+    for _ in range(400):
+        hitbox = pygame.Rect(rng.randint(-100, 3000), rng.randint(150, 600), rng.randint(1, 250), rng.randint(1, 120))
+        swept, naive = player_hits(manager, hitbox)
+        assert swept == naive
+
+
+@pytest.mark.parametrize("backend", ["objects", "numpy"])
+def test_sweep_matches_naive_while_enemies_move_and_attack(backend):
+    rng, manager = random_layout(backend, seed=5)
+    level = Level(SCREEN_WIDTH, SCREEN_HEIGHT)
+    player = Player(1500, 500)
+    attacks_seen = 0
+    for step in range(360):
+        if step % 60 == 0:
+            player.x = rng.randint(100, 2800)
+            player.rect.x = int(player.x)
+        manager.update(PHYSICS_DT, level, player)
+
+        swept, naive = enemy_hits(manager, player.rect)
+        assert swept == naive
+        attacks_seen += len(naive)
+
+        facing = 1 if step % 2 else -1
+        hitbox = pygame.Rect(player.rect.centerx + (0 if facing > 0 else -90), player.rect.y, 90, player.rect.height)
+        swept, naive = player_hits(manager, hitbox)
+        assert swept == naive
+    # The layout is crowded enough that some enemy attacks actually land
+    assert attacks_seen > 0
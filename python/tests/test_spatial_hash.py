@@ -0,0 +1,52 @@
+"""
+SpatialHash queries against a brute-force scan
+"""
+import random
+
+import pygame
+
+from level import SpatialHash
+
+CELL_SIZE = 64
+
+
+def random_rect(rng):
+    return pygame.Rect(rng.randint(-200, 2000), rng.randint(0, 700), rng.randint(0, 400), rng.randint(0, 60))
+
+
+def columns(rect):
+    first = rect.left // CELL_SIZE
+    return set(range(first, max(first, (rect.right - 1) // CELL_SIZE) + 1))
+
+
+def brute_force(rects, query):
+    """Rects sharing at least one grid column with query, in original order"""
+    wanted = columns(query)
+    return [rect for rect in rects if columns(rect) & wanted]
+
+
+def test_query_matches_brute_force():
+    rng = random.Random(3)
+    rects = [random_rect(rng) for _ in range(200)]
+    grid = SpatialHash(rects, CELL_SIZE)
+    for _ in range(500):
+        query = random_rect(rng)
+        result = grid.query(query)
+        assert list(result) == brute_force(rects, query)
+        # The broad phase may over-report but never miss a real overlap
+        assert all(rect in result for rect in rects if rect.colliderect(query))
+
+
+def test_query_result_cannot_corrupt_the_index():
+    rects = [pygame.Rect(10, 0, 20, 20), pygame.Rect(30, 0, 20, 20)]
+    grid = SpatialHash(rects, CELL_SIZE)
+    single_column = pygame.Rect(0, 0, 10, 10)
+    result = grid.query(single_column)
+    assert isinstance(result, tuple)
+    assert list(grid.query(single_column)) == rects
+    assert grid.query(pygame.Rect(0, 0, 200, 10)) == tuple(rects)
+
+
+def test_query_outside_every_column_is_empty():
+    grid = SpatialHash([pygame.Rect(0, 0, 50, 50)], CELL_SIZE)
+    assert grid.query(pygame.Rect(1000, 0, 10, 10)) == ()
@@ -0,0 +1,117 @@
+"""
+Text rendering cache - shared fonts and pre-rendered text surfaces
+"""
+from collections import OrderedDict
+import pygame
+
+
+ALPHA_STEPS = 16  # Distinct fade levels cached per text surface
+
+
+class TextCache:
+    """Caches Font objects by size and rendered text surfaces by (text, size, color)
+
+    Surfaces are shared between callers and must never be modified; faded
+    variants for blit(alpha=...) are cached alongside them with the alpha
+    quantized to ALPHA_STEPS levels. The surface cache is LRU-bounded because
+    HUD strings such as scores change over a session.
+
+    Fonts belong to one pygame.font session: the cache empties itself on
+    pygame.quit() (through a quit hook) and whenever it finds the font module
+    shut down, so a later Game in the same process never uses a dead font.
+    """
+
+    def __init__(self, max_surfaces=512):
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.max_surfaces = max_surfaces
+        self.hits = 0
+        self.misses = 0
+        self.quit_hook_registered = False
+
+    def clear(self):
+        """Drop every cached font and surface"""
+        self.fonts.clear()
+        self.surfaces.clear()
+
+    def _on_pygame_quit(self):
+        # pygame forgets its quit hooks once they have run
+        self.quit_hook_registered = False
+        self.clear()
+
+    def font(self, size):
+        """Default font at a given size, constructed once per pygame.font session"""
+        if not pygame.font.get_init():
+            self.clear()
+            pygame.font.init()
+        if not self.quit_hook_registered:
+            pygame.register_quit(self._on_pygame_quit)
+            self.quit_hook_registered = True
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text, size, color, antialias=True):
+        """Rendered surface for text, reused while it stays in the cache (treat as read-only)"""
+        key = (text, size, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def faded(self, text, size, color, alpha, antialias=True):
+        """Cached copy of render()'s surface with alpha, quantized to ALPHA_STEPS levels"""
+        step = 255 // ALPHA_STEPS
+        alpha = max(0, min(255, alpha)) // step * step
+        key = (text, size, tuple(color), antialias, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        # Never mutate the shared surface; the faded copy gets its own entry
+        self.misses += 1
+        surface = self.render(text, size, color, antialias).copy()
+        surface.set_alpha(alpha)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def blit(self, screen, text, size, color, alpha=255, **anchor):
+        """Blit cached text positioned by a get_rect() anchor (e.g. center=(x, y))
+
+        Returns:
+            The rect the text was drawn to
+        """
+        if alpha < 255:
+            surface = self.faded(text, size, color, alpha)
+        else:
+            surface = self.render(text, size, color)
+        rect = surface.get_rect(**anchor)
+        screen.blit(surface, rect)
+        return rect
+
+    def stats(self):
+        """Cache counters for profiling"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fonts": len(self.fonts),
+            "surfaces": len(self.surfaces),
+        }
+
+
+# Global text cache instance shared by visual_effects and ui
+text_cache = TextCache()
@@ -3,6 +3,69 @@ UI - User interface and HUD
 """
 import pygame
 from config import *
+from text_cache import text_cache
+
+_UNSET = object()
+
+
+class Widget:
+    """Retained UI element that re-renders its surface only when its bound value changes"""
+    
+    def __init__(self, **anchor):
+        self.anchor = anchor
+        self.value = _UNSET
+        self.surface = None
+        self.rect = None
+        self.redraws = 0
+    
+    def build(self, value):
+        """Surface showing value; treated as read-only, so it may be shared
+        
+        Subclasses draw the actual content; the base widget shows nothing.
+        """
+        return pygame.Surface((0, 0))
+    
+    def render(self, screen, value):
+        """Blit the widget, rebuilding its surface first if value changed"""
+        if value != self.value:
+            self.value = value
+            self.surface = self.build(value)
+            self.rect = self.surface.get_rect(**self.anchor)
+            self.redraws += 1
+        screen.blit(self.surface, self.rect)
+
+
+class TextWidget(Widget):
+    """Formatted text label; value may be (value, color) when the color varies"""
+    
+    def __init__(self, size, color, fmt="{}", **anchor):
+        super().__init__(**anchor)
+        self.size = size
+        self.color = color
+        self.fmt = fmt
+    
+    def build(self, value):
+        color = self.color
+        if isinstance(value, tuple):
+            value, color = value
+        return text_cache.render(self.fmt.format(value), self.size, color)
+
+
+class HealthBarWidget(Widget):
+    """Red/green health bar with a white frame"""
+    
+    def __init__(self, width, height, **anchor):
+        super().__init__(**anchor)
+        self.width = width
+        self.height = height
+    
+    def build(self, ratio):
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill(RED)
+        pygame.draw.rect(surface, GREEN, (0, 0, int(self.width * ratio), self.height))
+        pygame.draw.rect(surface, WHITE, (0, 0, self.width, self.height), 2)
+        return surface
+
 
 class UI:
     """Handles all UI rendering"""
@@ -11,29 +74,64 @@ class UI:
         self.width = width
         self.height = height
         
-        # Fonts
-        pygame.font.init()
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 48)
-        self.hud_font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-    
-    def render_menu(self, screen):
-        """Render main menu"""
-        # Title
-        title = self.title_font.render("SKUNKED: WAY OF THE SPRAY", True, WHITE)
-        title_rect = title.get_rect(center=(self.width // 2, 150))
-        screen.blit(title, title_rect)
+        # Font sizes (fonts are shared through text_cache)
+        self.title_size = 72
+        self.menu_size = 48
+        self.hud_size = 36
+        self.small_size = 24
         
-        # Subtitle
-        subtitle = self.menu_font.render("Ninja Skunk - Shadow Strike", True, YELLOW)
-        subtitle_rect = subtitle.get_rect(center=(self.width // 2, 230))
-        screen.blit(subtitle, subtitle_rect)
+        # HUD widgets - re-rendered only when health, lives, score or combo change
+        self.health_label = TextWidget(self.hud_size, WHITE, topleft=(20, 20))
+        self.health_bar = HealthBarWidget(200, 30, topleft=(140, 25))
+        self.lives_text = TextWidget(self.hud_size, WHITE, "Lives: {}", topleft=(20, 70))
+        self.score_text = TextWidget(self.hud_size, YELLOW, "Score: {}", topright=(self.width - 20, 20))
+        self.combo_text = TextWidget(self.menu_size, YELLOW, "{}x COMBO!", center=(self.width // 2, 60))
+        self.final_score_text = TextWidget(self.menu_size, YELLOW, "Final Score: {}",
+                                           center=(self.width // 2, self.height // 2 + 50))
         
-        # Character info
-        char_info = self.small_font.render("Fast & Agile Ninja Fighter", True, WHITE)
-        char_rect = char_info.get_rect(center=(self.width // 2, 270))
-        screen.blit(char_info, char_rect)
+        # Static screens are rendered once, the first time they are shown
+        self.pause_overlay = pygame.Surface((self.width, self.height))
+        self.pause_overlay.set_alpha(128)
+        self.pause_overlay.fill(BLACK)
+        self.panels = {}
+        self.panel_builders = {
+            "menu": self.build_menu_panel,
+            "pause": lambda: self.build_panel([
+                ("PAUSED", self.title_size, WHITE, {"center": (self.width // 2, self.height // 2)}),
+                ("Press ESC to Resume", self.menu_size, WHITE, {"center": (self.width // 2, self.height // 2 + 80)}),
+            ]),
+            "game_over": lambda: self.build_panel([
+                ("GAME OVER", self.title_size, RED, {"center": (self.width // 2, self.height // 2 - 50)}),
+                ("Press ENTER to Restart", self.small_size, WHITE, {"center": (self.width // 2, self.height // 2 + 120)}),
+            ]),
+        }
+    
+    def panel(self, name):
+        """Pre-rendered static screen, built on first use"""
+        panel = self.panels.get(name)
+        if panel is None:
+            panel = self.panel_builders[name]()
+            self.panels[name] = panel
+        return panel
+    
+    def build_panel(self, lines):
+        """Pre-render (text, size, color, anchor) lines onto one transparent full-screen surface"""
+        panel = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        for text, size, color, anchor in lines:
+            surface = text_cache.render(text, size, color)
+            panel.blit(surface, surface.get_rect(**anchor))
+        return panel
+    
+    def build_menu_panel(self):
+        """Pre-render the title, subtitle and instructions of the main menu"""
+        lines = [
+            # Title
+            ("SKUNKED: WAY OF THE SPRAY", self.title_size, WHITE, {"center": (self.width // 2, 150)}),
+            # Subtitle
+            ("Ninja Skunk - Shadow Strike", self.menu_size, YELLOW, {"center": (self.width // 2, 230)}),
+            # Character info
+            ("Fast & Agile Ninja Fighter", self.small_size, WHITE, {"center": (self.width // 2, 270)}),
+        ]
         
         # Instructions
         instructions = [
@@ -49,71 +147,51 @@ class UI:
         
         y_offset = 320
         for line in instructions:
-            text = self.small_font.render(line, True, WHITE)
-            text_rect = text.get_rect(center=(self.width // 2, y_offset))
-            screen.blit(text, text_rect)
+            lines.append((line, self.small_size, WHITE, {"center": (self.width // 2, y_offset)}))
             y_offset += 35
+        return self.build_panel(lines)
+    
+    def render_menu(self, screen):
+        """Render main menu"""
+        screen.blit(self.panel("menu"), (0, 0))
     
     def render_hud(self, screen, health, lives, score, player=None):
         """Render HUD during gameplay"""
         # Health bar scaled to player's real max health
-        health_text = self.hud_font.render("Health:", True, WHITE)
-        screen.blit(health_text, (20, 20))
-
+        self.health_label.render(screen, "Health:")
+        
         max_health = player.max_health if player and hasattr(player, "max_health") else 100
         clamped_health = max(0, min(health, max_health))
         health_ratio = clamped_health / max_health if max_health else 0
-
-        pygame.draw.rect(screen, RED, (140, 25, 200, 30))
-        pygame.draw.rect(screen, GREEN, (140, 25, int(200 * health_ratio), 30))
-        pygame.draw.rect(screen, WHITE, (140, 25, 200, 30), 2)
+        self.health_bar.render(screen, health_ratio)
         
         # Lives
-        lives_text = self.hud_font.render(f"Lives: {lives}", True, WHITE)
-        screen.blit(lives_text, (20, 70))
+        self.lives_text.render(screen, lives)
         
         # Score
-        score_text = self.hud_font.render(f"Score: {score}", True, YELLOW)
-        score_rect = score_text.get_rect(topright=(self.width - 20, 20))
-        screen.blit(score_text, score_rect)
+        self.score_text.render(screen, score)
         
         # Combo counter
         if player and player.combo_count > 1:
             combo_color = YELLOW if player.combo_count == 2 else RED
-            combo_text = self.menu_font.render(f"{player.combo_count}x COMBO!", True, combo_color)
-            combo_rect = combo_text.get_rect(center=(self.width // 2, 60))
-            screen.blit(combo_text, combo_rect)
+            self.combo_text.render(screen, (player.combo_count, combo_color))
     
     def render_pause(self, screen):
         """Render pause overlay"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
-        
-        # Pause text
-        pause_text = self.title_font.render("PAUSED", True, WHITE)
-        pause_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
-        screen.blit(pause_text, pause_rect)
-        
-        resume_text = self.menu_font.render("Press ESC to Resume", True, WHITE)
-        resume_rect = resume_text.get_rect(center=(self.width // 2, self.height // 2 + 80))
-        screen.blit(resume_text, resume_rect)
+        # Semi-transparent overlay, then the pre-rendered pause text
+        screen.blit(self.pause_overlay, (0, 0))
+        screen.blit(self.panel("pause"), (0, 0))
     
     def render_game_over(self, screen, score):
         """Render game over screen"""
-        # Title
-        game_over_text = self.title_font.render("GAME OVER", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
-        screen.blit(game_over_text, game_over_rect)
+        # Title and restart prompt
+        screen.blit(self.panel("game_over"), (0, 0))
         
         # Final score
-        score_text = self.menu_font.render(f"Final Score: {score}", True, YELLOW)
-        score_rect = score_text.get_rect(center=(self.width // 2, self.height // 2 + 50))
-        screen.blit(score_text, score_rect)
-        
-        # Restart prompt
-        restart_text = self.small_font.render("Press ENTER to Restart", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 120))
-        screen.blit(restart_text, restart_rect)
+        self.final_score_text.render(screen, score)
+    
+    def widget_redraws(self):
+        """Total number of widget surface rebuilds, for profiling"""
+        return sum(widget.redraws for widget in (
+            self.health_label, self.health_bar, self.lives_text,
+            self.score_text, self.combo_text, self.final_score_text))
@@ -0,0 +1,50 @@
+"""
+Viewport - camera-frustum culling for render lists
+"""
+from config import *
+
+class Viewport:
+    """Horizontal view interval (camera plus a margin) and per-frame draw counters
+    
+    begin_frame() is called once per rendered frame with the camera position;
+    render code then asks is_visible() / cull() and the drawn vs culled counts
+    per category are available from stats() until the next begin_frame().
+    """
+    
+    def __init__(self, width, height, margin=VIEWPORT_MARGIN):
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.camera_x = 0
+        self.left = -margin
+        self.right = width + margin
+        self.drawn = {}
+        self.culled = {}
+    
+    def begin_frame(self, camera_x):
+        """Move the view to camera_x and zero the per-frame counters"""
+        self.camera_x = camera_x
+        self.left = camera_x - self.margin
+        self.right = camera_x + self.width + self.margin
+        self.drawn.clear()
+        self.culled.clear()
+    
+    def is_visible(self, left, right):
+        """True if the world x-interval [left, right) overlaps the view"""
+        return right > self.left and left < self.right
+    
+    def record(self, category, drawn, total):
+        """Add drawn and culled counts for a category"""
+        self.drawn[category] = self.drawn.get(category, 0) + drawn
+        self.culled[category] = self.culled.get(category, 0) + total - drawn
+    
+    def cull(self, category, items, extent):
+        """Items whose extent(item) -> (left, right) overlaps the view, in order"""
+        visible = [item for item in items if self.is_visible(*extent(item))]
+        self.record(category, len(visible), len(items))
+        return visible
+    
+    def stats(self):
+        """Drawn and culled counts per category for the current frame"""
+        return {category: (self.drawn[category], self.culled.get(category, 0))
+                for category in self.drawn}
@@ -1,18 +1,24 @@
 """
 Visual effects for combat - damage numbers, hit sparks, etc.
 """
+import numpy as np
 import pygame
 from config import *
+from text_cache import text_cache
 
 class DamageNumber:
     """Floating damage number that appears on hit"""
     
     def __init__(self, x, y, damage, is_critical=False):
+        self.lifetime = 0.8  # Seconds to display
+        self.reset(x, y, damage, is_critical)
+    
+    def reset(self, x, y, damage, is_critical=False):
+        """Start over as a new number (for pooling)"""
         self.x = x
         self.y = y
         self.damage = damage
         self.is_critical = is_critical
-        self.lifetime = 0.8  # Seconds to display
         self.timer = 0
         self.velocity_y = -100  # Float upward
         
@@ -51,74 +57,108 @@ class DamageNumber:
             color = (255, 255, 255)  # White for normal hits
             size = 18
         
-        # Render bold text with outline for pop
-        pop_font = pygame.font.Font(None, size + 8)
-        outline_font = pygame.font.Font(None, size + 12)
+        # Render bold text with outline for pop (cached glyph surfaces, alpha at blit)
         text_str = str(self.damage)
-        # Black outline
-        outline = outline_font.render(text_str, True, (0, 0, 0))
-        outline.set_alpha(alpha)
-        # Main colored text
-        text = pop_font.render(text_str, True, color)
-        text.set_alpha(alpha)
-
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y)
 
-        text_rect = text.get_rect(center=(screen_x, screen_y))
-        outline_rect = outline.get_rect(center=(screen_x, screen_y))
         # Draw outline first, then main text
-        screen.blit(outline, outline_rect)
-        screen.blit(text, text_rect)
+        text_cache.blit(screen, text_str, size + 12, (0, 0, 0), alpha, center=(screen_x, screen_y))
+        text_cache.blit(screen, text_str, size + 8, color, alpha, center=(screen_x, screen_y))
 
 
-class HitSpark:
-    """Small particle effect on hit"""
+class ParticleSystem:
+    """Fixed-capacity pool of hit-spark particles kept in NumPy arrays
     
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.lifetime = 0.2
-        self.timer = 0
-        self.particles = []
+    Live particles occupy the first `count` slots. Integration, friction and
+    expiry are vectorized over that prefix, and drawing is one Surface.blits
+    call with a pre-rendered circle stamp per particle size.
+    """
+    
+    def __init__(self, capacity=PARTICLE_CAPACITY, lifetime=0.2, seed=None):
+        self.capacity = capacity
+        self.lifetime = lifetime
+        self.count = 0
+        self.dropped = 0  # Particles not emitted because the pool was full
+        self.rng = np.random.default_rng(seed)
+        
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.size = np.zeros(capacity, dtype=np.int64)
+        self.age = np.zeros(capacity)
         
-        # Create particles
-        import random
-        for _ in range(8):
-            angle = random.uniform(0, 2 * 3.14159)
-            speed = random.uniform(100, 200)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': speed * pygame.math.Vector2(1, 0).rotate_rad(angle).x,
-                'vy': speed * pygame.math.Vector2(1, 0).rotate_rad(angle).y,
-                'size': random.randint(2, 4)
-            })
+        # Orange/yellow circles, one stamp per radius
+        self.color = (255, 200, 100)
+        self.stamps = {}
+        for radius in range(2, 5):
+            stamp = pygame.Surface((radius * 2, radius * 2))
+            stamp.fill(BLACK)
+            pygame.draw.circle(stamp, self.color, (radius, radius), radius)
+            stamp.set_colorkey(BLACK, pygame.RLEACCEL)
+            self.stamps[radius] = stamp
     
-    def update(self, dt):
-        """Update particles"""
-        self.timer += dt
-        for p in self.particles:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vx'] *= 0.95  # Friction
-            p['vy'] *= 0.95
+    def __len__(self):
+        return self.count
     
-    def is_alive(self):
-        """Check if should still be displayed"""
-        return self.timer < self.lifetime
+    def emit_burst(self, x, y, count=8):
+        """Spray `count` particles from (x, y) in random directions"""
+        n = min(count, self.capacity - self.count)
+        self.dropped += count - n
+        if n <= 0:
+            return
+        start, end = self.count, self.count + n
+        angle = self.rng.uniform(0, 2 * np.pi, n)
+        speed = self.rng.uniform(100, 200, n)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = speed * np.cos(angle)
+        self.vy[start:end] = speed * np.sin(angle)
+        self.size[start:end] = self.rng.integers(2, 5, n)
+        self.age[start:end] = 0
+        self.count = end
     
-    def render(self, screen, camera_x):
-        """Render particles"""
-        if not self.is_alive():
+    def update(self, dt):
+        """Age, move and slow every live particle, then drop expired ones"""
+        n = self.count
+        if n == 0:
             return
-            
-        alpha = int(255 * (1 - self.timer / self.lifetime))
+        friction = 0.95 ** (dt * 60)  # 0.95 per 60 Hz frame, independent of step rate
+        self.age[:n] += dt
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.vx[:n] *= friction
+        self.vy[:n] *= friction
         
-        for p in self.particles:
-            screen_x = int(p['x'] - camera_x)
-            screen_y = int(p['y'])
-            
-            # Draw particle as small circle
-            color = (255, 200, 100, alpha)  # Orange/yellow
-            pygame.draw.circle(screen, color[:3], (screen_x, screen_y), p['size'])
+        alive = self.age[:n] < self.lifetime
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            # Stable compaction of the survivors to the front of the arrays
+            for column in (self.x, self.y, self.vx, self.vy, self.size, self.age):
+                column[:live] = column[:n][alive]
+            self.count = live
+    
+    def clear(self):
+        """Drop every particle"""
+        self.count = 0
+    
+    def render(self, screen, camera_x, viewport=None):
+        """Draw all live particles in one batched blit"""
+        n = self.count
+        if n == 0:
+            return
+        x = self.x[:n]
+        size = self.size[:n]
+        if viewport is None:
+            index = slice(0, n)
+        else:
+            index = np.flatnonzero((x + size > viewport.left) & (x - size < viewport.right))
+            viewport.record("particles", len(index), n)
+            if len(index) == 0:
+                return
+        stamps = self.stamps
+        sizes = size[index].tolist()
+        left = ((x[index] - camera_x).astype(np.int64) - size[index]).tolist()
+        top = (self.y[:n][index].astype(np.int64) - size[index]).tolist()
+        screen.blits([(stamps[r], (sx, sy)) for r, sx, sy in zip(sizes, left, top)], doreturn=False)
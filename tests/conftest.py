@@ -0,0 +1,7 @@
+"""
+Shared pytest setup - puts the asset tooling at the repository root on sys.path
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,70 @@
+"""
+audio_filters: carrying filter state across process() calls must equal filtering in one go
+"""
+import numpy as np
+import pytest
+from scipy.signal import lfilter, sosfilt
+
+import audio_filters
+
+SAMPLE_RATE = 22050
+
+FILTERS = {
+    "one_pole_lowpass": lambda: audio_filters.one_pole_lowpass(800, SAMPLE_RATE),
+    "one_pole_highpass": lambda: audio_filters.one_pole_highpass(200, SAMPLE_RATE),
+    "dc_blocker": lambda: audio_filters.dc_blocker(),
+    "biquad_lowpass": lambda: audio_filters.biquad_lowpass(1000, SAMPLE_RATE),
+    "biquad_highpass": lambda: audio_filters.biquad_highpass(300, SAMPLE_RATE, q=2.0),
+    "biquad_bandpass": lambda: audio_filters.biquad_bandpass(2000, SAMPLE_RATE, q=4.0),
+    "butterworth_lowpass": lambda: audio_filters.butterworth("lowpass", 3000, SAMPLE_RATE),
+    "butterworth_bandpass": lambda: audio_filters.butterworth("bandpass", (200, 4000), SAMPLE_RATE, order=3),
+}
+
+
+def signal(n=20000, seed=0):
+    return np.random.default_rng(seed).uniform(-1, 1, n)
+
+
+def one_shot(filt, samples):
+    """Reference output straight from scipy, with zero initial state"""
+    if isinstance(filt, audio_filters.SosFilter):
+        return sosfilt(filt.sos, samples)
+    return lfilter(filt.b, filt.a, samples)
+
+
+def in_blocks(filt, samples, sizes):
+    blocks = []
+    start = 0
+    for size in sizes:
+        blocks.append(filt.process(samples[start:start + size]))
+        start += size
+    blocks.append(filt.process(samples[start:]))
+    return np.concatenate(blocks)
+
+
+@pytest.mark.parametrize("name", sorted(FILTERS))
+def test_block_processing_matches_one_shot(name):
+    samples = signal()
+    expected = one_shot(FILTERS[name](), samples)
+    # Uneven blocks, including single samples and an empty block
+    actual = in_blocks(FILTERS[name](), samples, [1, 0, 7, 4096, 1, 333, 10000])
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("name", sorted(FILTERS))
+def test_reset_forgets_past_input(name):
+    filt = FILTERS[name]()
+    filt.process(signal(seed=1))
+    filt.reset()
+    samples = signal(2000, seed=2)
+    np.testing.assert_allclose(filt.process(samples), one_shot(filt, samples), rtol=0, atol=1e-12)
+
+
+def test_one_shot_helpers_match_their_filters():
+    samples = signal()
+    np.testing.assert_array_equal(audio_filters.lowpass(samples, 800, SAMPLE_RATE),
+                                  one_shot(audio_filters.one_pole_lowpass(800, SAMPLE_RATE), samples))
+    np.testing.assert_array_equal(audio_filters.highpass(samples, 200, SAMPLE_RATE),
+                                  one_shot(audio_filters.one_pole_highpass(200, SAMPLE_RATE), samples))
+    np.testing.assert_array_equal(audio_filters.bandpass(samples, 2000, SAMPLE_RATE, 4.0),
+                                  one_shot(audio_filters.biquad_bandpass(2000, SAMPLE_RATE, 4.0), samples))
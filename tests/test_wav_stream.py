@@ -0,0 +1,53 @@
+"""
+wav_stream: chunked writes must produce the same file as one-shot writes
+"""
+import numpy as np
+import pytest
+
+from wav_stream import BLOCK_SAMPLES, write_wav
+
+SAMPLE_RATE = 22050
+
+
+def signal(n, seed=0, dtype=np.float64):
+    # Slightly over full scale so clipping is exercised too
+    return np.random.default_rng(seed).uniform(-1.2, 1.2, n).astype(dtype)
+
+
+def written(path, samples, **kwargs):
+    frames = write_wav(str(path), samples, SAMPLE_RATE, **kwargs)
+    return frames, path.read_bytes()
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_chunked_write_matches_one_shot(tmp_path, dtype):
+    samples = signal(BLOCK_SAMPLES * 2 + 123, dtype=dtype)
+    one_shot = written(tmp_path / "one.wav", samples)
+    # Uneven chunk sizes, including ones that straddle BLOCK_SAMPLES and an empty one
+    bounds = [0, 1, 1000, 1000, BLOCK_SAMPLES + 7, len(samples)]
+    chunks = (samples[a:b] for a, b in zip(bounds, bounds[1:]))
+    assert written(tmp_path / "chunked.wav", chunks) == one_shot
+    assert one_shot[0] == len(samples)
+
+
+def test_stereo_chunks_match_one_shot(tmp_path):
+    samples = signal(2 * 5000, seed=1).reshape(-1, 2)
+    one_shot = written(tmp_path / "one.wav", samples, channels=2)
+    chunked = written(tmp_path / "chunked.wav", [samples[:1234], samples[1234:]], channels=2)
+    assert chunked == one_shot
+    assert one_shot[0] == 5000
+
+
+def test_flat_lists_are_one_signal(tmp_path):
+    samples = signal(500, seed=2)
+    one_shot = written(tmp_path / "array.wav", samples)
+    assert written(tmp_path / "floats.wav", samples.tolist()) == one_shot
+    assert written(tmp_path / "zero_d.wav", [np.float64(x) for x in samples]) == one_shot
+    assert written(tmp_path / "zero_d_arrays.wav", [np.array(x) for x in samples]) == one_shot
+
+
+def test_empty_input_writes_an_empty_file(tmp_path):
+    for name, empty in (("list.wav", []), ("array.wav", np.zeros(0)), ("chunks.wav", iter(()))):
+        frames, data = written(tmp_path / name, empty)
+        assert frames == 0
+        assert len(data) == 44  # Header only
@@ -3,6 +3,11 @@ import numpy as np
 import wave
 import random
 import os
+import sys
+
+# Shared audio helpers live one directory up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import audio_filters
 
 def save_wav(filename, data, sample_rate=44100):
     data = (data * 32767).astype(np.int16)
@@ -18,9 +23,9 @@ def gen_footstep(duration=0.1, sample_rate=44100):
     # Filtered noise for a step sound
     noise = np.random.normal(0, 1, len(t))
     
-    # Low-pass filter approximation (simple moving average for "thud" effect)
-    window_size = 20
-    noise = np.convolve(noise, np.ones(window_size)/window_size, mode='same')
+    # Low-pass for a "thud" (~1 kHz, the -3 dB point of the old 20-sample moving
+    # average; without the average's comb notches it sounds noticeably smoother)
+    noise = audio_filters.biquad_lowpass(1000, sample_rate).process(noise)
     
     # Envelope
     envelope = np.exp(-t * 20) # Fast decay
@@ -120,8 +125,9 @@ def gen_enemy_attack(duration=0.3, sample_rate=44100):
     t = np.linspace(0, duration, int(duration * sample_rate))
     # Whoosh noise
     noise = np.random.normal(0, 1, len(t))
-    # Filter by simple smoothing
-    noise = np.convolve(noise, np.ones(10)/10, mode='same')
+    # Soften the hiss (~2 kHz, the -3 dB point of the old 10-sample moving
+    # average; audibly different too, with no comb notches)
+    noise = audio_filters.biquad_lowpass(2000, sample_rate).process(noise)
     
     # Rise and fall envelope
     envelope = np.hstack([np.linspace(0, 1, int(len(t)*0.5)), np.linspace(1, 0, int(len(t)*0.5))])
@@ -137,7 +143,7 @@ def gen_boss_defeat(duration=2.0, sample_rate=44100):
     t = np.linspace(0, duration, int(duration * sample_rate))
     # Low rumbling explosion
     noise = np.random.normal(0, 1, len(t))
-    noise = np.convolve(noise, np.ones(50)/50, mode='same') # Low pass
+    noise = audio_filters.biquad_lowpass(400, sample_rate).process(noise) # Low pass (was a 50-sample moving average)
     
     # Amplitude modulation for texture
     mod = np.sin(2 * np.pi * 15 * t) * 0.5 + 0.5
@@ -174,14 +180,30 @@ def gen_boss_spawn(duration=1.5, sample_rate=44100):
     
     return audio * 0.5
 
+OUT_DIR = os.path.join("assets", "audio", "sfx")
+
+# Output filename -> generator
+SFX = {
+    "footstep.wav": gen_footstep,
+    "coin_collect.wav": gen_coin,
+    "powerup.wav": gen_powerup,
+    "level_complete.wav": gen_level_complete,
+    "enemy_attack_gen.wav": gen_enemy_attack,
+    "boss_defeat_gen.wav": gen_boss_defeat,
+    "boss_spawn_gen.wav": gen_boss_spawn,
+}
+
+def generate_sfx(filename):
+    os.makedirs(OUT_DIR, exist_ok=True)
+    save_wav(os.path.join(OUT_DIR, filename), SFX[filename]())
+
+# Asset build targets for build_assets.py: name -> (output path from the repo root, generator)
+ASSET_TARGETS = {
+    os.path.splitext(filename)[0]: (os.path.join(OUT_DIR, filename),
+                                    lambda filename=filename: generate_sfx(filename))
+    for filename in SFX
+}
+
 if __name__ == "__main__":
-    out_dir = "assets/audio/sfx"
-    os.makedirs(out_dir, exist_ok=True)
-    
-    save_wav(os.path.join(out_dir, "footstep.wav"), gen_footstep())
-    save_wav(os.path.join(out_dir, "coin_collect.wav"), gen_coin())
-    save_wav(os.path.join(out_dir, "powerup.wav"), gen_powerup())
-    save_wav(os.path.join(out_dir, "level_complete.wav"), gen_level_complete())
-    save_wav(os.path.join(out_dir, "enemy_attack_gen.wav"), gen_enemy_attack())
-    save_wav(os.path.join(out_dir, "boss_defeat_gen.wav"), gen_boss_defeat())
-    save_wav(os.path.join(out_dir, "boss_spawn_gen.wav"), gen_boss_spawn())
+    for filename in SFX:
+        generate_sfx(filename)
@@ -2,29 +2,35 @@
 Generate a ninja-themed metal guitar riff to add to the background music
 Creates slow, atmospheric power chords with Eastern-inspired melodies and distortion
 """
+import os
+import sys
+
 import numpy as np
-import wave
 
-def generate_metal_guitar(duration=30, sample_rate=44100):
-    """Generate a ninja-themed metal guitar riff with atmospheric power chords
+# Shared audio helpers live one directory up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import audio_filters
+from wav_stream import write_wav as stream_wav
+
+def riff_notes(duration=30, sample_rate=44100):
+    """Yield the riff one note at a time, as consecutive, un-normalized sample blocks
     
     Args:
         duration: Length in seconds
         sample_rate: Sample rate in Hz
     
-    Returns:
-        numpy array of audio samples
+    Yields:
+        numpy arrays of audio samples that together span the whole duration
     """
     
-    # Create time array
-    t = np.linspace(0, duration, int(duration * sample_rate))
+    # Sample times match np.linspace(0, duration, num_samples), computed per note
+    num_samples = int(duration * sample_rate)
+    step = duration / (num_samples - 1)
     
     # Ninja metal riff - slower BPM (35.7 instead of 51) with Eastern-inspired melody
     # Each tuple: (base_freq, duration_in_beats)
     # BPM = 35.7, so each beat = 1.681 seconds
     
-    audio = np.zeros_like(t)
-    
     # Define the ninja-themed metal guitar riff - SIMPLIFIED for cohesion
     # Uses sparse, complementary pattern that doesn't compete with main melody
     riff_pattern = [
@@ -49,10 +55,12 @@ def generate_metal_guitar(duration=30, sample_rate=44100):
             start_sample = int(current_time * sample_rate)
             end_sample = int((current_time + note_duration) * sample_rate)
             
-            if end_sample > len(t):
-                end_sample = len(t)
+            if end_sample > num_samples:
+                end_sample = num_samples
             
-            note_t = t[start_sample:end_sample]
+            note_t = np.arange(start_sample, end_sample, dtype=np.float64) * step
+            if end_sample == num_samples:
+                note_t[-1] = duration
             
             # Generate the note with distortion
             # Power chord: fundamental + harmonics (Eastern-influenced)
@@ -67,7 +75,7 @@ def generate_metal_guitar(duration=30, sample_rate=44100):
             
             # Apply LIGHT distortion (barely any for cohesion with main track)
             # Soft clipping - very minimal
-            distortion = np.tanh(note_signal * 1.2)  # Very light touch
+            distortion = audio_filters.soft_clip(note_signal, 1.2)  # Very light touch
             
             # Add envelope (slower attack for ninja atmosphere)
             envelope_samples = len(note_t)
@@ -84,12 +92,22 @@ def generate_metal_guitar(duration=30, sample_rate=44100):
                 envelope[decay_start:] = np.linspace(1, 0.15, decay_samples)
             
             # Apply envelope
-            note_with_envelope = distortion * envelope
-            
-            # Add to audio
-            audio[start_sample:end_sample] = note_with_envelope * 0.7
+            yield distortion * envelope * 0.7
             
             current_time += note_duration
+
+
+def generate_metal_guitar(duration=30, sample_rate=44100):
+    """Generate a ninja-themed metal guitar riff with atmospheric power chords
+    
+    Args:
+        duration: Length in seconds
+        sample_rate: Sample rate in Hz
+    
+    Returns:
+        numpy array of audio samples
+    """
+    audio = np.concatenate(list(riff_notes(duration, sample_rate)))
     
     # Normalize to prevent clipping
     max_val = np.max(np.abs(audio))
@@ -99,40 +117,51 @@ def generate_metal_guitar(duration=30, sample_rate=44100):
     return audio.astype(np.float32)
 
 
+def stream_metal_guitar(duration=30, sample_rate=44100):
+    """Yield generate_metal_guitar's samples note by note, in constant memory
+    
+    The riff is rendered twice: once to find the peak, then again to yield the
+    normalized notes.
+    """
+    max_val = max(np.max(np.abs(note)) for note in riff_notes(duration, sample_rate) if len(note))
+    for note in riff_notes(duration, sample_rate):
+        if max_val > 0:
+            note = note / max_val * 0.8  # Leave some headroom
+        yield note.astype(np.float32)
+
+
 def save_wav(audio, filename, sample_rate=44100):
-    """Save audio array as WAV file
+    """Save audio as WAV file
     
     Args:
-        audio: numpy array of audio samples (-1.0 to 1.0)
+        audio: numpy array of audio samples (-1.0 to 1.0), or an iterable of such blocks
         filename: Output filename
         sample_rate: Sample rate in Hz
     """
-    
-    # Convert float samples to int16
-    audio_int = np.int16(audio * 32767)
-    
-    with wave.open(filename, 'w') as wav_file:
-        # Set parameters: 1 channel (mono), 2 bytes per sample, sample rate
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        
-        # Write audio data
-        wav_file.writeframes(audio_int.tobytes())
+    stream_wav(filename, audio, sample_rate)
+
+
+OUTPUT_PATH = "assets/audio/sfx/metal_pad.wav"
+
+
+def generate_metal_pad():
+    """Render the 30 second riff and save it as an SFX file that can be layered with music"""
+    print("Generating ninja metal guitar riff (30 seconds)...")
+    save_wav(stream_metal_guitar(duration=30, sample_rate=44100), OUTPUT_PATH, sample_rate=44100)
+    print(f"✅ Saved: {OUTPUT_PATH}")
+
+
+# Asset build targets for build_assets.py: name -> (output path from the repo root, generator)
+ASSET_TARGETS = {
+    "metal_pad": (OUTPUT_PATH, generate_metal_pad),
+}
 
 
 def main():
     print("🥷 Generating ninja-themed metal guitar riff...")
     print("=" * 60)
     
-    # Generate metal guitar
-    print("Generating ninja metal guitar riff (30 seconds)...")
-    guitar_audio = generate_metal_guitar(duration=30, sample_rate=44100)
-    
-    # Save as SFX file that can be layered with music
-    output_path = "assets/audio/sfx/metal_pad.wav"
-    save_wav(guitar_audio, output_path, sample_rate=44100)
-    print(f"✅ Saved: {output_path}")
+    generate_metal_pad()
     
     print("\n" + "=" * 60)
     print("✨ Ninja metal guitar generated!")
@@ -151,7 +180,7 @@ You'll hear it when you start gameplay.
 
 To customize:
 - Adjust 'riff_pattern' for different chord progressions
-- Change distortion amount (multiply factor before tanh)
+- Change distortion amount (soft_clip drive)
 - Modify BPM by changing beat_duration (0.631 for 95 BPM)
 - Add more Eastern scales for atmosphere
 """)
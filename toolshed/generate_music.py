@@ -1,12 +1,14 @@
 """
 Generate placeholder background music using simple synthesis
 """
-import pygame
 import numpy as np
 import os
+import sys
 from scipy.io import wavfile
 
-pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+# Shared audio helpers live one directory up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import audio_filters
 
 def generate_note(frequency, duration, sample_rate=22050, volume=0.15, distortion=False):
     """Generate a musical note with harmonics and optional distortion for metal sound"""
@@ -24,7 +26,7 @@ def generate_note(frequency, duration, sample_rate=22050, volume=0.15, distortio
     
     # Add heavy distortion/overdrive for crushing metal guitar tone
     if distortion:
-        wave = np.tanh(wave * 5.0) * 0.75  # Hard clipping distortion for maximum aggression
+        wave = audio_filters.soft_clip(wave, 5.0) * 0.75  # tanh soft-clip overdrive: heavy drive for aggression, rounded knee instead of a hard edge
         # Add sub-harmonics for thickness
         wave += np.sin(frequency * 0.5 * 2 * np.pi * t) * (volume * 0.15)
     
@@ -250,41 +252,46 @@ def save_music_as_ogg(wave, sample_rate, filename):
     print(f"  Note: For OGG format, you can use ffmpeg to convert:")
     print(f"  ffmpeg -i {filepath} {filepath.replace('.wav', '.ogg')}")
 
+# Output filename -> (bpm, description); every track is 60 seconds of the same arrangement
+TRACKS = {
+    # Gameplay music - heavy and groovy with crushing metal elements (Default)
+    'gameplay.ogg': (120, "gameplay music (120 BPM heavy metal style)"),
+    # Forest theme - slightly slower, more organic feel
+    'forest_theme.ogg': (110, "forest theme (110 BPM melodic metal)"),
+    # City theme - faster, more aggressive
+    'city_theme.ogg': (135, "city theme (135 BPM thrash metal)"),
+    # Cave ambient - slow and atmospheric
+    'cave_ambient.ogg': (90, "cave ambient (90 BPM atmospheric)"),
+    # Action theme - high energy
+    'action_theme.ogg': (145, "action theme (145 BPM speed metal)"),
+    # Boss theme - intense and heavy
+    'boss_theme.ogg': (130, "boss theme (130 BPM heavy groove)"),
+}
+
+def generate_track(filename):
+    """Render and save one entry of TRACKS"""
+    bpm, description = TRACKS[filename]
+    print(f"Creating {description}...")
+    wave, sr = create_gameplay_music(duration=60, bpm=bpm)
+    save_music_as_ogg(wave, sr, filename)
+
+# Asset build targets for build_assets.py: name -> (output path from the repo root, generator)
+ASSET_TARGETS = {
+    os.path.splitext(filename)[0]: (os.path.join('assets', 'audio', 'music', filename.replace('.ogg', '.wav')),
+                                    lambda filename=filename: generate_track(filename))
+    for filename in TRACKS
+}
+
 def create_all_music():
     """Generate all music tracks"""
     print("🎵 Generating varied background music tracks...\n")
     
-    # 1. Gameplay music - heavy and groovy with crushing metal elements (Default)
-    print("1. Creating gameplay music (120 BPM heavy metal style)...")
-    gameplay, sr = create_gameplay_music(duration=60, bpm=120)
-    save_music_as_ogg(gameplay, sr, 'gameplay.ogg')
-    
-    # 2. Forest theme - slightly slower, more organic feel
-    print("\n2. Creating forest theme (110 BPM melodic metal)...")
-    forest, sr = create_gameplay_music(duration=60, bpm=110)
-    save_music_as_ogg(forest, sr, 'forest_theme.ogg')
-    
-    # 3. City theme - faster, more aggressive
-    print("\n3. Creating city theme (135 BPM thrash metal)...")
-    city, sr = create_gameplay_music(duration=60, bpm=135)
-    save_music_as_ogg(city, sr, 'city_theme.ogg')
-    
-    # 4. Cave ambient - slow and atmospheric
-    print("\n4. Creating cave ambient (90 BPM atmospheric)...")
-    cave, sr = create_gameplay_music(duration=60, bpm=90)
-    save_music_as_ogg(cave, sr, 'cave_ambient.ogg')
-    
-    # 5. Action theme - high energy
-    print("\n5. Creating action theme (145 BPM speed metal)...")
-    action, sr = create_gameplay_music(duration=60, bpm=145)
-    save_music_as_ogg(action, sr, 'action_theme.ogg')
-    
-    # 6. Boss theme - intense and heavy
-    print("\n6. Creating boss theme (130 BPM heavy groove)...")
-    boss, sr = create_gameplay_music(duration=60, bpm=130)
-    save_music_as_ogg(boss, sr, 'boss_theme.ogg')
+    for i, filename in enumerate(TRACKS, 1):
+        print(f"{i}. ", end="")
+        generate_track(filename)
+        print()
     
-    print("\n✅ All music tracks generated successfully!")
+    print("✅ All music tracks generated successfully!")
     print(f"📁 Saved to: assets/audio/music/")
     print("\n💡 Tip: These are placeholder tracks. For better quality:")
     print("   1. Use a DAW (FL Studio, Ableton, LMMS)")
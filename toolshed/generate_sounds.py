@@ -1,14 +1,10 @@
 """
 Generate Placeholder Sound Effects
-Creates simple procedural sounds for the game using pygame's mixer
+Creates simple procedural sounds for the game
 """
-import pygame
 import numpy as np
 import os
 
-# Initialize pygame mixer
-pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=512)
-
 def generate_tone(frequency, duration, sample_rate=22050, volume=0.3):
     """Generate a simple sine wave tone"""
     num_samples = int(duration * sample_rate)
@@ -72,202 +68,133 @@ def save_sound(wave, filename, sample_rate=22050):
     # Create stereo from mono
     stereo_wave = np.column_stack((wave, wave))
     
-    # Create pygame Sound and save
-    sound = pygame.sndarray.make_sound(stereo_wave)
-    
     filepath = os.path.join('assets', 'audio', 'sfx', filename)
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     
-    # Save using pygame
-    pygame.mixer.Sound.play(sound)  # Brief play to initialize
-    pygame.time.wait(10)
-    
     # Use numpy to save as WAV
     from scipy.io import wavfile
     wavfile.write(filepath, sample_rate, stereo_wave)
     
     print(f"✓ Generated: {filename}")
 
-def create_all_sounds():
-    """Generate all game sound effects"""
-    
-    print("🔊 Generating placeholder sound effects...\n")
-    
+def shadow_strike():
+    """Whoosh sound (noise with sweep)"""
+    return generate_noise(0.25, volume=0.15) + generate_sweep(600, 200, 0.25, volume=0.2)
+
+def skunk_spray():
+    """Hissing spray sound"""
+    return generate_noise(0.3, volume=0.18) + generate_sweep(800, 400, 0.3, volume=0.12)
+
+def warning_alert():
+    """Urgent beeping"""
+    warning_silence = np.zeros(int(0.05 * 22050), dtype=np.int16)
+    return np.concatenate([generate_tone(880, 0.1, volume=0.25), warning_silence,
+                           generate_tone(880, 0.1, volume=0.25)])
+
+def tone_sequence(*notes):
+    """Concatenate (frequency, duration, volume) tones"""
+    return np.concatenate([generate_tone(freq, dur, volume=vol) for freq, dur, vol in notes])
+
+def sweep_sequence(*sweeps):
+    """Concatenate (start_freq, end_freq, duration, volume) sweeps"""
+    return np.concatenate([generate_sweep(a, b, dur, volume=vol) for a, b, dur, vol in sweeps])
+
+# Output filename -> builder returning the int16 wave
+SOUNDS = {
     # Jump sound - rising tone
-    jump = generate_sweep(200, 400, 0.15, volume=0.25)
-    save_sound(jump, 'jump.wav')
-    
+    'jump.wav': lambda: generate_sweep(200, 400, 0.15, volume=0.25),
     # Attack sounds - short percussive hits with different pitches
-    attack1 = generate_sweep(300, 150, 0.08, volume=0.3)
-    save_sound(attack1, 'attack1.wav')
-    
-    attack2 = generate_sweep(350, 170, 0.08, volume=0.32)
-    save_sound(attack2, 'attack2.wav')
-    
-    attack3 = generate_sweep(400, 200, 0.1, volume=0.35)
-    save_sound(attack3, 'attack3.wav')
-    
-    # Shadow Strike - whoosh sound (noise with sweep)
-    whoosh_noise = generate_noise(0.25, volume=0.15)
-    whoosh_tone = generate_sweep(600, 200, 0.25, volume=0.2)
-    shadow_strike = whoosh_noise + whoosh_tone
-    save_sound(shadow_strike, 'shadow_strike.wav')
-    
+    'attack1.wav': lambda: generate_sweep(300, 150, 0.08, volume=0.3),
+    'attack2.wav': lambda: generate_sweep(350, 170, 0.08, volume=0.32),
+    'attack3.wav': lambda: generate_sweep(400, 200, 0.1, volume=0.35),
+    'shadow_strike.wav': shadow_strike,
     # Player hit - descending tone
-    player_hit = generate_sweep(400, 200, 0.2, volume=0.25)
-    save_sound(player_hit, 'player_hit.wav')
-    
+    'player_hit.wav': lambda: generate_sweep(400, 200, 0.2, volume=0.25),
     # Land sound - thump
-    land = generate_tone(100, 0.08, volume=0.2)
-    save_sound(land, 'land.wav')
-    
+    'land.wav': lambda: generate_tone(100, 0.08, volume=0.2),
     # Enemy hit - sharp impact
-    enemy_hit = generate_sweep(250, 100, 0.1, volume=0.3)
-    save_sound(enemy_hit, 'enemy_hit.wav')
-    
+    'enemy_hit.wav': lambda: generate_sweep(250, 100, 0.1, volume=0.3),
     # Enemy death - descending sweep
-    enemy_death = generate_sweep(300, 80, 0.3, volume=0.25)
-    save_sound(enemy_death, 'enemy_death.wav')
-    
+    'enemy_death.wav': lambda: generate_sweep(300, 80, 0.3, volume=0.25),
     # Menu select - pleasant beep
-    menu_select = generate_tone(440, 0.08, volume=0.25)
-    save_sound(menu_select, 'menu_select.wav')
-    
+    'menu_select.wav': lambda: generate_tone(440, 0.08, volume=0.25),
     # Menu move - subtle beep
-    menu_move = generate_tone(330, 0.05, volume=0.2)
-    save_sound(menu_move, 'menu_move.wav')
-    
+    'menu_move.wav': lambda: generate_tone(330, 0.05, volume=0.2),
     # Pause - two-tone
-    pause_tone1 = generate_tone(440, 0.08, volume=0.2)
-    pause_tone2 = generate_tone(330, 0.08, volume=0.2)
-    pause = np.concatenate([pause_tone1, pause_tone2])
-    save_sound(pause, 'pause.wav')
-    
+    'pause.wav': lambda: tone_sequence((440, 0.08, 0.2), (330, 0.08, 0.2)),
     # Combo - rising celebratory tone
-    combo = generate_sweep(440, 880, 0.15, volume=0.3)
-    save_sound(combo, 'combo.wav')
-    
+    'combo.wav': lambda: generate_sweep(440, 880, 0.15, volume=0.3),
     # Game over - descending sad tone
-    game_over = generate_sweep(440, 220, 0.5, volume=0.25)
-    save_sound(game_over, 'game_over.wav')
-    
+    'game_over.wav': lambda: generate_sweep(440, 220, 0.5, volume=0.25),
     # Boss spawn - ominous rising tone
-    boss_spawn = generate_sweep(100, 300, 0.8, volume=0.4)
-    save_sound(boss_spawn, 'boss_spawn.wav')
-    
+    'boss_spawn.wav': lambda: generate_sweep(100, 300, 0.8, volume=0.4),
     # Boss defeat - triumphant rising chord
-    boss_defeat1 = generate_tone(440, 0.2, volume=0.3)
-    boss_defeat2 = generate_tone(550, 0.2, volume=0.3)
-    boss_defeat3 = generate_tone(660, 0.2, volume=0.3)
-    boss_defeat = np.concatenate([boss_defeat1, boss_defeat2, boss_defeat3])
-    save_sound(boss_defeat, 'boss_defeat.wav')
-    
+    'boss_defeat.wav': lambda: tone_sequence((440, 0.2, 0.3), (550, 0.2, 0.3), (660, 0.2, 0.3)),
     # Boss attack - heavy impact
-    boss_attack = generate_sweep(150, 80, 0.15, volume=0.4)
-    save_sound(boss_attack, 'boss_attack.wav')
-    
+    'boss_attack.wav': lambda: generate_sweep(150, 80, 0.15, volume=0.4),
     # Boss hurt - deep rumble
-    boss_hurt = generate_tone(80, 0.25, volume=0.35)
-    save_sound(boss_hurt, 'boss_hurt.wav')
-    
-    # Level complete - celebratory fanfare
-    level_complete1 = generate_tone(523, 0.1, volume=0.3)  # C
-    level_complete2 = generate_tone(659, 0.1, volume=0.3)  # E
-    level_complete3 = generate_tone(784, 0.1, volume=0.3)  # G
-    level_complete = np.concatenate([level_complete1, level_complete2, level_complete3])
-    save_sound(level_complete, 'level_complete.wav')
-    
+    'boss_hurt.wav': lambda: generate_tone(80, 0.25, volume=0.35),
+    # Level complete - celebratory fanfare (C, E, G)
+    'level_complete.wav': lambda: tone_sequence((523, 0.1, 0.3), (659, 0.1, 0.3), (784, 0.1, 0.3)),
     # Powerup - magical rising tone
-    powerup = generate_sweep(300, 600, 0.3, volume=0.25)
-    save_sound(powerup, 'powerup.wav')
-    
+    'powerup.wav': lambda: generate_sweep(300, 600, 0.3, volume=0.25),
     # Coin collect - pleasant chime
-    coin_collect = generate_tone(800, 0.08, volume=0.2)
-    save_sound(coin_collect, 'coin_collect.wav')
-    
+    'coin_collect.wav': lambda: generate_tone(800, 0.08, volume=0.2),
     # Footstep - subtle tap
-    footstep = generate_tone(200, 0.04, volume=0.15)
-    save_sound(footstep, 'footstep.wav')
-    
-    print("\n🎮 Generating additional gameplay sounds...")
-    
-    # Skunk spray/shot - hissing spray sound
-    spray_noise = generate_noise(0.3, volume=0.18)
-    spray_sweep = generate_sweep(800, 400, 0.3, volume=0.12)
-    skunk_spray = spray_noise + spray_sweep
-    save_sound(skunk_spray, 'skunk_spray.wav')
-    
+    'footstep.wav': lambda: generate_tone(200, 0.04, volume=0.15),
+
+    # Additional gameplay sounds
+    'skunk_spray.wav': skunk_spray,
     # Dash - quick whoosh
-    dash = generate_sweep(500, 250, 0.15, volume=0.22)
-    save_sound(dash, 'dash.wav')
-    
+    'dash.wav': lambda: generate_sweep(500, 250, 0.15, volume=0.22),
     # Double jump - higher pitched jump
-    double_jump = generate_sweep(350, 600, 0.12, volume=0.23)
-    save_sound(double_jump, 'double_jump.wav')
-    
+    'double_jump.wav': lambda: generate_sweep(350, 600, 0.12, volume=0.23),
     # Shield block - metallic clang
-    block_tone1 = generate_tone(1200, 0.05, volume=0.28)
-    block_tone2 = generate_tone(900, 0.05, volume=0.25)
-    shield_block = np.concatenate([block_tone1, block_tone2])
-    save_sound(shield_block, 'shield_block.wav')
-    
-    # Health restore - pleasant healing chime
-    heal_tone1 = generate_tone(523, 0.08, volume=0.25)  # C
-    heal_tone2 = generate_tone(659, 0.08, volume=0.25)  # E
-    heal_tone3 = generate_tone(784, 0.12, volume=0.25)  # G
-    health_restore = np.concatenate([heal_tone1, heal_tone2, heal_tone3])
-    save_sound(health_restore, 'health_restore.wav')
-    
-    # Achievement unlock - triumphant fanfare
-    achievement1 = generate_tone(440, 0.08, volume=0.28)  # A
-    achievement2 = generate_tone(554, 0.08, volume=0.28)  # C#
-    achievement3 = generate_tone(659, 0.08, volume=0.28)  # E
-    achievement4 = generate_tone(880, 0.15, volume=0.30)  # A (octave)
-    achievement = np.concatenate([achievement1, achievement2, achievement3, achievement4])
-    save_sound(achievement, 'achievement_unlock.wav')
-    
+    'shield_block.wav': lambda: tone_sequence((1200, 0.05, 0.28), (900, 0.05, 0.25)),
+    # Health restore - pleasant healing chime (C, E, G)
+    'health_restore.wav': lambda: tone_sequence((523, 0.08, 0.25), (659, 0.08, 0.25), (784, 0.12, 0.25)),
+    # Achievement unlock - triumphant fanfare (A, C#, E, A)
+    'achievement_unlock.wav': lambda: tone_sequence((440, 0.08, 0.28), (554, 0.08, 0.28),
+                                                    (659, 0.08, 0.28), (880, 0.15, 0.30)),
     # Combo break - descending disappointed notes
-    combo_break1 = generate_tone(440, 0.08, volume=0.22)
-    combo_break2 = generate_tone(330, 0.12, volume=0.20)
-    combo_break = np.concatenate([combo_break1, combo_break2])
-    save_sound(combo_break, 'combo_break.wav')
-    
+    'combo_break.wav': lambda: tone_sequence((440, 0.08, 0.22), (330, 0.12, 0.20)),
     # Enemy spawn - aggressive growl
-    enemy_spawn = generate_sweep(150, 250, 0.2, volume=0.25)
-    save_sound(enemy_spawn, 'enemy_spawn.wav')
-    
+    'enemy_spawn.wav': lambda: generate_sweep(150, 250, 0.2, volume=0.25),
     # Teleport - sci-fi warble
-    teleport_up = generate_sweep(300, 800, 0.15, volume=0.20)
-    teleport_down = generate_sweep(800, 300, 0.15, volume=0.18)
-    teleport = np.concatenate([teleport_up, teleport_down])
-    save_sound(teleport, 'teleport.wav')
-    
+    'teleport.wav': lambda: sweep_sequence((300, 800, 0.15, 0.20), (800, 300, 0.15, 0.18)),
     # Speed boost pickup - energetic fast sweep
-    speed_boost = generate_sweep(400, 1200, 0.2, volume=0.25)
-    save_sound(speed_boost, 'speed_boost.wav')
-    
+    'speed_boost.wav': lambda: generate_sweep(400, 1200, 0.2, volume=0.25),
     # Damage boost pickup - powerful lower tone
-    damage_boost = generate_sweep(200, 600, 0.25, volume=0.28)
-    save_sound(damage_boost, 'damage_boost.wav')
-    
-    # Warning alert - urgent beeping
-    warning_beep1 = generate_tone(880, 0.1, volume=0.25)
-    warning_beep2 = generate_tone(880, 0.1, volume=0.25)
-    warning_silence = np.zeros(int(0.05 * 22050), dtype=np.int16)
-    warning = np.concatenate([warning_beep1, warning_silence, warning_beep2])
-    save_sound(warning, 'warning_alert.wav')
-    
+    'damage_boost.wav': lambda: generate_sweep(200, 600, 0.25, volume=0.28),
+    'warning_alert.wav': warning_alert,
     # Critical hit - powerful impact
-    critical_hit = generate_sweep(600, 200, 0.12, volume=0.35)
-    save_sound(critical_hit, 'critical_hit.wav')
-    
+    'critical_hit.wav': lambda: generate_sweep(600, 200, 0.12, volume=0.35),
     # Wall hit/bounce - thud
-    wall_bounce = generate_tone(120, 0.08, volume=0.22)
-    save_sound(wall_bounce, 'wall_bounce.wav')
+    'wall_bounce.wav': lambda: generate_tone(120, 0.08, volume=0.22),
+}
+
+def generate_sound(filename):
+    """Build and save one entry of SOUNDS"""
+    save_sound(SOUNDS[filename](), filename)
+
+# Asset build targets for build_assets.py: name -> (output path from the repo root, generator)
+ASSET_TARGETS = {
+    os.path.splitext(filename)[0]: (os.path.join('assets', 'audio', 'sfx', filename),
+                                    lambda filename=filename: generate_sound(filename))
+    for filename in SOUNDS
+}
+
+def create_all_sounds():
+    """Generate all game sound effects"""
+    
+    print("🔊 Generating placeholder sound effects...\n")
+    
+    for filename in SOUNDS:
+        generate_sound(filename)
     
     print("\n✅ All sound effects generated successfully!")
     print(f"📁 Saved to: assets/audio/sfx/")
-    print(f"📊 Total: {34} sound effects created")
+    print(f"📊 Total: {len(SOUNDS)} sound effects created")
 
 if __name__ == "__main__":
     try:
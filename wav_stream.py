@@ -0,0 +1,97 @@
+"""
+Streaming 16-bit WAV writer shared by the audio generator scripts.
+
+Samples arrive as float blocks in [-1, 1]: a whole array, or any iterable of
+arrays (e.g. a generator yielding one note or one second at a time). Each block
+is clipped, scaled and truncated to int16 in reused scratch buffers and
+appended to the file, so memory use is bounded by the block size rather than
+the track length.
+"""
+
+import os
+import wave
+
+import numpy as np
+
+# Largest block converted at once; longer arrays are written in slices of this many samples
+BLOCK_SAMPLES = 1 << 16
+
+
+class WavWriter:
+    """16-bit PCM WAV file that float sample blocks are appended to.
+
+    Use as a context manager; stereo blocks are (frames, 2) arrays or
+    interleaved 1-D arrays.
+    """
+
+    def __init__(self, path, sample_rate, channels=1):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.frames = 0
+        self._scratch = None
+        self._pcm = np.empty(BLOCK_SAMPLES, dtype='<i2')
+        self._wav = wave.open(path, 'wb')
+        self._wav.setnchannels(channels)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(sample_rate)
+
+    def write(self, block):
+        """Clip, convert and append one block of float samples."""
+        block = np.asarray(block)
+        if block.dtype.kind != 'f':
+            block = block.astype(np.float64)
+        samples = block.reshape(-1)
+        for offset in range(0, len(samples), BLOCK_SAMPLES):
+            self._write_slice(samples[offset:offset + BLOCK_SAMPLES])
+        self.frames += len(samples) // self.channels
+
+    def _write_slice(self, samples):
+        n = len(samples)
+        # Scratch follows the block's dtype so float32 input is scaled in float32, as
+        # np.int16(audio * 32767) would be
+        if self._scratch is None or self._scratch.dtype != samples.dtype:
+            self._scratch = np.empty(BLOCK_SAMPLES, dtype=samples.dtype)
+        scratch = self._scratch[:n]
+        pcm = self._pcm[:n]
+        np.clip(samples, -1.0, 1.0, out=scratch)
+        scratch *= 32767
+        np.copyto(pcm, scratch, casting='unsafe')  # Truncates toward zero, like int() and astype
+        self._wav.writeframes(pcm)
+
+    def close(self):
+        """Finish the header and close the file."""
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def write_wav(path, chunks, sample_rate, channels=1):
+    """Write samples to a 16-bit WAV file.
+
+    chunks is either the whole signal - an ndarray, or a flat list of samples
+    (floats or 0-d arrays, possibly empty) - or an iterable of ndarray blocks
+    such as a list of arrays or a generator.
+
+    Returns the number of frames written.
+    """
+    if isinstance(chunks, np.ndarray):
+        blocks = (chunks,)
+    elif isinstance(chunks, (list, tuple)) and (not chunks or np.ndim(chunks[0]) == 0):
+        blocks = (np.asarray(chunks, dtype=np.float64),)
+    else:
+        blocks = chunks
+    with WavWriter(path, sample_rate, channels) as writer:
+        for block in blocks:
+            writer.write(block)
+    return writer.frames